@@ -2,16 +2,45 @@
 """
 FastAPI 메인 애플리케이션
 """
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from .routes import chat, auth, folders, conversations
+from .metrics import registry
+from .middleware import RequestIdMiddleware
 from src.database.db import init_db
+from src.utils.logger import get_logger, setup_logging
+
+# 로깅 설정 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT)
+setup_logging()
+logger = get_logger("api")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 시 데이터베이스 초기화 및 컴포넌트 웜업 시작, 종료 시 리소스 정리"""
+    init_db()
+    logger.info("데이터베이스 초기화 완료")
+    
+    # 웜업은 백그라운드로 진행 (/health는 바로 응답, 준비 완료 여부는 /ready)
+    if os.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes"):
+        chat.start_warm_up()
+    
+    yield
+    
+    # HTTP 클라이언트 및 스레드 풀 정리
+    await chat.shutdown_components()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="GDPP AI Docent API",
     description="궁디팡팡 캣페스타 AI 도슨트 API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -21,14 +50,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
 
-# 데이터베이스 초기화
-@app.on_event("startup")
-async def startup_event():
-    """앱 시작 시 데이터베이스 초기화"""
-    init_db()
-    print("[INFO] 데이터베이스 초기화 완료")
+# 요청 ID (X-Request-ID 헤더, 모든 로그에 포함)
+app.add_middleware(RequestIdMiddleware)
 
 # 라우터 등록
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
@@ -61,6 +87,19 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 (컴포넌트 웜업 완료 전에는 503과 단계별 진행 상황)"""
+    snapshot = chat.warmup.snapshot()
+    return JSONResponse(snapshot, status_code=200 if snapshot["ready"] else 503)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 메트릭 (단계별 지연시간, 캐시, LLM 대기열, 토큰 수)"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
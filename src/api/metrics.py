@@ -0,0 +1,313 @@
+# File: src/api/metrics.py
+"""
+API 메트릭 모듈 - LLM 생성 완료/취소 및 토큰 수 집계, Prometheus 텍스트 형식 노출
+(prometheus_client 의존성 없이 카운터/히스토그램/수집 함수만 지원)
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+
+class GenerationMetrics:
+    """LLM 생성 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.cancelled = 0
+        self.tokens_generated = 0
+        self.tokens_saved = 0
+
+    def record_completed(self, tokens: int):
+        """생성 완료 기록"""
+        with self._lock:
+            self.completed += 1
+            self.tokens_generated += tokens
+
+    def record_cancelled(self, tokens: int, max_tokens: int):
+        """
+        클라이언트 연결 종료로 인한 생성 취소 기록
+
+        Args:
+            tokens: 취소 전까지 생성된 토큰 수
+            max_tokens: 요청된 최대 토큰 수 (절약한 토큰 수 추정에 사용, 상한값)
+        """
+        with self._lock:
+            self.cancelled += 1
+            self.tokens_generated += tokens
+            self.tokens_saved += max(0, max_tokens - tokens)
+
+    def stats(self) -> Dict:
+        """통계 반환"""
+        with self._lock:
+            return {
+                "completed": self.completed,
+                "cancelled": self.cancelled,
+                "tokens_generated": self.tokens_generated,
+                "tokens_saved_estimate": self.tokens_saved
+            }
+
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+# 초 단위 지연시간 버킷 (캐시 히트 ~ 긴 생성까지)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if value == float("inf"):
+        return "+Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Metric:
+    """메트릭 기본 클래스 (이름, 설명, 레이블 이름)"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요 (입력: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """단조 증가 카운터"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [("", self._labels(key), value) for key, value in items]
+
+
+class Histogram(Metric):
+    """누적 버킷 히스토그램 (_bucket, _sum, _count)"""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 개수(+Inf 포함), 합계, 개수]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, ([*state[0]], state[1], state[2])) for key, state in self._values.items())
+
+        samples = []
+        for key, (counts, total, count) in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                samples.append(("_bucket", {**labels, "le": le}, cumulative))
+            samples.append(("_sum", labels, total))
+            samples.append(("_count", labels, count))
+        return samples
+
+
+class CallbackMetric(Metric):
+    """
+    수집 시점에 함수를 호출하여 값을 읽는 메트릭
+    이미 자체 통계를 가진 컴포넌트(캐시, 스케줄러 등)를 이중 집계 없이 노출할 때 사용
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        collect: Callable[[], Iterable[Sample]]
+    ):
+        super().__init__(name, documentation)
+        self.type = metric_type
+        self.collect = collect
+
+    def samples(self):
+        return [("", labels, value) for labels, value in self.collect()]
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 형식 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        collect: Callable[[], Iterable[Sample]]
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, metric_type, collect))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # 수집 함수 오류가 전체 스크레이프를 실패시키지 않도록 해당 메트릭만 생략
+                lines.append(f"# {metric.name} 수집 실패: {e}")
+        return "\n".join(lines) + "\n"
+
+
+generation_metrics = GenerationMetrics()
+
+registry = MetricsRegistry()
+
+stage_duration = registry.histogram(
+    "gdpp_stage_duration_seconds",
+    "Latency of each chat pipeline stage",
+    ["endpoint", "stage"]
+)
+
+llm_tokens = registry.counter(
+    "gdpp_llm_tokens_total",
+    "Tokens reported by Ollama (prompt_eval_count / eval_count)",
+    ["kind"]
+)
+
+llm_eval_seconds = registry.counter(
+    "gdpp_llm_eval_duration_seconds_total",
+    "Generation time reported by Ollama (eval_duration)"
+)
+
+llm_tokens_per_second = registry.histogram(
+    "gdpp_llm_tokens_per_second",
+    "Generation speed per request (eval_count / eval_duration)",
+    buckets=(1, 2, 5, 10, 15, 20, 30, 50, 75, 100, 200)
+)
+
+
+def record_stage(endpoint: str, stage: str, seconds: float):
+    """파이프라인 단계 지연시간 기록"""
+    stage_duration.observe(seconds, endpoint=endpoint, stage=stage)
+
+
+def record_llm_stats(stats: Dict):
+    """
+    Ollama 최종 응답의 토큰/시간 통계 기록
+
+    Args:
+        stats: eval_count, eval_duration(ns), prompt_eval_count 를 포함한 딕셔너리 (없는 항목은 무시)
+    """
+    eval_count = stats.get("eval_count")
+    eval_duration = stats.get("eval_duration")
+    if stats.get("prompt_eval_count"):
+        llm_tokens.inc(stats["prompt_eval_count"], kind="prompt")
+    if eval_count:
+        llm_tokens.inc(eval_count, kind="completion")
+    if eval_duration:
+        llm_eval_seconds.inc(eval_duration / 1e9)
+        if eval_count:
+            llm_tokens_per_second.observe(eval_count / (eval_duration / 1e9))
+
+
+def _collect_generation() -> List[Sample]:
+    stats = generation_metrics.stats()
+    return [
+        ({"outcome": "completed"}, stats["completed"]),
+        ({"outcome": "cancelled"}, stats["cancelled"])
+    ]
+
+
+registry.callback(
+    "gdpp_generations_total",
+    "LLM generations by outcome",
+    "counter",
+    _collect_generation
+)
+registry.callback(
+    "gdpp_generation_tokens_saved_total",
+    "Estimated tokens not generated because the client disconnected",
+    "counter",
+    lambda: [({}, generation_metrics.stats()["tokens_saved_estimate"])]
+)
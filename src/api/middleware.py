@@ -0,0 +1,45 @@
+# File: src/api/middleware.py
+"""
+API 미들웨어 - 요청 ID 부여
+(BaseHTTPMiddleware는 스트리밍 응답을 한 번 더 감싸므로 순수 ASGI 미들웨어로 구현)
+"""
+import re
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.utils.logger import new_request_id, request_id_var
+
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# 클라이언트가 보낸 요청 ID는 로그 주입을 막기 위해 안전한 문자만 허용
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+class RequestIdMiddleware:
+    """요청마다 ID를 정해 로그 컨텍스트에 설정하고 응답 헤더로 돌려줌"""
+
+    def __init__(self, app: ASGIApp, header_name: str = REQUEST_ID_HEADER):
+        self.app = app
+        self.header_name = header_name
+        self._header_key = header_name.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = dict(scope["headers"]).get(self._header_key, b"").decode("latin-1")
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else new_request_id()
+
+        async def send_with_request_id(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(self.header_name, request_id)
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -14,6 +14,8 @@ from src.models.user import User
 from src.models.conversation import Conversation
 from src.models.message import Message
 from src.api.routes.auth import get_current_admin_user
+from src.api.routes import chat
+from src.rag.index_registry import is_ready, is_valid_version
 
 
 router = APIRouter()
@@ -44,6 +46,11 @@ class ConversationStats(BaseModel):
         from_attributes = True
 
 
+class IndexReloadRequest(BaseModel):
+    version: Optional[str] = None  # 교체할 인덱스 버전 (None이면 CURRENT)
+    rebuild: bool = False  # True면 청크 데이터로 새 버전을 구축한 뒤 교체
+
+
 class SystemStats(BaseModel):
     total_users: int
     total_conversations: int
@@ -184,3 +191,44 @@ async def get_user_conversations(
         ))
     
     return result
+
+
+@router.get("/index")
+async def get_index_status(
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """검색 인덱스 상태 조회 (관리자 전용)"""
+    return chat.index_status()
+
+
+@router.post("/index/reload", status_code=status.HTTP_202_ACCEPTED)
+async def reload_index(
+    request: IndexReloadRequest,
+    admin_user: User = Depends(get_current_admin_user)
+):
+    """
+    검색 인덱스 무중단 교체 (관리자 전용)
+    새 인덱스를 백그라운드에서 (구축하고) 로드한 뒤 교체하며, 진행 상황은 GET /index로 확인
+    """
+    if request.version is not None and request.rebuild:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="version과 rebuild는 함께 지정할 수 없습니다"
+        )
+    
+    if request.version is not None and not (
+        is_valid_version(request.version) and is_ready(chat.INDEX_ROOT, request.version)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="인덱스 버전을 찾을 수 없습니다"
+        )
+    
+    if chat.index_swap_running():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="인덱스 교체가 이미 진행 중입니다"
+        )
+    
+    chat.start_index_swap(version=request.version, rebuild=request.rebuild)
+    return chat.index_status()
@@ -11,8 +11,10 @@ from typing import Optional
 from src.database.db import get_db
 from src.models.user import User
 from src.auth import hash_password, verify_password, create_access_token, verify_token
+from src.utils.logger import get_logger
 
 router = APIRouter()
+logger = get_logger("auth")
 security = HTTPBearer()
 
 
@@ -77,20 +79,16 @@ async def get_current_user(
 ) -> User:
     """JWT 토큰에서 현재 사용자 가져오기"""
     token = credentials.credentials
-    print(f"[DEBUG] Received token: {token[:20]}...")  # 토큰 앞부분만 출력
-    
     payload = verify_token(token)
-    print(f"[DEBUG] Token payload: {payload}")
     
     if payload is None:
-        print("[DEBUG] Token verification failed")
+        logger.debug("토큰 검증 실패")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials"
         )
     
     user_id_str = payload.get("sub")
-    print(f"[DEBUG] User ID from token (string): {user_id_str}")
     
     if user_id_str is None:
         raise HTTPException(
@@ -108,13 +106,13 @@ async def get_current_user(
     
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        print(f"[DEBUG] User not found in database: {user_id}")
+        logger.debug("토큰의 사용자를 찾을 수 없음: %s", user_id)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
     
-    print(f"[DEBUG] User authenticated: {user.email}")
+    logger.debug("사용자 인증 완료: %s", user.id)
     return user
 
 
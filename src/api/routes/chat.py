@@ -2,72 +2,614 @@
 """
 챗봇 API 라우트
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import AsyncGenerator, AsyncIterator, Dict, Literal, Optional, List
 from sqlalchemy.orm import Session
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+import anyio
+import asyncio
+import contextvars
+import json
+import time
 import sys
 import os
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
-from src.rag.embedder import KoSBERTEmbedder
+from src.rag.embedder import KoSBERTEmbedder, QueryBatcher
 from src.rag.vector_store import VectorStore
+from src.rag.numpy_vector_store import NumpyVectorStore
 from src.rag.hybrid_retriever import HybridRetriever
-from src.model.ollama_client import OllamaClient
+from src.rag.index_registry import (
+    DEFAULT_INDEX_ROOT, list_versions, prune_versions, read_current, resolve_index_dir, set_current, version_dir
+)
+from src.rag.build_vectordb import build_index_version
+from src.rag.answer_cache import SemanticAnswerCache
+from src.model.ollama_client import AsyncOllamaClient
+from src.model.scheduler import LLMScheduler, LLMSlot, SchedulerRejected
 from src.model.prompt_template import create_chat_prompt
 from src.database.db import get_db
 from src.models.conversation import Conversation
 from src.models.message import Message
 from src.models.user import User
 from src.api.routes.auth import get_current_user_optional
+from src.api.metrics import generation_metrics, registry, record_stage, record_llm_stats
+from src.api.warmup import WarmupTracker
+from src.utils.logger import get_logger
 
 
 router = APIRouter()
+logger = get_logger("api.chat")
 
 # 전역 변수로 초기화 (앱 시작 시 한 번만)
 embedder = None
+query_batcher = None
 vector_store = None
 retriever = None
 ollama_client = None
+answer_cache = None
+llm_scheduler = None
 
+# 버전별 인덱스 루트 (CURRENT가 없으면 ./data/vectordb 사용)
+INDEX_ROOT = os.getenv("INDEX_ROOT", DEFAULT_INDEX_ROOT)
+INDEX_KEEP_VERSIONS = int(os.getenv("INDEX_KEEP_VERSIONS", "3"))
+CHUNKS_FILE = "./data/processed/all_chunks.json"
 
-def initialize_components():
-    """컴포넌트 초기화"""
-    global embedder, vector_store, retriever, ollama_client
+# 현재 사용 중인 인덱스 (버전이 None이면 ./data/vectordb)
+active_index = {"version": None, "directory": None, "loaded_at": None}
+
+# CPU 바운드 작업(검색, 모델 로드)을 이벤트 루프 밖에서 실행하는 제한된 스레드 풀
+retrieval_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RETRIEVAL_WORKERS", "4")),
+    thread_name_prefix="retrieval"
+)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """동기 함수를 검색 스레드 풀에서 실행하고 결과를 기다림 (요청 ID 등 컨텍스트 변수 유지)"""
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(retrieval_executor, partial(context.run, func, *args, **kwargs))
+
+
+# 스트리밍 프레임 병합 기준 (이 글자 수 또는 시간이 지나면 프레임 전송)
+STREAM_FLUSH_CHARS = int(os.getenv("STREAM_FLUSH_CHARS", "32"))
+STREAM_FLUSH_MS = float(os.getenv("STREAM_FLUSH_MS", "50"))
+
+
+def sse_event(event_type: str, data=None) -> str:
+    """SSE data 프레임 생성 (JSON)"""
+    event = {"type": event_type}
+    if data is not None:
+        event["data"] = data
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+async def coalesce_tokens(
+    chunks: AsyncIterator[str],
+    max_chars: int = STREAM_FLUSH_CHARS,
+    max_delay: float = STREAM_FLUSH_MS / 1000
+) -> AsyncGenerator[str, None]:
+    """
+    토큰을 모아 프레임 단위로 전달
+    버퍼가 max_chars 이상이 되거나 마지막 전송 후 max_delay가 지나면 전송
+    (토큰이 느리게 도착하면 토큰마다 바로 전송되므로 지연이 늘지 않음)
+    
+    Args:
+        chunks: 업스트림 토큰 스트림
+        max_chars: 프레임당 최대 버퍼 글자 수
+        max_delay: 프레임 간 최대 대기 시간(초)
+        
+    Yields:
+        병합된 텍스트 (오류 메시지는 병합하지 않고 그대로 전달)
+    """
+    buffer = []
+    size = 0
+    last_flush = time.monotonic()
+    
+    async for chunk in chunks:
+        if chunk.startswith("[ERROR]"):
+            if buffer:
+                yield "".join(buffer)
+                buffer, size = [], 0
+            yield chunk
+            continue
+        
+        buffer.append(chunk)
+        size += len(chunk)
+        now = time.monotonic()
+        if size >= max_chars or now - last_flush >= max_delay:
+            yield "".join(buffer)
+            buffer, size = [], 0
+            last_flush = now
+    
+    if buffer:
+        yield "".join(buffer)
+
+
+# 클라이언트 연결 종료 확인 주기(초)
+DISCONNECT_POLL_SEC = float(os.getenv("DISCONNECT_POLL_MS", "250")) / 1000
+
+
+class ClientDisconnected(Exception):
+    """생성 도중 클라이언트가 연결을 끊음"""
+
+
+async def stream_until_disconnect(
+    http_request: Request,
+    chunks: AsyncIterator[str],
+    poll_interval: float = DISCONNECT_POLL_SEC
+) -> AsyncGenerator[str, None]:
+    """
+    업스트림 토큰을 전달하면서 클라이언트 연결 종료를 주기적으로 확인
+    다음 토큰을 기다리는 중(프롬프트 처리 포함)에도 연결이 끊기면 업스트림 요청을 취소하여
+    Ollama 연결을 닫고 동시 생성 슬롯을 반환
+    
+    Args:
+        http_request: HTTP 요청
+        chunks: 업스트림 토큰 스트림
+        poll_interval: 연결 종료 확인 주기(초)
+        
+    Yields:
+        업스트림 토큰
+        
+    Raises:
+        ClientDisconnected: 클라이언트 연결이 끊긴 경우
+    """
+    iterator = chunks.__aiter__()
+    next_check = time.monotonic() + poll_interval
+    while True:
+        next_chunk = asyncio.ensure_future(iterator.__anext__())
+        try:
+            while True:
+                timeout = max(0.0, next_check - time.monotonic())
+                done, _ = await asyncio.wait({next_chunk}, timeout=timeout)
+                if time.monotonic() >= next_check:
+                    if await http_request.is_disconnected():
+                        raise ClientDisconnected()
+                    next_check = time.monotonic() + poll_interval
+                if done:
+                    break
+        finally:
+            # 연결 종료 또는 상위 태스크 취소 시 대기 중인 업스트림 읽기도 취소
+            # (응답 태스크가 취소된 상태에서도 정리가 끝나도록 shield)
+            if not next_chunk.done():
+                next_chunk.cancel()
+                with anyio.CancelScope(shield=True):
+                    try:
+                        await next_chunk
+                    except (asyncio.CancelledError, StopAsyncIteration):
+                        pass
+        
+        try:
+            chunk = next_chunk.result()
+        except StopAsyncIteration:
+            return
+        yield chunk
+
+
+async def search_with_metrics(query: str, k: int, endpoint: str, active_retriever: HybridRetriever):
+    """
+    쿼리 임베딩 + 하이브리드 검색 (단계별 지연시간 기록)
+    
+    Args:
+        query: 검색 쿼리
+        k: 반환할 문서 수
+        endpoint: 메트릭 레이블 (chat, chat_stream)
+        active_retriever: 요청 시작 시점의 검색기 (처리 중 인덱스가 교체되어도 같은 인덱스 사용)
+        
+    Returns:
+        (쿼리 임베딩, 검색 결과)
+    """
+    start = time.perf_counter()
+    query_embedding = await query_batcher.embed(query)
+    embedded = time.perf_counter()
     
-    if embedder is None:
-        print("[INFO] 임베더 초기화 중...")
-        embedder = KoSBERTEmbedder()
+    # 스레드 풀에서 실행 (retrieval은 풀 대기 시간 포함, vector/bm25/fuse는 캐시 미스일 때만 기록)
+    timings = {}
+    search_results = await run_blocking(
+        active_retriever.hybrid_search,
+        query=query,
+        k=k,
+        query_embedding=query_embedding,
+        timings=timings
+    )
+    record_stage(endpoint, "embed", embedded - start)
+    record_stage(endpoint, "retrieval", time.perf_counter() - embedded)
+    # 검색기 내부 시간 (풀 대기 제외, 캐시 히트는 별도 단계로 기록)
+    cache_hit = timings.pop("cache_hit", False)
+    search_seconds = timings.pop("total", None)
+    if search_seconds is not None:
+        record_stage(endpoint, "retrieval_cache_hit" if cache_hit else "retrieval_search", search_seconds)
+    for stage, seconds in timings.items():
+        record_stage(endpoint, stage, seconds)
     
-    if vector_store is None:
-        print("[INFO] 벡터 스토어 초기화 중...")
-        vector_store = VectorStore(
-            persist_directory="./data/vectordb",
+    return query_embedding, search_results
+
+
+def _scheduler_rejected(e: SchedulerRejected) -> HTTPException:
+    """대기열 초과 응답 (503 + Retry-After)"""
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def check_llm_admission():
+    """LLM 대기열에 여유가 없으면 검색 전에 바로 503 반환"""
+    try:
+        llm_scheduler.check_admission()
+    except SchedulerRejected as e:
+        raise _scheduler_rejected(e)
+
+
+async def acquire_llm_slot(current_user: Optional[User]) -> LLMSlot:
+    """LLM 생성 슬롯 획득 (로그인 사용자는 우선 대기열)"""
+    try:
+        return await llm_scheduler.acquire(priority=current_user is not None)
+    except SchedulerRejected as e:
+        raise _scheduler_rejected(e)
+
+
+# 웜업 단계 (embedder, vector_store, bm25는 서로 독립적이므로 병렬 로드)
+warmup = WarmupTracker(["embedder", "vector_store", "bm25", "services", "warmup_query"])
+_warmup_task: Optional[asyncio.Task] = None
+
+WARMUP_QUERY = "궁디팡팡 캣페스타 부스 위치 알려줘"
+
+
+def _load_embedder():
+    """임베딩 모델 로드"""
+    global embedder
+    with warmup.stage("embedder"):
+        if embedder is None:
+            logger.info("임베더 초기화 중...")
+            cache_ttl = os.getenv("QUERY_CACHE_TTL")
+            embedder = KoSBERTEmbedder(
+                query_cache_size=int(os.getenv("QUERY_CACHE_SIZE", "1024")),
+                query_cache_ttl=float(cache_ttl) if cache_ttl else None,
+                # 벡터 DB 구축 스크립트와 같은 디스크 캐시 공유 (빈 값이면 미사용)
+                embedding_cache_dir=os.getenv("EMBEDDING_CACHE_DIR", "./data/embedding_cache") or None
+            )
+
+
+def _create_vector_store(directory: str):
+    """인덱스 디렉토리의 벡터 스토어 열기"""
+    # VECTOR_STORE_BACKEND: chroma (기본) 또는 numpy (인메모리 정확 검색)
+    backend = os.getenv("VECTOR_STORE_BACKEND", "chroma")
+    logger.info("벡터 스토어 초기화 중... (backend: %s, %s)", backend, directory)
+    if backend == "numpy":
+        return NumpyVectorStore(
+            persist_directory=directory,
             collection_name="gdpp_knowledge"
         )
+    return VectorStore(
+        persist_directory=directory,
+        collection_name="gdpp_knowledge"
+    )
+
+
+def _create_retriever(directory: str) -> HybridRetriever:
+    """인덱스 디렉토리의 BM25 아티팩트로 하이브리드 검색기 생성 (임베더/벡터 스토어는 이후 연결)"""
+    logger.info("하이브리드 검색기 초기화 중... (%s)", directory)
+    versioned_chunks = Path(directory) / "chunks.json"
+    result_ttl = os.getenv("RETRIEVAL_CACHE_TTL")
+    return HybridRetriever(
+        vector_store=None,
+        embedder=None,
+        chunks_file=str(versioned_chunks) if versioned_chunks.exists() else CHUNKS_FILE,
+        index_dir=str(Path(directory) / "bm25"),
+        version_dir=directory,
+        result_cache_size=int(os.getenv("RETRIEVAL_CACHE_SIZE", "1024")),
+        result_cache_ttl=float(result_ttl) if result_ttl else None,
+        fusion=os.getenv("HYBRID_FUSION", "weighted")
+    )
+
+
+def _open_vector_store(directory: str):
+    """벡터 스토어 열기"""
+    global vector_store
+    with warmup.stage("vector_store"):
+        if vector_store is None:
+            vector_store = _create_vector_store(directory)
+
+
+def _load_bm25(directory: str):
+    """하이브리드 검색기 생성 (BM25 인덱스 로드)"""
+    global retriever
+    with warmup.stage("bm25"):
+        if retriever is None:
+            retriever = _create_retriever(directory)
+
+
+def _create_services():
+    """검색기 연결 및 가벼운 컴포넌트(배처, Ollama 클라이언트, 스케줄러, 응답 캐시) 생성"""
+    global query_batcher, ollama_client, answer_cache, llm_scheduler
     
-    if retriever is None:
-        print("[INFO] 하이브리드 검색기 초기화 중...")
-        retriever = HybridRetriever(
-            vector_store=vector_store,
-            embedder=embedder
-        )
+    with warmup.stage("services"):
+        retriever.vector_store = vector_store
+        retriever.embedder = embedder
+        
+        if query_batcher is None:
+            # 동시 요청의 쿼리 임베딩을 모아 한 번에 인코딩
+            query_batcher = QueryBatcher(
+                embedder,
+                max_batch_size=int(os.getenv("EMBED_BATCH_SIZE", "32")),
+                max_wait_ms=float(os.getenv("EMBED_BATCH_WAIT_MS", "5"))
+            )
+        
+        if ollama_client is None:
+            ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+            logger.info("Ollama 클라이언트 초기화 중... (URL: %s)", ollama_base_url)
+            ollama_client = AsyncOllamaClient(
+                base_url=ollama_base_url,
+                connect_timeout=float(os.getenv("OLLAMA_CONNECT_TIMEOUT", "5")),
+                read_timeout=float(os.getenv("OLLAMA_READ_TIMEOUT", "600")),
+                max_connections=int(os.getenv("OLLAMA_MAX_CONNECTIONS", "10")),
+                # model="llama3.1:8b"
+                # model="llama3.2:3b"
+                # model="anpigon/exaone-3.0-7.8b-instruct-llamafied"
+                model="anpigon/exaone-3.0-7.8b-instruct-llamafied"
+            )
+        
+        if llm_scheduler is None:
+            # 동시 생성 수 제한 + 대기열 (동시 생성 수는 Ollama OLLAMA_NUM_PARALLEL 이하로 설정)
+            queue_timeout = os.getenv("LLM_QUEUE_TIMEOUT", "120")
+            llm_scheduler = LLMScheduler(
+                slots=int(os.getenv("LLM_SLOTS", "2")),
+                max_queue=int(os.getenv("LLM_MAX_QUEUE", "16")),
+                queue_timeout=float(queue_timeout) if queue_timeout else None
+            )
+        
+        answer_cache_size = int(os.getenv("ANSWER_CACHE_SIZE", "512"))
+        if answer_cache is None and answer_cache_size > 0:
+            # 비슷한 질문(같은 검색 결과 + 높은 임베딩 유사도)의 LLM 응답 재사용
+            answer_ttl = os.getenv("ANSWER_CACHE_TTL")
+            answer_cache = SemanticAnswerCache(
+                maxsize=answer_cache_size,
+                similarity_threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95")),
+                ttl=float(answer_ttl) if answer_ttl else None
+            )
+
+
+def _query_index(target: HybridRetriever):
+    """벡터/BM25 인덱스 페이지를 미리 읽도록 웜업 쿼리 실행 (캐시 미사용)"""
+    query_embedding = embedder.model.encode(WARMUP_QUERY, convert_to_numpy=True)
+    target.vector_search(WARMUP_QUERY, k=5, query_embedding=query_embedding)
+    target.bm25_search(WARMUP_QUERY, k=5)
+
+
+def _run_warmup_query():
+    """인코더 첫 실행 비용(메모리 할당, 커널 준비)과 인덱스 페이지 로드를 첫 요청 전에 처리 (캐시 미사용)"""
+    with warmup.stage("warmup_query"):
+        embedder.warmup([WARMUP_QUERY])
+        _query_index(retriever)
+
+
+async def warm_up_components():
+    """
+    컴포넌트 웜업
+    임베더 로드, 벡터 스토어 열기, BM25 인덱스 로드를 스레드 풀에서 동시에 실행한 뒤
+    나머지 컴포넌트를 만들고 웜업 쿼리 실행 (이미 로드된 컴포넌트는 건너뜀)
+    """
+    warmup.reset()
+    warmup.begin()
+    start = time.perf_counter()
+    
+    # 활성 인덱스 버전 (이미 로드했으면 그 디렉토리 유지)
+    if active_index["directory"] is None:
+        version, directory = resolve_index_dir(INDEX_ROOT)
+        active_index.update(version=version, directory=directory)
+    directory = active_index["directory"]
+    
+    # 하나가 실패해도 나머지 로드가 끝날 때까지 기다린 뒤 실패 전달 (재시도 시 중복 로드 방지)
+    results = await asyncio.gather(
+        run_blocking(_load_embedder),
+        run_blocking(_open_vector_store, directory),
+        run_blocking(_load_bm25, directory),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    active_index["loaded_at"] = active_index["loaded_at"] or time.strftime("%Y-%m-%d %H:%M:%S")
+    
+    _create_services()
+    await run_blocking(_run_warmup_query)
+    logger.info("컴포넌트 웜업 완료 (%.2f초)", time.perf_counter() - start)
+
+
+def _log_warmup_result(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("컴포넌트 웜업 실패: %s", task.exception())
+
+
+def start_warm_up() -> asyncio.Task:
+    """웜업 시작 (진행 중이거나 완료된 웜업이 있으면 그대로 반환, 실패했으면 다시 시작)"""
+    global _warmup_task
+    failed = _warmup_task is not None and _warmup_task.done() and (
+        _warmup_task.cancelled() or _warmup_task.exception() is not None
+    )
+    if _warmup_task is None or failed:
+        _warmup_task = asyncio.ensure_future(warm_up_components())
+        _warmup_task.add_done_callback(_log_warmup_result)
+    return _warmup_task
+
+
+async def ensure_components():
+    """컴포넌트 준비 대기 (요청이 취소되어도 웜업은 계속 진행)"""
+    await asyncio.shield(start_warm_up())
+
+
+# 인덱스 교체 상태 (idle → building → loading → ready / failed)
+index_swap = {"state": "idle", "version": None, "error": None, "started_at": None, "finished_at": None}
+_swap_task: Optional[asyncio.Task] = None
+
+
+def _open_index(directory: str):
+    """새 인덱스의 벡터 스토어와 검색기를 열고 웜업 쿼리 실행 (교체 전 백그라운드에서 준비)"""
+    new_store = _create_vector_store(directory)
+    new_retriever = _create_retriever(directory)
+    new_retriever.vector_store = new_store
+    new_retriever.embedder = embedder
+    _query_index(new_retriever)
+    return new_store, new_retriever
+
+
+def _mark_swap_started(version: Optional[str], rebuild: bool):
+    index_swap.update(
+        state="building" if rebuild else "loading", version=version, error=None,
+        started_at=time.strftime("%Y-%m-%d %H:%M:%S"), finished_at=None
+    )
+
+
+def index_swap_running() -> bool:
+    """인덱스 교체 진행 중 여부"""
+    return index_swap["state"] in ("building", "loading")
+
+
+async def swap_index(version: Optional[str] = None, rebuild: bool = False):
+    """
+    검색 인덱스 무중단 교체
+    새 인덱스를 별도 스레드에서 (구축하고) 열어 웜업한 뒤 전역 검색기를 한 번에 교체
+    처리 중인 요청은 시작할 때 잡은 이전 검색기로 끝까지 처리
     
-    if ollama_client is None:
-        print("[INFO] Ollama 클라이언트 초기화 중...")
-        ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-        print(f"[INFO] Ollama URL: {ollama_base_url}")
-        ollama_client = OllamaClient(
-            base_url=ollama_base_url,
-            # model="llama3.1:8b"
-            # model="llama3.2:3b"
-            # model="anpigon/exaone-3.0-7.8b-instruct-llamafied"
-            model="anpigon/exaone-3.0-7.8b-instruct-llamafied"
+    Args:
+        version: 교체할 인덱스 버전 (None이면 CURRENT)
+        rebuild: True면 청크 데이터로 새 버전을 구축한 뒤 교체
+    """
+    global vector_store, retriever
+    
+    _mark_swap_started(version, rebuild)
+    start = time.perf_counter()
+    try:
+        await ensure_components()
+        
+        if rebuild:
+            # 이미 로드된 임베더와 디스크 임베딩 캐시 사용 (바뀐 청크만 인코딩)
+            version = await asyncio.to_thread(
+                build_index_version, chunks_file=CHUNKS_FILE, index_root=INDEX_ROOT, embedder=embedder
+            )
+            index_swap.update(state="loading", version=version)
+        
+        version = version or read_current(INDEX_ROOT)
+        if version is None:
+            raise ValueError(f"활성 인덱스 버전이 없습니다: {INDEX_ROOT}")
+        directory = version_dir(INDEX_ROOT, version)
+        new_store, new_retriever = await asyncio.to_thread(_open_index, directory)
+        
+        # 재시작 시에도 같은 버전을 쓰도록 CURRENT를 먼저 기록한 뒤 교체
+        set_current(INDEX_ROOT, version)
+        previous = active_index["version"]
+        vector_store, retriever = new_store, new_retriever
+        active_index.update(version=version, directory=directory, loaded_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+        logger.info("인덱스 교체 완료: %s → %s (%.2f초)", previous, version, time.perf_counter() - start)
+        
+        # 이전 버전은 처리 중인 요청이 있을 수 있으므로 유지
+        await asyncio.to_thread(
+            prune_versions, INDEX_ROOT, keep=INDEX_KEEP_VERSIONS, protect=[previous] if previous else None
         )
+        index_swap.update(state="ready", version=version, finished_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+    except Exception as e:
+        logger.exception("인덱스 교체 실패: %s", e)
+        index_swap.update(state="failed", error=str(e), finished_at=time.strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def start_index_swap(version: Optional[str] = None, rebuild: bool = False):
+    """인덱스 교체를 백그라운드로 시작 (진행 중이면 호출하지 않음)"""
+    global _swap_task
+    if index_swap_running():
+        raise RuntimeError("인덱스 교체가 이미 진행 중입니다")
+    _mark_swap_started(version, rebuild)
+    _swap_task = asyncio.ensure_future(swap_index(version=version, rebuild=rebuild))
+
+
+def index_status() -> Dict:
+    """인덱스 상태 (사용 중인 버전, 교체 진행 상황, 구축된 버전 목록)"""
+    return {
+        "index_root": INDEX_ROOT,
+        "active": dict(active_index),
+        "current": read_current(INDEX_ROOT),
+        "versions": list_versions(INDEX_ROOT),
+        "swap": dict(index_swap)
+    }
+
+
+async def shutdown_components():
+    """앱 종료 시 비동기 리소스 정리"""
+    for task in (_warmup_task, _swap_task):
+        if task is not None and not task.done():
+            task.cancel()
+    if query_batcher is not None:
+        await query_batcher.close()
+    if ollama_client is not None:
+        await ollama_client.aclose()
+    retrieval_executor.shutdown(wait=False)
+
+
+def _collect_cache_requests():
+    """캐시별 히트/미스 누적 수 (초기화 전에는 비어 있음)"""
+    caches = {
+        "query_embedding": embedder.cache_stats() if embedder is not None else None,
+        "retrieval": retriever.cache_stats() if retriever is not None else None,
+        "answer": answer_cache.stats() if answer_cache is not None else None
+    }
+    samples = []
+    for name, stats in caches.items():
+        if stats and "hits" in stats:
+            samples.append(({"cache": name, "result": "hit"}, stats["hits"]))
+            samples.append(({"cache": name, "result": "miss"}, stats["misses"]))
+    return samples
+
+
+def _collect_scheduler(*fields):
+    def collect():
+        if llm_scheduler is None:
+            return []
+        stats = llm_scheduler.stats()
+        if len(fields) == 1:
+            return [({}, stats[fields[0]])]
+        return [({"reason": field}, stats[field]) for field in fields]
+    return collect
+
+
+registry.callback(
+    "gdpp_cache_requests_total",
+    "Cache lookups by cache and result",
+    "counter",
+    _collect_cache_requests
+)
+registry.callback(
+    "gdpp_llm_queue_depth",
+    "Requests waiting for an LLM generation slot",
+    "gauge",
+    _collect_scheduler("queued")
+)
+registry.callback(
+    "gdpp_llm_active_slots",
+    "LLM generation slots in use",
+    "gauge",
+    _collect_scheduler("active")
+)
+registry.callback(
+    "gdpp_llm_rejections_total",
+    "Requests refused by the LLM scheduler",
+    "counter",
+    _collect_scheduler("rejected", "timed_out")
+)
+registry.callback(
+    "gdpp_embed_batches_total",
+    "Query embedding batches encoded by the QueryBatcher",
+    "counter",
+    lambda: [({}, query_batcher.batches)] if query_batcher is not None else []
+)
 
 
 class ChatRequest(BaseModel):
@@ -85,9 +627,23 @@ class ChatResponse(BaseModel):
     sources: list
 
 
+# 배치 검색 요청당 최대 쿼리 수
+MAX_BATCH_QUERIES = 256
+# 배치 검색 쿼리당 최대 결과 수
+MAX_BATCH_TOP_K = 50
+
+
+class BatchSearchRequest(BaseModel):
+    """배치 검색 요청 모델"""
+    queries: List[str]
+    top_k: int = Field(5, ge=1, le=MAX_BATCH_TOP_K)
+    fusion: Optional[Literal["weighted", "rrf", "minmax", "zscore"]] = None  # None이면 서버 기본값
+
+
 @router.post("/chat")
 async def chat(
     request: ChatRequest,
+    http_request: Request,
     current_user: Optional[User] = Depends(get_current_user_optional),
     db: Session = Depends(get_db)
 ):
@@ -96,54 +652,107 @@ async def chat(
     
     Args:
         request: 채팅 요청
+        http_request: HTTP 요청 (클라이언트 연결 종료 감지용)
         current_user: 현재 사용자 (선택적)
         db: 데이터베이스 세션
         
     Returns:
         ChatResponse: 챗봇 응답
     """
+    request_start = time.perf_counter()
     try:
         # 컴포넌트 초기화
-        initialize_components()
+        await ensure_components()
+        check_llm_admission()
         
-        # 1. 하이브리드 검색
-        print(f"[INFO] 검색 쿼리: {request.message}")
-        search_results = retriever.hybrid_search(
-            query=request.message,
-            k=request.top_k
+        # 1. 하이브리드 검색 (스레드 풀에서 실행, 요청 처리 중 인덱스가 교체되어도 시작 시점의 검색기 사용)
+        logger.debug("검색 쿼리: %s", request.message)
+        active_retriever = retriever
+        query_embedding, search_results = await search_with_metrics(
+            request.message, request.top_k, "chat", active_retriever
         )
         
         # 1.5. 유사도 필터링 (낮은 점수 문서 제외)
-        SIMILARITY_THRESHOLD = 0.15  # 하이브리드 점수 임계값 (0.15로 조정)
+        # 결합 전략마다 점수 척도가 다르므로 전략별 임계값 사용 (weighted: 0.2, minmax: 0.15, rrf/zscore: 필터링 안 함)
+        SIMILARITY_THRESHOLD = active_retriever.fusion.min_score
         filtered_results = [
             r for r in search_results 
-            if r.get('hybrid_score', 0) >= SIMILARITY_THRESHOLD
+            if SIMILARITY_THRESHOLD is None or r.get('hybrid_score', 0) >= SIMILARITY_THRESHOLD
         ]
         
         # 필터링 결과 로그
-        print(f"[INFO] 검색 결과: {len(search_results)}개 → 필터링 후: {len(filtered_results)}개")
+        logger.info("검색 결과: %d개 → 필터링 후: %d개", len(search_results), len(filtered_results))
         if filtered_results:
-            print(f"[INFO] 최고 점수: {filtered_results[0].get('hybrid_score', 0):.4f}")
-            print(f"[INFO] 최저 점수: {filtered_results[-1].get('hybrid_score', 0):.4f}")
+            logger.debug(
+                "최고 점수: %.4f, 최저 점수: %.4f",
+                filtered_results[0].get('hybrid_score', 0),
+                filtered_results[-1].get('hybrid_score', 0)
+            )
         
         # 필터링된 결과가 없으면 최소 1개는 사용
         if not filtered_results and search_results:
-            print("[WARNING] 필터링 결과 없음, 최상위 1개 문서 사용")
+            logger.warning("필터링 결과 없음, 최상위 1개 문서 사용")
             filtered_results = search_results[:1]
         
         # 2. 프롬프트 생성 (필터링된 결과 사용)
+        prompt_start = time.perf_counter()
         prompt_data = create_chat_prompt(request.message, filtered_results)
+        record_stage("chat", "prompt", time.perf_counter() - prompt_start)
         
-        # 3. LLM 호출
-        print("[INFO] LLM 호출 중...")
-        response = ollama_client.generate(
-            prompt=prompt_data['prompt'],
-            system=prompt_data['system'],
-            temperature=request.temperature,
-            max_tokens=request.max_tokens
-        )
+        # 3. 응답 캐시 조회 (같은 문서 + 생성 파라미터 + 유사한 질문)
+        cache_key = None
+        response = None
+        if answer_cache is not None:
+            # 버전 조회만 (재로드는 위 검색이 스레드 풀에서 refresh_if_stale로 처리, 이벤트 루프에서 파일 I/O 없음)
+            answer_cache.check_version(active_retriever.current_version())
+            cache_key = SemanticAnswerCache.make_key(
+                [r['id'] for r in filtered_results],
+                model=ollama_client.model,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens
+            )
+            response = answer_cache.get(query_embedding, cache_key)
+            if response is not None:
+                logger.info("응답 캐시 히트")
+        
+        # 4. LLM 호출 (비동기 HTTP, 클라이언트 연결이 끊기면 생성 취소)
+        if response is None:
+            logger.debug("LLM 호출 중...")
+            llm_stats = {}
+            upstream = ollama_client.generate_stream(
+                prompt=prompt_data['prompt'],
+                system=prompt_data['system'],
+                temperature=request.temperature,
+                max_tokens=request.max_tokens,
+                stats=llm_stats
+            )
+            chunks = []
+            queue_start = time.perf_counter()
+            slot = await acquire_llm_slot(current_user)
+            generation_start = time.perf_counter()
+            record_stage("chat", "queue_wait", generation_start - queue_start)
+            try:
+                async for chunk in stream_until_disconnect(http_request, upstream):
+                    if not chunks:
+                        record_stage("chat", "llm_ttft", time.perf_counter() - generation_start)
+                    chunks.append(chunk)
+            except ClientDisconnected:
+                generation_metrics.record_cancelled(len(chunks), request.max_tokens)
+                logger.info("클라이언트 연결 종료, 생성 취소 (%d개 토큰 생성 후)", len(chunks))
+                raise HTTPException(status_code=499, detail="Client closed request")
+            finally:
+                with anyio.CancelScope(shield=True):
+                    await upstream.aclose()
+                slot.release()
+                record_llm_stats(llm_stats)
+            generation_metrics.record_completed(len(chunks))
+            record_stage("chat", "llm_generation", time.perf_counter() - generation_start)
+            response = "".join(chunks)
+            failed = bool(chunks) and chunks[-1].startswith("[ERROR]")
+            if cache_key is not None and chunks and not failed:
+                answer_cache.set(query_embedding, cache_key, response)
         
-        # 4. 소스 정보 추출 (필터링된 결과 사용)
+        # 5. 소스 정보 추출 (필터링된 결과 사용)
         sources = []
         for result in filtered_results[:3]:  # 상위 3개만
             metadata = result['metadata']
@@ -153,9 +762,9 @@ async def chat(
                 "score": result.get('hybrid_score', 0)
             })
         
-        # 5. 로그인 사용자의 경우 메시지 저장
+        # 6. 로그인 사용자의 경우 메시지 저장
         if current_user and request.conversation_id:
-            print(f"[INFO] 메시지 저장 중... (conversation_id: {request.conversation_id})")
+            logger.debug("메시지 저장 중... (conversation_id: %s)", request.conversation_id)
             
             # 대화 존재 확인
             conversation = db.query(Conversation).filter(
@@ -186,46 +795,58 @@ async def chat(
                 conversation.updated_at = datetime.utcnow()
                 
                 db.commit()
-                print("[INFO] 메시지 저장 완료")
+                logger.debug("메시지 저장 완료")
             else:
-                print(f"[WARNING] 대화를 찾을 수 없음: {request.conversation_id}")
+                logger.warning("대화를 찾을 수 없음: %s", request.conversation_id)
         
+        record_stage("chat", "total", time.perf_counter() - request_start)
         return ChatResponse(
             response=response,
             sources=sources
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        print(f"[ERROR] {str(e)}")
-        print(f"[TRACEBACK] {traceback.format_exc()}")
+        logger.exception("채팅 처리 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/chat/stream")
-async def chat_stream(request: ChatRequest):
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
     """
     챗봇 엔드포인트 (스트리밍)
     
     Args:
         request: 채팅 요청
+        http_request: HTTP 요청 (클라이언트 연결 종료 감지용)
+        current_user: 현재 사용자 (선택적, 로그인 사용자는 LLM 대기열 우선)
         
     Returns:
-        StreamingResponse: 스트리밍 응답
+        StreamingResponse: SSE 스트리밍 응답
+            data: {"type": "sources", "data": [...]}
+            data: {"type": "token", "data": "..."}  (여러 토큰을 병합한 프레임)
+            data: {"type": "error", "data": "..."}
+            data: {"type": "done"}
     """
+    request_start = time.perf_counter()
     try:
         # 컴포넌트 초기화
-        initialize_components()
+        await ensure_components()
+        check_llm_admission()
         
-        # 1. 하이브리드 검색
-        print(f"[INFO] 검색 쿼리: {request.message}")
-        search_results = retriever.hybrid_search(
-            query=request.message,
-            k=request.top_k
-        )
+        # 1. 하이브리드 검색 (스레드 풀에서 실행)
+        logger.debug("검색 쿼리: %s", request.message)
+        _, search_results = await search_with_metrics(request.message, request.top_k, "chat_stream", retriever)
         
         # 2. 프롬프트 생성
+        prompt_start = time.perf_counter()
         prompt_data = create_chat_prompt(request.message, search_results)
+        record_stage("chat_stream", "prompt", time.perf_counter() - prompt_start)
         
         # 3. 스트리밍 생성기
         async def generate():
@@ -239,40 +860,147 @@ async def chat_stream(request: ChatRequest):
                     "score": result.get('hybrid_score', 0)
                 })
             
-            yield f"data: {{'type': 'sources', 'data': {sources}}}\n\n"
+            yield sse_event("sources", sources)
             
-            # LLM 응답 스트리밍
-            for chunk in ollama_client.generate_stream(
+            # LLM 생성 슬롯 대기 (스트림이 시작된 뒤에는 대기열 초과를 error 이벤트로 전달)
+            queue_start = time.perf_counter()
+            try:
+                slot = await llm_scheduler.acquire(priority=current_user is not None)
+            except SchedulerRejected as e:
+                yield sse_event("error", str(e))
+                return
+            generation_start = time.perf_counter()
+            record_stage("chat_stream", "queue_wait", generation_start - queue_start)
+            
+            # LLM 응답 스트리밍 (토큰을 프레임 단위로 병합)
+            llm_stats = {}
+            upstream = ollama_client.generate_stream(
                 prompt=prompt_data['prompt'],
                 system=prompt_data['system'],
                 temperature=request.temperature,
-                max_tokens=request.max_tokens
-            ):
-                yield f"data: {{'type': 'token', 'data': '{chunk}'}}\n\n"
+                max_tokens=request.max_tokens,
+                stats=llm_stats
+            )
+            received = 0
+            cancelled = False
+            
+            async def counted():
+                nonlocal received
+                async for chunk in stream_until_disconnect(http_request, upstream):
+                    if received == 0:
+                        record_stage("chat_stream", "llm_ttft", time.perf_counter() - generation_start)
+                    received += 1
+                    yield chunk
+            
+            try:
+                async for text in coalesce_tokens(counted()):
+                    if text.startswith("[ERROR]"):
+                        yield sse_event("error", text)
+                        return
+                    yield sse_event("token", text)
+            except ClientDisconnected:
+                # 클라이언트가 연결을 끊으면 업스트림 생성 중단
+                cancelled = True
+                return
+            except asyncio.CancelledError:
+                # Starlette가 연결 종료를 먼저 감지하여 응답 태스크를 취소한 경우
+                cancelled = True
+                raise
+            finally:
+                # 업스트림 HTTP 스트림을 닫아 Ollama 생성 중단
+                with anyio.CancelScope(shield=True):
+                    await upstream.aclose()
+                slot.release()
+                record_llm_stats(llm_stats)
+                if cancelled:
+                    generation_metrics.record_cancelled(received, request.max_tokens)
+                    logger.info("클라이언트 연결 종료, 스트리밍 중단 (%d개 토큰 생성 후)", received)
+            
+            generation_metrics.record_completed(received)
+            finished = time.perf_counter()
+            record_stage("chat_stream", "llm_generation", finished - generation_start)
+            record_stage("chat_stream", "total", finished - request_start)
             
             # 완료 신호
-            yield "data: {'type': 'done'}\n\n"
+            yield sse_event("done")
         
         return StreamingResponse(
             generate(),
-            media_type="text/event-stream"
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"[ERROR] {str(e)}")
+        logger.exception("스트리밍 채팅 처리 실패: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/search/batch")
+async def search_batch(request: BatchSearchRequest):
+    """
+    배치 하이브리드 검색 엔드포인트 (평가/쿼리 확장 실험용)
+    
+    Args:
+        request: 배치 검색 요청
+        
+    Returns:
+        쿼리별 검색 결과
+    """
+    if len(request.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {MAX_BATCH_QUERIES}개 쿼리까지 검색할 수 있습니다"
+        )
+    
+    try:
+        await ensure_components()
+        
+        batch_results = await run_blocking(
+            retriever.hybrid_search_batch,
+            queries=request.queries,
+            k=request.top_k,
+            fusion=request.fusion
+        )
+        
+        return {
+            "results": [
+                {
+                    "query": query,
+                    "documents": [
+                        {
+                            "id": result['id'],
+                            "document": result['document'],
+                            "metadata": result['metadata'],
+                            "score": result.get('hybrid_score', 0)
+                        }
+                        for result in results
+                    ]
+                }
+                for query, results in zip(request.queries, batch_results)
+            ]
+        }
+        
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("배치 검색 실패: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/status")
 async def status():
     """시스템 상태 확인"""
-    initialize_components()
+    await ensure_components()
     
     # Ollama 연결 확인
-    ollama_status = ollama_client.check_connection()
+    ollama_status = await ollama_client.check_connection()
     
-    # 벡터 DB 통계
-    db_stats = vector_store.get_collection_stats()
+    # 벡터 DB 통계 (코퍼스 재로드 시 검색기가 새로 연 스토어 기준)
+    db_stats = retriever.vector_store.get_collection_stats()
     
     return {
         "ollama": {
@@ -286,5 +1014,14 @@ async def status():
         "components": {
             "embedder": embedder is not None,
             "retriever": retriever is not None
-        }
+        },
+        "index": dict(active_index),
+        "cache": {
+            "query_embedding": embedder.cache_stats(),
+            "retrieval": retriever.cache_stats(),
+            "answer": answer_cache.stats() if answer_cache is not None else None
+        },
+        "query_batcher": query_batcher.stats(),
+        "generation": generation_metrics.stats(),
+        "llm_scheduler": llm_scheduler.stats()
     }
@@ -0,0 +1,73 @@
+# File: src/api/warmup.py
+"""
+컴포넌트 웜업 진행 상황 추적 - 준비 상태(/ready) 응답에 사용
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class WarmupTracker:
+    """단계별 웜업 상태 (pending → running → ready / failed, 스레드 안전)"""
+
+    def __init__(self, stages: List[str]):
+        """
+        Args:
+            stages: 웜업 단계 이름 (모든 단계가 ready가 되면 준비 완료)
+        """
+        self._lock = threading.Lock()
+        self.stage_names = list(stages)
+        self.reset()
+
+    def reset(self):
+        """모든 단계를 대기 상태로 초기화 (웜업 재시도 시)"""
+        with self._lock:
+            self.stages: Dict[str, Dict] = {name: {"state": "pending"} for name in self.stage_names}
+            self.started_at: Optional[float] = None
+            self.finished_at: Optional[float] = None
+            self.error: Optional[str] = None
+
+    def begin(self):
+        with self._lock:
+            self.started_at = time.time()
+
+    @contextmanager
+    def stage(self, name: str):
+        """단계 실행 구간 (소요 시간 기록, 예외 시 failed)"""
+        start = time.perf_counter()
+        with self._lock:
+            self.stages[name] = {"state": "running"}
+        try:
+            yield
+        except Exception as e:
+            with self._lock:
+                self.stages[name] = {"state": "failed", "error": str(e)}
+                self.error = f"{name}: {e}"
+            raise
+        with self._lock:
+            self.stages[name] = {"state": "ready", "seconds": round(time.perf_counter() - start, 3)}
+            if all(stage["state"] == "ready" for stage in self.stages.values()):
+                self.finished_at = time.time()
+
+    @property
+    def ready(self) -> bool:
+        with self._lock:
+            return all(stage["state"] == "ready" for stage in self.stages.values())
+
+    def snapshot(self) -> Dict:
+        """준비 상태 응답 본문"""
+        with self._lock:
+            stages = {name: dict(stage) for name, stage in self.stages.items()}
+            ready = all(stage["state"] == "ready" for stage in stages.values())
+            if self.started_at is None:
+                elapsed = None
+            else:
+                elapsed = round((self.finished_at or time.time()) - self.started_at, 3)
+            return {
+                "ready": ready,
+                "progress": f"{sum(stage['state'] == 'ready' for stage in stages.values())}/{len(stages)}",
+                "elapsed_seconds": elapsed,
+                "error": self.error,
+                "stages": stages
+            }
@@ -9,8 +9,12 @@ from jose import JWTError, jwt
 import os
 from dotenv import load_dotenv
 
+from src.utils.logger import get_logger
+
 load_dotenv()
 
+logger = get_logger("auth.jwt")
+
 # JWT 설정
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = "HS256"
@@ -27,8 +31,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    print(f"[DEBUG] Creating token with SECRET_KEY: {SECRET_KEY[:10]}...")
-    print(f"[DEBUG] Token data: {to_encode}")
+    logger.debug("액세스 토큰 생성 (sub: %s, exp: %s)", to_encode.get("sub"), expire)
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     
     return encoded_jwt
@@ -37,9 +40,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 def verify_token(token: str) -> Optional[dict]:
     """JWT 토큰 검증"""
     try:
-        print(f"[DEBUG] Verifying token with SECRET_KEY: {SECRET_KEY[:10]}...")
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         return payload
     except JWTError as e:
-        print(f"[DEBUG] JWT verification error: {e}")
+        logger.debug("JWT 검증 실패: %s", e)
         return None
@@ -0,0 +1,212 @@
+# File: src/crawler/fetcher.py
+"""
+비동기 HTTP 수집기 - 연결 재사용, 동시 요청 수 제한, 조건부 요청(ETag/Last-Modified) + 로컬 응답 캐시
+
+캐시 구조 ({cache_dir}/):
+    {url sha256}.json    URL, 상태 코드, ETag, Last-Modified, Content-Type, 수집 시각
+    {url sha256}.body    응답 본문
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+from src.utils.logger import get_logger
+
+logger = get_logger("crawler.fetcher")
+
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# 일시적인 오류로 보고 재시도할 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class HTTPCache:
+    """검증자(ETag/Last-Modified)가 있는 응답만 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir: str = "./data/cache/http"):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        캐시된 응답 조회
+
+        Args:
+            url: 요청 URL (쿼리 문자열 포함)
+
+        Returns:
+            메타데이터 + content(bytes), 없거나 손상되면 None
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            meta["content"] = body_path.read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return None
+        return meta if meta.get("url") == url else None
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        cached = self.get(url)
+        if cached is None:
+            return {}
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def put(self, url: str, response: httpx.Response) -> bool:
+        """
+        응답 저장 (검증자가 없으면 저장하지 않음)
+
+        Returns:
+            저장 여부
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+
+        meta_path, body_path = self._paths(url)
+        # 본문을 먼저 교체한 뒤 메타데이터 교체 (메타데이터가 가리키는 본문은 항상 완전함)
+        tmp_body = body_path.with_suffix(f".body.tmp-{os.getpid()}")
+        tmp_body.write_bytes(response.content)
+        tmp_body.replace(body_path)
+
+        tmp_meta = meta_path.with_suffix(f".json.tmp-{os.getpid()}")
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({
+                "url": url,
+                "status": response.status_code,
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": response.headers.get("Content-Type"),
+                "fetched_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }, f, ensure_ascii=False)
+        tmp_meta.replace(meta_path)
+        return True
+
+
+class AsyncFetcher:
+    """
+    비동기 HTTP 수집기
+    하나의 httpx.AsyncClient로 연결을 재사용하고 세마포어로 동시 요청 수를 제한
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        cache_dir: Optional[str] = "./data/cache/http",
+        timeout: float = 30.0,
+        retries: int = 2,
+        user_agent: str = DEFAULT_USER_AGENT,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            max_concurrency: 동시 요청 수
+            cache_dir: 응답 캐시 디렉토리 (None이면 조건부 요청 미사용)
+            timeout: 요청 타임아웃(초)
+            retries: 연결 오류/일시적 오류 재시도 횟수
+            user_agent: User-Agent 헤더
+            transport: httpx 전송 계층 (기록된 응답으로 테스트할 때 사용)
+        """
+        self.max_concurrency = max_concurrency
+        self.cache = HTTPCache(cache_dir) if cache_dir else None
+        self.retries = retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            headers={"User-Agent": user_agent},
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            transport=transport
+        )
+        self.stats = {"requests": 0, "downloaded": 0, "not_modified": 0, "errors": 0, "bytes": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """연결 풀 종료"""
+        await self._client.aclose()
+
+    async def fetch(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """
+        URL 수집 (캐시된 응답이 있으면 조건부 요청, 304면 캐시 본문 사용)
+
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+
+        Returns:
+            {"url", "status", "content", "from_cache"}
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 실패한 경우
+        """
+        full_url = str(httpx.URL(url, params=params))
+        headers = self.cache.validators(full_url) if self.cache else {}
+
+        async with self._semaphore:
+            response = await self._request(full_url, headers)
+
+        if response.status_code == 304 and self.cache is not None:
+            cached = self.cache.get(full_url)
+            if cached is not None:
+                self.stats["not_modified"] += 1
+                logger.debug("304 Not Modified: %s", full_url)
+                return {"url": full_url, "status": cached["status"], "content": cached["content"], "from_cache": True}
+            # 캐시가 사라졌으면 조건 없이 다시 요청
+            async with self._semaphore:
+                response = await self._request(full_url, {})
+
+        response.raise_for_status()
+        self.stats["downloaded"] += 1
+        self.stats["bytes"] += len(response.content)
+        if self.cache is not None:
+            self.cache.put(full_url, response)
+        return {"url": full_url, "status": response.status_code, "content": response.content, "from_cache": False}
+
+    async def _request(self, url: str, headers: Dict[str, str]) -> httpx.Response:
+        """GET 요청 (연결 오류와 429/5xx는 지수 백오프로 재시도)"""
+        for attempt in range(self.retries + 1):
+            self.stats["requests"] += 1
+            try:
+                response = await self._client.get(url, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == self.retries:
+                    self.stats["errors"] += 1
+                    raise
+                logger.warning("요청 실패, 재시도 (%d/%d): %s - %s", attempt + 1, self.retries, url, e)
+            else:
+                if response.status_code not in RETRY_STATUS or attempt == self.retries:
+                    if response.status_code >= 400:
+                        self.stats["errors"] += 1
+                    return response
+                logger.warning("HTTP %d, 재시도 (%d/%d): %s", response.status_code, attempt + 1, self.retries, url)
+            await asyncio.sleep(0.5 * 2 ** attempt)
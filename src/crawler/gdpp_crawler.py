@@ -2,14 +2,59 @@
 """
 GDPP 브랜드 크롤러 - JavaScript에서 데이터 추출
 """
+import os
+import sys
 import requests
 from bs4 import BeautifulSoup
 import json
 import re
 import time
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 from pathlib import Path
 
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행 시)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.logger import get_logger
+
+logger = get_logger("crawler.gdpp")
+
+
+# Vue 데이터의 brand_list 배열 시작 (visible_brand_list 등 다른 키는 제외)
+_BRAND_LIST_PATTERN = r'(?<![\w$])brand_list\s*:\s*\['
+_BRAND_LIST_RE = re.compile(_BRAND_LIST_PATTERN)
+_BRAND_LIST_RE_BYTES = re.compile(_BRAND_LIST_PATTERN.encode('ascii'))
+_JSON_DECODER = json.JSONDecoder()
+
+
+def extract_brand_list(content: Union[bytes, str]) -> Optional[List[Dict]]:
+    """
+    페이지 원문(또는 script 본문)에서 brand_list 배열을 바로 디코딩
+    DOM을 만들거나 문자 단위로 괄호를 세지 않고 json.JSONDecoder.raw_decode로 배열 하나만 읽음
+    bytes는 배열 시작부터 페이지 끝까지를 한 번에 UTF-8 디코딩 (배열 끝을 bytes에서 찾는 Python 루프보다 빠름)
+
+    Args:
+        content: HTML 원문 (bytes는 UTF-8) 또는 script 문자열
+
+    Returns:
+        brand_list 원본 객체 리스트 (찾지 못하면 None)
+    """
+    pattern = _BRAND_LIST_RE_BYTES if isinstance(content, bytes) else _BRAND_LIST_RE
+    for match in pattern.finditer(content):
+        # bytes는 배열 시작 이후를 디코딩 (memoryview로 중간 bytes 복사 없이), str은 복사 없이 위치 지정
+        if isinstance(content, bytes):
+            text, start = str(memoryview(content)[match.end() - 1:], 'utf-8', 'replace'), 0
+        else:
+            text, start = content, match.end() - 1
+        try:
+            brand_data, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError as e:
+            logger.error("brand_list JSON 파싱 실패: %s", e)
+            continue
+        if isinstance(brand_data, list):
+            return brand_data
+    return None
+
 
 class GDPPBrandCrawler:
     """GDPP 브랜드 크롤러"""
@@ -25,106 +70,54 @@ class GDPPBrandCrawler:
     def crawl_brands(self, url: str = "https://gdppcat.com/brand") -> List[Dict]:
         """브랜드 정보 크롤링"""
         
-        print(f"[INFO] 크롤링 시작: {url}")
+        logger.info("크롤링 시작: %s", url)
         
         try:
             # HTTP 요청
             response = requests.get(url, headers=self.headers)
             response.raise_for_status()
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 브랜드 데이터 추출
-            brands = self.extract_brands(soup)
+            # 브랜드 데이터 추출 (script의 brand_list를 원문에서 바로 디코딩)
+            brands = self.extract_brands_from_html(response.content)
             
-            print(f"[SUCCESS] {len(brands)}개의 브랜드 데이터 수집 완료")
+            logger.info("%d개의 브랜드 데이터 수집 완료", len(brands))
             
             return brands
             
         except Exception as e:
-            print(f"[ERROR] 크롤링 실패: {e}")
+            logger.error("크롤링 실패: %s", e)
             return []
     
 
     
     def extract_brands(self, soup: BeautifulSoup) -> List[Dict]:
-        """JavaScript에서 브랜드 데이터 추출"""
-        brands = []
-        
-        # script 태그에서 brand_list 찾기
-        scripts = soup.find_all('script')
-        
-        for script in scripts:
-            if script.string and 'brand_list:' in script.string:
-                try:
-                    # brand_list: 위치 찾기
-                    start_idx = script.string.find('brand_list:')
-                    if start_idx == -1:
-                        continue
-                    
-                    # 배열 시작 위치 찾기
-                    array_start = script.string.find('[', start_idx)
-                    if array_start == -1:
-                        continue
-                    
-                    # 괄호 카운팅으로 배열 끝 찾기
-                    bracket_count = 0
-                    in_string = False
-                    escape_next = False
-                    array_end = -1
-                    
-                    for j, char in enumerate(script.string[array_start:], start=array_start):
-                        if escape_next:
-                            escape_next = False
-                            continue
-                        
-                        if char == '\\\\':
-                            escape_next = True
-                            continue
-                        
-                        if char == '"' and not escape_next:
-                            in_string = not in_string
-                        
-                        if not in_string:
-                            if char == '[':
-                                bracket_count += 1
-                            elif char == ']':
-                                bracket_count -= 1
-                                if bracket_count == 0:
-                                    array_end = j + 1
-                                    break
-                    
-                    if array_end == -1:
-                        print("[ERROR] 배열 끝을 찾을 수 없습니다.")
-                        continue
-                    
-                    # JSON 파싱
-                    json_str = script.string[array_start:array_end]
-                    brand_data = json.loads(json_str)
-                    
-                    print(f"[INFO] JavaScript에서 {len(brand_data)}개의 브랜드 데이터 발견")
-                    
-                    # 각 브랜드 데이터 파싱
-                    for brand_obj in brand_data:
-                        brand_info = self.parse_brand_element(brand_obj)
-                        if brand_info:
-                            brands.append(brand_info)
-                    
-                    break  # 데이터를 찾았으면 종료
-                    
-                except json.JSONDecodeError as e:
-                    print(f"[ERROR] JSON 파싱 실패: {e}")
-                    continue
-                except Exception as e:
-                    print(f"[ERROR] 데이터 추출 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+        """JavaScript에서 브랜드 데이터 추출 (이미 파싱한 DOM이 있을 때)"""
+        for script in soup.find_all('script'):
+            if script.string and 'brand_list' in script.string:
+                brand_data = extract_brand_list(script.string)
+                if brand_data is not None:
+                    return self.parse_brand_list(brand_data)
         
-        if not brands:
-            print("[WARNING] 브랜드 데이터를 찾지 못했습니다.")
+        logger.warning("브랜드 데이터를 찾지 못했습니다.")
+        return []
+    
+    def extract_brands_from_html(self, content: Union[bytes, str]) -> List[Dict]:
+        """페이지 원문에서 브랜드 데이터 추출 (DOM을 만들지 않음)"""
+        brand_data = extract_brand_list(content)
+        if brand_data is None:
+            logger.warning("브랜드 데이터를 찾지 못했습니다.")
+            return []
+        return self.parse_brand_list(brand_data)
+    
+    def parse_brand_list(self, brand_data: List[Dict]) -> List[Dict]:
+        """brand_list 배열을 브랜드 정보 리스트로 변환"""
+        logger.info("JavaScript에서 %d개의 브랜드 데이터 발견", len(brand_data))
         
+        brands = []
+        for brand_obj in brand_data:
+            brand_info = self.parse_brand_element(brand_obj)
+            if brand_info:
+                brands.append(brand_info)
         return brands
     
     def parse_brand_element(self, brand_obj: Dict) -> Dict:
@@ -160,7 +153,7 @@ class GDPPBrandCrawler:
                 "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S")
             }
         except Exception as e:
-            print(f"[ERROR] 브랜드 데이터 파싱 실패: {e}")
+            logger.error("브랜드 데이터 파싱 실패: %s", e)
             return None
     
     def save_to_json(self, data: List[Dict], filepath: str):
@@ -0,0 +1,281 @@
+# File: src/crawler/pipeline.py
+"""
+비동기 크롤링 파이프라인 - 브랜드/FAQ/위키피디아를 동시에 수집하여 JSONL로 스트리밍 저장
+- AsyncFetcher로 연결 재사용, 동시 요청 수 제한, 조건부 요청(바뀌지 않은 페이지는 304 + 로컬 캐시)
+- 파싱은 기존 크롤러의 추출 함수를 스레드에서 실행
+- 수집한 레코드는 바로 임시 파일에 한 줄씩 기록하고, 소스 전체가 성공하면 {output_dir}/{이름}.jsonl로 교체
+  (실패한 소스는 이전 출력 유지)
+
+사용법:
+    python src/crawler/pipeline.py                  # 전체 소스
+    python src/crawler/pipeline.py --sources brands faq --concurrency 8
+"""
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행 시)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+import httpx
+from bs4 import BeautifulSoup
+
+from src.crawler.faq_crawler import FAQCrawler
+from src.crawler.fetcher import AsyncFetcher
+from src.crawler.gdpp_crawler import GDPPBrandCrawler
+from src.crawler.wikipedia_crawler import CAT_PAGES
+from src.utils.logger import get_logger
+
+logger = get_logger("crawler.pipeline")
+
+
+# (URL, 쿼리 파라미터)
+Request = Tuple[str, Optional[Dict]]
+
+
+class BrandSource:
+    """GDPP 브랜드 페이지 (script 태그의 brand_list)"""
+
+    name = "brands"
+    output = "gdpp_brands"
+
+    def __init__(self, url: str = "https://gdppcat.com/brand"):
+        self.url = url
+        self.crawler = GDPPBrandCrawler()
+
+    def requests(self) -> List[Request]:
+        return [(self.url, None)]
+
+    def parse(self, url: str, content: bytes) -> List[Dict]:
+        return self.crawler.extract_brands_from_html(content)
+
+
+class FAQSource:
+    """캣페스타 방문객 FAQ 페이지"""
+
+    name = "faq"
+    output = "gdpp_faq"
+
+    def __init__(self, url: str = "https://catfesta.com/information/visitor-faq/"):
+        self.url = url
+        self.crawler = FAQCrawler()
+
+    def requests(self) -> List[Request]:
+        return [(self.url, None)]
+
+    def parse(self, url: str, content: bytes) -> List[Dict]:
+        return self.crawler.extract_faqs(BeautifulSoup(content, 'html.parser'))
+
+
+# wikipediaapi의 WIKI 형식 섹션 제목 패턴
+_WIKI_SECTION = re.compile(r"\n\n *(===*) (.*?) (===*) *\n")
+
+
+def format_wikipedia_extract(extract: str) -> Tuple[str, str]:
+    """
+    MediaWiki extracts(exsectionformat=wiki) 본문을 WikipediaCrawler와 같은 형식으로 변환
+    (요약 + "\\n\\n" + 섹션 제목 + "\\n" + 섹션 본문 ..., wikipediaapi의 page.text와 동일)
+
+    Args:
+        extract: API 응답의 extract 문자열
+
+    Returns:
+        (요약, 전체 텍스트)
+    """
+    matches = list(_WIKI_SECTION.finditer(extract))
+    if not matches:
+        summary = extract.strip()
+        return summary, summary
+
+    summary = extract[:matches[0].start()].strip()
+    parts = [summary + "\n\n" if summary else ""]
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(extract)
+        body = extract[match.end():end].strip()
+        parts.append(match.group(2).strip() + "\n" + body + ("\n\n" if body else ""))
+    return summary, "".join(parts).strip()
+
+
+class WikipediaSource:
+    """위키피디아 문서 (MediaWiki API, 문서당 요청 1회)"""
+
+    name = "wikipedia"
+    output = "wikipedia_cat_knowledge"
+
+    def __init__(self, titles: Optional[List[str]] = None, language: str = "ko"):
+        self.titles = titles or CAT_PAGES
+        self.api_url = f"https://{language}.wikipedia.org/w/api.php"
+
+    def requests(self) -> List[Request]:
+        return [
+            (self.api_url, {
+                "action": "query",
+                "format": "json",
+                "formatversion": "2",
+                "prop": "extracts|info|categories",
+                "explaintext": "1",
+                "exsectionformat": "wiki",
+                "inprop": "url",
+                "cllimit": "max",
+                "redirects": "1",
+                "titles": title
+            })
+            for title in self.titles
+        ]
+
+    def parse(self, url: str, content: bytes) -> List[Dict]:
+        records = []
+        for page in json.loads(content).get("query", {}).get("pages", []):
+            if page.get("missing") or not page.get("extract"):
+                logger.warning("위키피디아 페이지가 존재하지 않습니다: %s", page.get("title"))
+                continue
+            summary, text = format_wikipedia_extract(page["extract"])
+            records.append({
+                "title": page["title"],
+                "summary": summary,
+                "text": text,
+                "url": page.get("fullurl", ""),
+                "categories": [category["title"] for category in page.get("categories", [])]
+            })
+        return records
+
+
+SOURCES = {
+    "brands": BrandSource,
+    "faq": FAQSource,
+    "wikipedia": WikipediaSource
+}
+
+
+class JsonlWriter:
+    """레코드를 임시 파일에 한 줄씩 기록하고 commit() 시 대상 파일로 교체"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp_path = self.path.with_suffix(f".jsonl.tmp-{os.getpid()}")
+        self._file = open(self.tmp_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, record: Dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def commit(self):
+        """기록 완료 (대상 파일 교체)"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self.tmp_path.replace(self.path)
+
+    def discard(self):
+        """기록 취소 (기존 파일 유지)"""
+        self._file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+async def crawl_source(source, fetcher: AsyncFetcher, output_dir: str) -> Dict:
+    """
+    소스 하나의 모든 요청을 동시에 수집하여 JSONL로 저장
+
+    Args:
+        source: 크롤링 소스 (requests/parse 지원)
+        fetcher: 공유 HTTP 수집기
+        output_dir: 출력 디렉토리
+
+    Returns:
+        소스 통계 (requests, records, from_cache, errors, saved)
+    """
+    writer = JsonlWriter(Path(output_dir) / f"{source.output}.jsonl")
+    stats = {"requests": 0, "records": 0, "from_cache": 0, "errors": 0, "saved": False}
+
+    async def crawl_one(url: str, params: Optional[Dict]):
+        try:
+            result = await fetcher.fetch(url, params)
+            records = await asyncio.to_thread(source.parse, result["url"], result["content"])
+        except (httpx.HTTPError, ValueError) as e:
+            stats["errors"] += 1
+            logger.error("[%s] 수집 실패: %s - %s", source.name, url, e)
+            return
+        stats["requests"] += 1
+        stats["from_cache"] += result["from_cache"]
+        for record in records:
+            writer.write(record)
+        stats["records"] += len(records)
+
+    await asyncio.gather(*(crawl_one(url, params) for url, params in source.requests()))
+
+    if stats["errors"] or stats["records"] == 0:
+        writer.discard()
+        logger.warning("[%s] 수집 실패 또는 결과 없음 - 기존 출력 유지: %s", source.name, writer.path)
+    else:
+        writer.commit()
+        stats["saved"] = True
+        logger.info(
+            "[%s] %d개 레코드 저장: %s (요청 %d개, 캐시 사용 %d개)",
+            source.name, stats["records"], writer.path, stats["requests"], stats["from_cache"]
+        )
+    return stats
+
+
+async def run_pipeline(
+    sources: List,
+    output_dir: str = "./data/raw",
+    cache_dir: Optional[str] = "./data/cache/http",
+    max_concurrency: int = 4,
+    transport: Optional[httpx.AsyncBaseTransport] = None
+) -> Dict:
+    """
+    크롤링 파이프라인 실행 (소스끼리도 동시에 수집, 전체 동시 요청 수는 max_concurrency로 제한)
+
+    Args:
+        sources: 크롤링 소스 리스트
+        output_dir: JSONL 출력 디렉토리
+        cache_dir: HTTP 응답 캐시 디렉토리 (None이면 조건부 요청 미사용)
+        max_concurrency: 동시 요청 수
+        transport: httpx 전송 계층 (기록된 응답으로 테스트할 때 사용)
+
+    Returns:
+        {"sources": 소스별 통계, "fetcher": 요청 통계, "seconds": 소요 시간}
+    """
+    start = time.perf_counter()
+    async with AsyncFetcher(max_concurrency=max_concurrency, cache_dir=cache_dir, transport=transport) as fetcher:
+        results = await asyncio.gather(*(crawl_source(source, fetcher, output_dir) for source in sources))
+        return {
+            "sources": {source.name: stats for source, stats in zip(sources, results)},
+            "fetcher": dict(fetcher.stats),
+            "seconds": round(time.perf_counter() - start, 3)
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="비동기 크롤링 파이프라인")
+    parser.add_argument("--sources", nargs="+", choices=list(SOURCES), default=list(SOURCES), help="수집할 소스")
+    parser.add_argument("--output-dir", default="./data/raw", help="JSONL 출력 디렉토리")
+    parser.add_argument("--cache-dir", default="./data/cache/http", help="HTTP 응답 캐시 디렉토리 (빈 문자열이면 미사용)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 요청 수")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_pipeline(
+        [SOURCES[name]() for name in args.sources],
+        output_dir=args.output_dir,
+        cache_dir=args.cache_dir or None,
+        max_concurrency=args.concurrency
+    ))
+
+    print(f"\n[STATS] 수집 통계 ({report['seconds']}초)")
+    for name, stats in report['sources'].items():
+        status = "저장" if stats['saved'] else "실패 (기존 출력 유지)"
+        print(f"  - {name}: {stats['records']}개 레코드, 캐시 사용 {stats['from_cache']}/{stats['requests']}, {status}")
+    fetcher_stats = report['fetcher']
+    print(
+        f"  - HTTP: 요청 {fetcher_stats['requests']}회, 다운로드 {fetcher_stats['downloaded']}회 "
+        f"({fetcher_stats['bytes']:,} bytes), 304 {fetcher_stats['not_modified']}회, 오류 {fetcher_stats['errors']}회"
+    )
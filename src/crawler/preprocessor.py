@@ -8,6 +8,28 @@ from pathlib import Path
 import re
 
 
+def load_records(input_file: str) -> List[Dict]:
+    """
+    원시 데이터 로드 (.jsonl: 한 줄에 레코드 하나, 그 외: JSON 리스트)
+
+    Args:
+        input_file: 원시 데이터 파일 경로
+
+    Returns:
+        레코드 리스트
+    """
+    with open(input_file, 'r', encoding='utf-8') as f:
+        if Path(input_file).suffix == '.jsonl':
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def resolve_raw_file(raw_dir: str, name: str) -> str:
+    """크롤링 파이프라인 출력(.jsonl)이 있으면 우선 사용, 없으면 기존 .json"""
+    jsonl_file = Path(raw_dir) / f"{name}.jsonl"
+    return str(jsonl_file) if jsonl_file.exists() else str(Path(raw_dir) / f"{name}.json")
+
+
 class DataPreprocessor:
     """데이터 전처리 및 Semantic Chunking"""
     
@@ -134,8 +156,7 @@ class DataPreprocessor:
         """위키피디아 데이터 전처리"""
         print(f"[INFO] 위키피디아 데이터 처리 중: {input_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            pages = json.load(f)
+        pages = load_records(input_file)
         
         all_chunks = []
         for page in pages:
@@ -149,8 +170,7 @@ class DataPreprocessor:
         """브랜드 데이터 전처리"""
         print(f"[INFO] 브랜드 데이터 처리 중: {input_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            brands = json.load(f)
+        brands = load_records(input_file)
         
         chunks = [self.chunk_brand_data(brand) for brand in brands]
         
@@ -230,8 +250,7 @@ class DataPreprocessor:
         """FAQ 데이터 전처리"""
         print(f"[INFO] FAQ 데이터 처리 중: {input_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            faqs = json.load(f)
+        faqs = load_records(input_file)
         
         chunks = [self.chunk_faq_data(faq) for faq in faqs]
         
@@ -242,8 +261,7 @@ class DataPreprocessor:
         """이벤트 정보 전처리"""
         print(f"[INFO] 이벤트 정보 처리 중: {input_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            event_data = json.load(f)
+        event_data = load_records(input_file)
         
         all_chunks = []
         for event_info in event_data:
@@ -285,16 +303,16 @@ if __name__ == "__main__":
     preprocessor = DataPreprocessor(max_chunk_length=512)
     
     # 위키피디아 데이터 처리
-    wiki_chunks = preprocessor.process_wikipedia_data("data/raw/wikipedia_cat_knowledge.json")
+    wiki_chunks = preprocessor.process_wikipedia_data(resolve_raw_file("data/raw", "wikipedia_cat_knowledge"))
     
     # 브랜드 데이터 처리
-    brand_chunks = preprocessor.process_brand_data("data/raw/gdpp_brands.json")
+    brand_chunks = preprocessor.process_brand_data(resolve_raw_file("data/raw", "gdpp_brands"))
     
     # FAQ 데이터 처리
-    faq_chunks = preprocessor.process_faq_data("data/raw/gdpp_faq.json")
+    faq_chunks = preprocessor.process_faq_data(resolve_raw_file("data/raw", "gdpp_faq"))
     
     # 이벤트 정보 처리
-    event_chunks = preprocessor.process_event_info("data/raw/gdpp_event_info.json")
+    event_chunks = preprocessor.process_event_info(resolve_raw_file("data/raw", "gdpp_event_info"))
     
     # 통합
     all_chunks = wiki_chunks + brand_chunks + faq_chunks + event_chunks
@@ -9,6 +9,31 @@ from pathlib import Path
 import time
 
 
+# 크롤링할 주요 페이지 목록
+CAT_PAGES = [
+    "고양이",
+    "고양이의 행동",
+    "고양이 품종",
+    "페르시안 고양이",
+    "샴 고양이",
+    "러시안 블루",
+    "메인쿤",
+    "브리티시 쇼트헤어",
+    "스코티시 폴드",
+    "벵골 고양이",
+    "고양이 사료",
+    "고양이 건강",
+    "고양이 영양",
+    "반려동물",
+    "고양이 훈련",
+    "고양이 털",
+    "고양이 발톱",
+    "캣닢",
+    "고양이 모래",
+    "고양이 장난감"
+]
+
+
 class WikipediaCrawler:
     """위키피디아에서 고양이 관련 지식 크롤링"""
     
@@ -37,30 +62,7 @@ class WikipediaCrawler:
     def crawl_cat_knowledge(self) -> List[Dict]:
         """고양이 관련 주요 페이지 크롤링"""
         
-        # 크롤링할 주요 페이지 목록
-        cat_pages = [
-            "고양이",
-            "고양이의 행동",
-            "고양이 품종",
-            "페르시안 고양이",
-            "샴 고양이",
-            "러시안 블루",
-            "메인쿤",
-            "브리티시 쇼트헤어",
-            "스코티시 폴드",
-            "벵골 고양이",
-            "고양이 사료",
-            "고양이 건강",
-            "고양이 영양",
-            "반려동물",
-            "고양이 훈련",
-            "고양이 털",
-            "고양이 발톱",
-            "캣닢",
-            "고양이 모래",
-            "고양이 장난감"
-        ]
-        
+        cat_pages = CAT_PAGES
         all_data = []
         
         print(f"[INFO] 위키피디아 크롤링 시작 ({len(cat_pages)}개 페이지)")
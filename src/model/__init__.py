@@ -2,7 +2,8 @@
 """
 모델 모듈 초기화
 """
-from .ollama_client import OllamaClient
+from .ollama_client import OllamaClient, AsyncOllamaClient
 from .prompt_template import PromptTemplate, create_chat_prompt
+from .scheduler import LLMScheduler
 
-__all__ = ['OllamaClient', 'PromptTemplate', 'create_chat_prompt']
+__all__ = ['OllamaClient', 'AsyncOllamaClient', 'PromptTemplate', 'create_chat_prompt', 'LLMScheduler']
@@ -1,28 +1,113 @@
 # File: src/model/ollama_client.py
 """
 Ollama API 클라이언트
+동기(requests.Session)/비동기(httpx.AsyncClient) 모두 keep-alive 연결 풀을 재사용
 """
+import asyncio
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+import httpx
 import json
-from typing import Generator, Dict, List, Optional
+from typing import AsyncGenerator, Generator, Dict, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("model.ollama")
+
+
+# 스트리밍 마지막 응답(done=true)에 포함되는 생성 통계 (시간 단위: ns)
+OLLAMA_STATS_FIELDS = ("eval_count", "eval_duration", "prompt_eval_count", "prompt_eval_duration", "total_duration")
+
+
+def build_generate_payload(
+    model: str,
+    prompt: str,
+    system: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    stream: bool
+) -> Dict:
+    """/api/generate 요청 본문 생성"""
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "stream": stream,
+        "options": {
+            "temperature": temperature,
+            "num_predict": max_tokens
+        }
+    }
+    
+    if system:
+        payload["system"] = system
+    
+    return payload
+
+
+def build_chat_payload(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int
+) -> Dict:
+    """/api/chat 요청 본문 생성"""
+    return {
+        "model": model,
+        "messages": messages,
+        "stream": False,
+        "options": {
+            "temperature": temperature,
+            "num_predict": max_tokens
+        }
+    }
 
 
 class OllamaClient:
-    """Ollama API 클라이언트"""
+    """Ollama API 클라이언트 (requests.Session 연결 풀)"""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "eeve-korean-10.8b:latest"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "eeve-korean-10.8b:latest",
+        connect_timeout: float = 5.0,
+        read_timeout: float = 600.0,
+        max_connections: int = 10,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Args:
             base_url: Ollama API 서버 URL
             model: 사용할 모델 이름
+            connect_timeout: 연결 타임아웃(초)
+            read_timeout: 응답 대기 타임아웃(초)
+            max_connections: 연결 풀 크기
+            max_concurrency: 동시 생성 요청 수 제한 (None이면 제한 없음)
         """
         self.base_url = base_url
         self.model = model
+        self.timeout = (connect_timeout, read_timeout)
         
+        # keep-alive 연결 재사용
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+    
+    def _acquire(self):
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+    
+    def _release(self):
+        if self._semaphore is not None:
+            self._semaphore.release()
+    
     def check_connection(self) -> bool:
         """Ollama 서버 연결 확인"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=self.timeout[0])
             return response.status_code == 200
         except:
             return False
@@ -30,12 +115,12 @@ class OllamaClient:
     def list_models(self) -> List[Dict]:
         """사용 가능한 모델 목록 조회"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags")
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=self.timeout)
             if response.status_code == 200:
                 return response.json().get('models', [])
             return []
         except Exception as e:
-            print(f"[ERROR] 모델 목록 조회 실패: {e}")
+            logger.exception("모델 목록 조회 실패: %s", e)
             return []
     
     def generate(
@@ -53,33 +138,24 @@ class OllamaClient:
             system: 시스템 프롬프트
             temperature: 온도 (0.0 ~ 1.0)
             max_tokens: 최대 토큰 수
-            
+        
         Returns:
             생성된 텍스트
         """
         url = f"{self.base_url}/api/generate"
+        payload = build_generate_payload(self.model, prompt, system, temperature, max_tokens, stream=False)
         
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
-        }
-        
-        if system:
-            payload["system"] = system
-        
+        self._acquire()
         try:
-            response = requests.post(url, json=payload, timeout=600)
+            response = self.session.post(url, json=payload, timeout=self.timeout)
             if response.status_code == 200:
                 return response.json()['response']
             else:
                 return f"[ERROR] API 호출 실패: {response.status_code}"
         except Exception as e:
             return f"[ERROR] {str(e)}"
+        finally:
+            self._release()
     
     def generate_stream(
         self,
@@ -96,44 +172,239 @@ class OllamaClient:
             system: 시스템 프롬프트
             temperature: 온도 (0.0 ~ 1.0)
             max_tokens: 최대 토큰 수
-            
+        
         Yields:
             생성된 텍스트 청크
         """
         url = f"{self.base_url}/api/generate"
+        payload = build_generate_payload(self.model, prompt, system, temperature, max_tokens, stream=True)
         
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": True,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
-        }
+        self._acquire()
+        try:
+            with self.session.post(url, json=payload, stream=True, timeout=self.timeout) as response:
+                if response.status_code == 200:
+                    for line in response.iter_lines():
+                        if line:
+                            try:
+                                data = json.loads(line)
+                                if 'response' in data:
+                                    yield data['response']
+                            except json.JSONDecodeError:
+                                continue
+                else:
+                    yield f"[ERROR] API 호출 실패: {response.status_code}"
+        
+        except Exception as e:
+            yield f"[ERROR] {str(e)}"
+        finally:
+            self._release()
+    
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> str:
+        """
+        채팅 형식으로 텍스트 생성
+        
+        Args:
+            messages: 메시지 리스트 [{"role": "user", "content": "..."}]
+            temperature: 온도
+            max_tokens: 최대 토큰 수
+        
+        Returns:
+            생성된 텍스트
+        """
+        url = f"{self.base_url}/api/chat"
+        payload = build_chat_payload(self.model, messages, temperature, max_tokens)
+        
+        self._acquire()
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+            if response.status_code == 200:
+                return response.json()['message']['content']
+            else:
+                return f"[ERROR] API 호출 실패: {response.status_code}"
+        except Exception as e:
+            return f"[ERROR] {str(e)}"
+        finally:
+            self._release()
+    
+    def close(self):
+        """연결 풀 종료"""
+        self.session.close()
+
+
+class AsyncOllamaClient:
+    """
+    비동기 Ollama API 클라이언트 (httpx.AsyncClient 연결 풀)
+    생성 대기 중에도 이벤트 루프를 막지 않음
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "eeve-korean-10.8b:latest",
+        connect_timeout: float = 5.0,
+        read_timeout: float = 600.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Args:
+            base_url: Ollama API 서버 URL
+            model: 사용할 모델 이름
+            connect_timeout: 연결 타임아웃(초)
+            read_timeout: 응답 대기 타임아웃(초)
+            max_connections: 최대 동시 연결 수
+            max_keepalive_connections: 유지할 keep-alive 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간(초)
+            max_concurrency: 동시 생성 요청 수 제한 (None이면 제한 없음)
+        """
+        self.base_url = base_url
+        self.model = model
+        self.timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_concurrency = max_concurrency
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (최초 사용 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits
+            )
+        return self._client
+    
+    @property
+    def semaphore(self) -> Optional[asyncio.Semaphore]:
+        """동시 생성 제한 세마포어 (최초 사용 시 생성)"""
+        if self.max_concurrency and self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def _acquire(self):
+        if self.semaphore is not None:
+            await self.semaphore.acquire()
+    
+    def _release(self):
+        if self._semaphore is not None:
+            self._semaphore.release()
+    
+    async def check_connection(self) -> bool:
+        """Ollama 서버 연결 확인"""
+        try:
+            response = await self.client.get("/api/tags", timeout=self.timeout.connect)
+            return response.status_code == 200
+        except Exception:
+            return False
+    
+    async def list_models(self) -> List[Dict]:
+        """사용 가능한 모델 목록 조회"""
+        try:
+            response = await self.client.get("/api/tags")
+            if response.status_code == 200:
+                return response.json().get('models', [])
+            return []
+        except Exception as e:
+            logger.exception("모델 목록 조회 실패: %s", e)
+            return []
+    
+    async def generate(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ) -> str:
+        """
+        텍스트 생성 (비스트리밍)
         
-        if system:
-            payload["system"] = system
+        Args:
+            prompt: 사용자 프롬프트
+            system: 시스템 프롬프트
+            temperature: 온도 (0.0 ~ 1.0)
+            max_tokens: 최대 토큰 수
         
+        Returns:
+            생성된 텍스트
+        """
+        payload = build_generate_payload(self.model, prompt, system, temperature, max_tokens, stream=False)
+        
+        await self._acquire()
         try:
-            response = requests.post(url, json=payload, stream=True, timeout=600)
-            
+            response = await self.client.post("/api/generate", json=payload)
             if response.status_code == 200:
-                for line in response.iter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            if 'response' in data:
-                                yield data['response']
-                        except json.JSONDecodeError:
-                            continue
+                return response.json()['response']
             else:
-                yield f"[ERROR] API 호출 실패: {response.status_code}"
+                return f"[ERROR] API 호출 실패: {response.status_code}"
+        except httpx.TimeoutException:
+            return "[ERROR] Ollama 응답 시간 초과"
+        except Exception as e:
+            return f"[ERROR] {str(e)}"
+        finally:
+            self._release()
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 512,
+        stats: Optional[Dict] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        텍스트 생성 (스트리밍)
+        
+        Args:
+            prompt: 사용자 프롬프트
+            system: 시스템 프롬프트
+            temperature: 온도 (0.0 ~ 1.0)
+            max_tokens: 최대 토큰 수
+            stats: 전달하면 마지막 응답의 통계(eval_count, eval_duration 등)를 채움
+        
+        Yields:
+            생성된 텍스트 청크
+        """
+        payload = build_generate_payload(self.model, prompt, system, temperature, max_tokens, stream=True)
+        
+        await self._acquire()
+        try:
+            async with self.client.stream("POST", "/api/generate", json=payload) as response:
+                if response.status_code != 200:
+                    yield f"[ERROR] API 호출 실패: {response.status_code}"
+                    return
                 
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if data.get('response'):
+                        yield data['response']
+                    if data.get('done') and stats is not None:
+                        stats.update({key: data[key] for key in OLLAMA_STATS_FIELDS if key in data})
+        except httpx.TimeoutException:
+            yield "[ERROR] Ollama 응답 시간 초과"
         except Exception as e:
             yield f"[ERROR] {str(e)}"
+        finally:
+            self._release()
     
-    def chat(
+    async def chat(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
@@ -146,30 +417,31 @@ class OllamaClient:
             messages: 메시지 리스트 [{"role": "user", "content": "..."}]
             temperature: 온도
             max_tokens: 최대 토큰 수
-            
+        
         Returns:
             생성된 텍스트
         """
-        url = f"{self.base_url}/api/chat"
-        
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
-        }
+        payload = build_chat_payload(self.model, messages, temperature, max_tokens)
         
+        await self._acquire()
         try:
-            response = requests.post(url, json=payload, timeout=600)
+            response = await self.client.post("/api/chat", json=payload)
             if response.status_code == 200:
                 return response.json()['message']['content']
             else:
                 return f"[ERROR] API 호출 실패: {response.status_code}"
+        except httpx.TimeoutException:
+            return "[ERROR] Ollama 응답 시간 초과"
         except Exception as e:
             return f"[ERROR] {str(e)}"
+        finally:
+            self._release()
+    
+    async def aclose(self):
+        """HTTP 클라이언트 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+# File: src/model/scheduler.py
+"""
+LLM 요청 스케줄러 - 동시 생성 슬롯 제한, 우선순위 대기열, 대기열 초과 시 즉시 거절
+Ollama(CPU)가 동시에 처리할 수 있는 생성 수만큼만 요청을 보내고 나머지는 대기열에서 순서대로 처리
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class SchedulerRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 요청을 받을 수 없음"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class LLMSlot:
+    """할당된 생성 슬롯 (release는 여러 번 호출해도 한 번만 반환)"""
+
+    def __init__(self, scheduler: "LLMScheduler"):
+        self.scheduler = scheduler
+        self.acquired_at = time.monotonic()
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.scheduler._release(time.monotonic() - self.acquired_at)
+
+    async def __aenter__(self) -> "LLMSlot":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class LLMScheduler:
+    """
+    동시 생성 슬롯 + 우선순위 FIFO 대기열
+    로그인 사용자 요청은 우선 대기열에서 먼저 슬롯을 받고, 같은 대기열 안에서는 도착 순서대로 처리
+    """
+
+    def __init__(
+        self,
+        slots: int = 2,
+        max_queue: int = 16,
+        queue_timeout: Optional[float] = 120.0,
+        initial_service_time: float = 10.0,
+        wait_window: int = 1000
+    ):
+        """
+        Args:
+            slots: 동시 생성 수
+            max_queue: 최대 대기 요청 수 (초과 시 즉시 거절)
+            queue_timeout: 최대 대기 시간(초), None이면 무제한
+            initial_service_time: 생성 1건 소요 시간 초기 추정값(초, Retry-After 계산용)
+            wait_window: 대기 시간 백분위 계산에 사용할 최근 요청 수
+        """
+        if slots <= 0:
+            raise ValueError("slots는 1 이상이어야 합니다")
+        self.slots = slots
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self.active = 0
+        self._priority: Deque[asyncio.Future] = deque()
+        self._normal: Deque[asyncio.Future] = deque()
+
+        # 생성 1건 소요 시간 지수 이동 평균
+        self.service_time = initial_service_time
+
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=wait_window)
+
+    @property
+    def queued(self) -> int:
+        return len(self._priority) + len(self._normal)
+
+    def retry_after(self) -> int:
+        """대기열이 비기까지 예상 시간(초)"""
+        return max(1, math.ceil(self.service_time * (self.queued + 1) / self.slots))
+
+    def check_admission(self):
+        """
+        대기열 여유 확인 (검색 등 선행 작업 전에 빠르게 거절하기 위함)
+
+        Raises:
+            SchedulerRejected: 대기열이 가득 찬 경우
+        """
+        if self.active >= self.slots and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise SchedulerRejected("LLM 대기열이 가득 찼습니다", self.retry_after())
+
+    async def acquire(self, priority: bool = False) -> LLMSlot:
+        """
+        생성 슬롯 획득 (빈 슬롯이 없으면 대기열에서 순서를 기다림)
+
+        Args:
+            priority: 우선 대기열 사용 여부 (로그인 사용자)
+
+        Returns:
+            LLMSlot (async with 또는 release()로 반환)
+
+        Raises:
+            SchedulerRejected: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        if self.active < self.slots and self.queued == 0:
+            self.active += 1
+            self._record_wait(0.0)
+            return LLMSlot(self)
+
+        self.check_admission()
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._priority if priority else self._normal
+        queue.append(waiter)
+        started = time.monotonic()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if not self._abandon(waiter, queue):
+                # 타임아웃 직전에 슬롯을 받은 경우 그대로 사용
+                self._record_wait(time.monotonic() - started)
+                return LLMSlot(self)
+            self.timed_out += 1
+            raise SchedulerRejected("LLM 대기 시간이 초과되었습니다", self.retry_after())
+        except BaseException:
+            if not self._abandon(waiter, queue):
+                self._release(None)
+            raise
+
+        self._record_wait(time.monotonic() - started)
+        return LLMSlot(self)
+
+    def _abandon(self, waiter: asyncio.Future, queue: Deque[asyncio.Future]) -> bool:
+        """대기 취소 (이미 슬롯을 받았으면 False)"""
+        if waiter.done():
+            return False
+        waiter.cancel()
+        queue.remove(waiter)
+        return True
+
+    def _release(self, service_time: Optional[float]):
+        if service_time is not None:
+            self.service_time = 0.8 * self.service_time + 0.2 * service_time
+
+        # 슬롯을 반환하지 않고 다음 대기 요청에 바로 넘김
+        for queue in (self._priority, self._normal):
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self.active -= 1
+
+    def _record_wait(self, wait: float):
+        self.admitted += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self._recent_waits.append(wait)
+
+    def stats(self) -> Dict:
+        """스케줄러 통계 반환"""
+        waits = sorted(self._recent_waits)
+
+        def percentile(p: float) -> float:
+            if not waits:
+                return 0.0
+            return waits[min(len(waits) - 1, int(round(p * (len(waits) - 1))))]
+
+        return {
+            "slots": self.slots,
+            "active": self.active,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "service_time_estimate": round(self.service_time, 3),
+            "queue_wait": {
+                "avg": self.total_wait / self.admitted if self.admitted else 0.0,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": self.max_wait
+            }
+        }
@@ -4,5 +4,6 @@ RAG 모듈 초기화
 """
 from .embedder import KoSBERTEmbedder
 from .vector_store import VectorStore
+from .numpy_vector_store import NumpyVectorStore
 
-__all__ = ['KoSBERTEmbedder', 'VectorStore']
+__all__ = ['KoSBERTEmbedder', 'VectorStore', 'NumpyVectorStore']
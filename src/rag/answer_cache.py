@@ -0,0 +1,169 @@
+# File: src/rag/answer_cache.py
+"""
+시맨틱 응답 캐시 모듈 - 비슷한 질문에 대한 LLM 응답 재사용
+검색된 청크 ID와 생성 파라미터가 같고 쿼리 임베딩의 코사인 유사도가 임계값 이상이면 캐시 히트
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import numpy as np
+
+
+class SemanticAnswerCache:
+    """쿼리 임베딩 유사도 기반 LLM 응답 캐시 (LRU, 선택적 TTL)"""
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        similarity_threshold: float = 0.95,
+        ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            similarity_threshold: 캐시 히트로 판단할 최소 코사인 유사도
+            ttl: 항목 유효 시간(초), None이면 만료 없음
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다")
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.version: Optional[str] = None
+
+        # 항목 ID → (그룹 키, 정규화 임베딩, 응답, 만료 시각)
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        # 그룹 키(청크 ID, 생성 파라미터) → 항목 ID 리스트
+        self._groups: Dict[Hashable, List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(chunk_ids: List[str], **params) -> Tuple:
+        """검색된 청크 ID와 생성 파라미터로 그룹 키 생성"""
+        return tuple(chunk_ids), tuple(sorted(params.items()))
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def check_version(self, version: Optional[str]):
+        """
+        코퍼스 버전 확인 (벡터 DB가 재구축되어 버전이 바뀌면 전체 무효화)
+
+        Args:
+            version: 현재 코퍼스 버전 (HybridRetriever.current_version, 부수 효과 없는 조회)
+        """
+        with self._lock:
+            if version == self.version:
+                return
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._groups.clear()
+            self.version = version
+
+    def get(self, embedding: np.ndarray, key: Hashable) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            embedding: 쿼리 임베딩
+            key: make_key로 만든 그룹 키
+
+        Returns:
+            캐시된 응답 (없으면 None)
+        """
+        query = self._normalize(embedding)
+        now = time.monotonic()
+
+        with self._lock:
+            entry_ids = [
+                entry_id for entry_id in list(self._groups.get(key, ()))
+                if not self._expired(entry_id, now)
+            ]
+            if not entry_ids:
+                self.misses += 1
+                return None
+
+            matrix = np.stack([self._entries[entry_id][1] for entry_id in entry_ids])
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                self.misses += 1
+                return None
+
+            entry_id = entry_ids[best]
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            return self._entries[entry_id][2]
+
+    def set(self, embedding: np.ndarray, key: Hashable, value: Any):
+        """
+        캐시 저장
+
+        Args:
+            embedding: 쿼리 임베딩
+            key: make_key로 만든 그룹 키
+            value: 저장할 응답
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (key, self._normalize(embedding), value, expires_at)
+            self._groups.setdefault(key, []).append(entry_id)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _expired(self, entry_id: int, now: float) -> bool:
+        expires_at = self._entries[entry_id][3]
+        if expires_at is not None and expires_at < now:
+            self._remove(entry_id)
+            return True
+        return False
+
+    def _remove(self, entry_id: int):
+        key = self._entries.pop(entry_id)[0]
+        group = self._groups[key]
+        group.remove(entry_id)
+        if not group:
+            del self._groups[key]
+
+    def clear(self):
+        """전체 항목 삭제 (통계는 유지)"""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._groups.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "similarity_threshold": self.similarity_threshold,
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0
+            }
@@ -0,0 +1,313 @@
+# File: src/rag/bm25.py
+"""
+BM25 검색 엔진 - CSR 형태의 역색인(term → postings) 기반
+쿼리 단어가 포함된 문서만 점수를 계산하고 argpartition으로 상위 k개 선택
+"""
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+import json
+import numpy as np
+
+
+# 역색인 배열 파일 (np.load mmap_mode로 열림)
+INDEX_ARRAYS = ["indptr", "postings", "weights", "idf", "doc_lengths"]
+
+
+class BM25Index:
+    """NumPy 역색인 기반 BM25 (Okapi) 검색 엔진"""
+
+    def __init__(
+        self,
+        vocab: Dict[str, int],
+        indptr: np.ndarray,
+        postings: np.ndarray,
+        weights: np.ndarray,
+        idf: np.ndarray,
+        doc_lengths: np.ndarray,
+        k1: float = 1.5,
+        b: float = 0.75
+    ):
+        """
+        Args:
+            vocab: 단어 → 단어 ID
+            indptr: 단어별 postings 시작 위치 (shape: [n_terms + 1])
+            postings: 문서 ID 배열 (shape: [nnz])
+            weights: 사전 계산된 단어-문서 BM25 가중치 (shape: [nnz])
+            idf: 단어별 IDF (shape: [n_terms])
+            doc_lengths: 문서별 토큰 수 (shape: [n_docs])
+            k1: BM25 k1 파라미터
+            b: BM25 b 파라미터
+        """
+        self.vocab = vocab
+        self.indptr = indptr
+        self.postings = postings
+        self.weights = weights
+        self.idf = idf
+        self.doc_lengths = doc_lengths
+        self.k1 = k1
+        self.b = b
+
+    @property
+    def num_docs(self) -> int:
+        return len(self.doc_lengths)
+
+    @classmethod
+    def build(cls, tokenized_docs: List[List[str]], k1: float = 1.5, b: float = 0.75) -> "BM25Index":
+        """
+        토큰화된 문서로 역색인 구축
+
+        Args:
+            tokenized_docs: 문서별 토큰 리스트
+            k1: BM25 k1 파라미터
+            b: BM25 b 파라미터
+
+        Returns:
+            BM25Index
+        """
+        vocab: Dict[str, int] = {}
+        term_ids = []
+        doc_ids = []
+        term_freqs = []
+
+        for doc_id, tokens in enumerate(tokenized_docs):
+            for term, tf in Counter(tokens).items():
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                doc_ids.append(doc_id)
+                term_freqs.append(tf)
+
+        n_docs = len(tokenized_docs)
+        n_terms = len(vocab)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        doc_ids = np.asarray(doc_ids, dtype=np.int32)
+        term_freqs = np.asarray(term_freqs, dtype=np.float32)
+        doc_lengths = np.asarray([len(tokens) for tokens in tokenized_docs], dtype=np.int32)
+
+        # 단어 ID 기준 정렬 → CSR (stable 정렬로 postings 내 문서 ID 오름차순 유지)
+        order = np.argsort(term_ids, kind="stable")
+        term_ids = term_ids[order]
+        doc_ids = doc_ids[order]
+        term_freqs = term_freqs[order]
+
+        df = np.bincount(term_ids, minlength=n_terms)
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+
+        # IDF (음수가 되지 않는 Lucene 방식)
+        # rank_bm25 BM25Okapi의 log((N - df + 0.5) / (df + 0.5))와 달리 흔한 단어도 양수 IDF를 가져 점수/순위가 다를 수 있음
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+        # 단어-문서 가중치 사전 계산: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+        avgdl = float(doc_lengths.mean()) if n_docs else 0.0
+        dl = doc_lengths[doc_ids].astype(np.float32)
+        norm = k1 * (1.0 - b + b * dl / avgdl) if avgdl > 0 else np.full_like(dl, k1)
+        weights = idf[term_ids] * term_freqs * (k1 + 1.0) / (term_freqs + norm)
+
+        return cls(
+            vocab=vocab,
+            indptr=indptr,
+            postings=doc_ids,
+            weights=weights.astype(np.float32),
+            idf=idf,
+            doc_lengths=doc_lengths,
+            k1=k1,
+            b=b
+        )
+
+    def save(self, directory: str):
+        """
+        역색인을 디렉토리에 저장 (배열별 .npy + 단어 사전)
+
+        Args:
+            directory: 저장 디렉토리
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+
+        for name in INDEX_ARRAYS:
+            np.save(path / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+
+        # 단어 ID 순서대로 저장
+        terms = [None] * len(self.vocab)
+        for term, term_id in self.vocab.items():
+            terms[term_id] = term
+        with open(path / "vocab.json", 'w', encoding='utf-8') as f:
+            json.dump({"k1": self.k1, "b": self.b, "terms": terms}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "BM25Index":
+        """
+        저장된 역색인 로드
+
+        Args:
+            directory: 저장 디렉토리
+            mmap: True면 배열을 메모리 맵으로 열어 프로세스 간 페이지 캐시 공유
+
+        Returns:
+            BM25Index
+        """
+        path = Path(directory)
+        mmap_mode = "r" if mmap else None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode) for name in INDEX_ARRAYS}
+
+        with open(path / "vocab.json", 'r', encoding='utf-8') as f:
+            vocab_data = json.load(f)
+        vocab = {term: term_id for term_id, term in enumerate(vocab_data["terms"])}
+
+        return cls(
+            vocab=vocab,
+            indptr=arrays["indptr"],
+            postings=arrays["postings"],
+            weights=arrays["weights"],
+            idf=arrays["idf"],
+            doc_lengths=arrays["doc_lengths"],
+            k1=vocab_data["k1"],
+            b=vocab_data["b"]
+        )
+
+    def _query_terms(self, query_tokens: List[str]) -> List[Tuple[int, int]]:
+        """쿼리 토큰을 (단어 ID, 쿼리 내 빈도)로 변환 (사전에 없는 단어 제외)"""
+        return [
+            (self.vocab[term], qtf)
+            for term, qtf in Counter(query_tokens).items()
+            if term in self.vocab
+        ]
+
+    def score_candidates(self, query_tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        쿼리 단어를 포함한 문서만 점수 계산
+
+        Args:
+            query_tokens: 토큰화된 쿼리
+
+        Returns:
+            (후보 문서 ID 배열, 후보 문서 점수 배열)
+        """
+        terms = self._query_terms(query_tokens)
+        if not terms:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+
+        doc_parts = []
+        weight_parts = []
+        for term_id, qtf in terms:
+            start, end = self.indptr[term_id], self.indptr[term_id + 1]
+            doc_parts.append(self.postings[start:end])
+            weight_parts.append(self.weights[start:end] * qtf if qtf > 1 else self.weights[start:end])
+
+        doc_ids = np.concatenate(doc_parts)
+        weights = np.concatenate(weight_parts)
+
+        # 후보 문서별 점수 합산
+        candidates, inverse = np.unique(doc_ids, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights).astype(np.float32)
+        return candidates, scores
+
+    def get_scores(self, query_tokens: List[str]) -> np.ndarray:
+        """전체 문서에 대한 BM25 점수 (shape: [n_docs])"""
+        scores = np.zeros(self.num_docs, dtype=np.float32)
+        candidates, candidate_scores = self.score_candidates(query_tokens)
+        scores[candidates] = candidate_scores
+        return scores
+
+    def top_k(self, query_tokens: List[str], k: int = 10) -> List[Tuple[int, float]]:
+        """
+        상위 k개 문서 검색
+
+        Args:
+            query_tokens: 토큰화된 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서 ID, 점수) 리스트 (점수 내림차순, 점수 > 0)
+        """
+        candidates, scores = self.score_candidates(query_tokens)
+        return select_top_k(candidates, scores, k)
+
+    def get_scores_batch(self, query_tokens_list: List[List[str]]) -> np.ndarray:
+        """
+        여러 쿼리의 BM25 점수를 한 번에 계산
+
+        모든 쿼리의 (쿼리, 문서, 가중치) postings를 이어 붙인 뒤
+        bincount 한 번으로 [n_queries, n_docs] 점수 행렬에 누적
+
+        Args:
+            query_tokens_list: 쿼리별 토큰 리스트
+
+        Returns:
+            점수 행렬 (shape: [n_queries, n_docs])
+        """
+        n_queries = len(query_tokens_list)
+        n_docs = self.num_docs
+
+        query_parts = []
+        doc_parts = []
+        weight_parts = []
+        for query_idx, query_tokens in enumerate(query_tokens_list):
+            for term_id, qtf in self._query_terms(query_tokens):
+                start, end = self.indptr[term_id], self.indptr[term_id + 1]
+                query_parts.append(np.full(end - start, query_idx, dtype=np.int64))
+                doc_parts.append(self.postings[start:end])
+                weight_parts.append(self.weights[start:end] * qtf if qtf > 1 else self.weights[start:end])
+
+        if not doc_parts:
+            return np.zeros((n_queries, n_docs), dtype=np.float32)
+
+        flat_index = np.concatenate(query_parts) * n_docs + np.concatenate(doc_parts)
+        scores = np.bincount(
+            flat_index,
+            weights=np.concatenate(weight_parts),
+            minlength=n_queries * n_docs
+        )
+        return scores.reshape(n_queries, n_docs).astype(np.float32)
+
+    def top_k_batch(
+        self,
+        query_tokens_list: List[List[str]],
+        k: int = 10,
+        batch_size: int = 256
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        여러 쿼리의 상위 k개 문서 검색
+
+        Args:
+            query_tokens_list: 쿼리별 토큰 리스트
+            k: 쿼리별 반환할 문서 수
+            batch_size: 점수 행렬을 만들 쿼리 묶음 크기 (메모리 사용량 제한)
+
+        Returns:
+            쿼리별 (문서 ID, 점수) 리스트
+        """
+        results = []
+        for start in range(0, len(query_tokens_list), batch_size):
+            scores = self.get_scores_batch(query_tokens_list[start:start + batch_size])
+            results.extend(select_top_k_rows(scores, k))
+        return results
+
+
+def select_top_k_rows(scores: np.ndarray, k: int) -> List[List[Tuple[int, float]]]:
+    """점수 행렬의 행별 상위 k개 선택 (점수 > 0)"""
+    n_rows, n_cols = scores.shape
+    if k <= 0 or n_cols == 0:
+        return [[] for _ in range(n_rows)]
+
+    doc_ids = np.arange(n_cols)
+    return [select_top_k(doc_ids, row, k) for row in scores]
+
+
+def select_top_k(candidates: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    """
+    argpartition으로 상위 k개 선택 후 해당 구간만 정렬
+    동점은 문서 번호 순으로 정렬하여 단일/배치 검색의 순위가 항상 같도록 함
+    """
+    if k <= 0 or len(candidates) == 0:
+        return []
+
+    if len(candidates) > k:
+        # k번째 점수와 같은 동점 문서까지 모두 후보에 포함
+        kth = np.partition(-scores, k - 1)[k - 1]
+        top = np.flatnonzero(-scores <= kth)
+    else:
+        top = np.arange(len(candidates))
+    top = top[np.lexsort((candidates[top], -scores[top]))][:k]
+
+    return [(int(candidates[i]), float(scores[i])) for i in top if scores[i] > 0]
@@ -0,0 +1,189 @@
+# File: src/rag/bm25_store.py
+"""
+BM25 인덱스 아티팩트 모듈 - 디스크 저장 및 메모리 맵 로드
+build_vectordb.py가 생성하고 API 워커는 np.memmap으로 열어 OS 페이지 캐시를 공유
+
+디렉토리 구조:
+    manifest.json      포맷 버전, 토크나이저, 문서 수, 코퍼스 해시
+    indptr.npy 등      역색인 배열 (BM25Index.save)
+    vocab.json         단어 사전
+    texts.bin          문서 텍스트 UTF-8 blob
+    doc_offsets.npy    문서별 texts.bin 시작 위치 (shape: [n_docs + 1])
+    docs.json          문서 ID 및 메타데이터
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from .bm25 import BM25Index
+from .tokenizer import get_tokenizer, tokenize_corpus
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.bm25")
+
+
+FORMAT_VERSION = 1
+
+
+class DocumentStore:
+    """texts.bin에서 문서 텍스트를 필요할 때만 디코딩하는 읽기 전용 시퀀스"""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        """
+        Args:
+            blob: UTF-8 텍스트 blob (uint8 memmap)
+            offsets: 문서별 시작 위치 (shape: [n_docs + 1])
+        """
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        start, end = int(self.offsets[idx]), int(self.offsets[idx + 1])
+        return self.blob[start:end].tobytes().decode('utf-8')
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+def compute_corpus_hash(documents: List[str]) -> str:
+    """문서 텍스트로 코퍼스 해시 계산"""
+    digest = hashlib.sha256()
+    for doc in documents:
+        digest.update(doc.encode('utf-8'))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def write_bm25_artifact(
+    documents: List[str],
+    metadatas: List[Dict],
+    ids: List[str],
+    directory: str,
+    tokenizer: str = "korean"
+) -> Dict:
+    """
+    BM25 인덱스 아티팩트 생성
+    임시 디렉토리에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 함
+
+    Args:
+        documents: 문서 텍스트 리스트
+        metadatas: 메타데이터 리스트
+        ids: 문서 ID 리스트
+        directory: 저장 디렉토리
+        tokenizer: 토크나이저 이름
+
+    Returns:
+        manifest 딕셔너리
+    """
+    target = Path(directory)
+    tmp_dir = target.parent / f"{target.name}.tmp-{os.getpid()}"
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    tok = get_tokenizer(tokenizer)
+    index = BM25Index.build(tokenize_corpus(documents, tok))
+    index.save(str(tmp_dir))
+
+    # 문서 텍스트 blob + 오프셋
+    encoded = [doc.encode('utf-8') for doc in documents]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    with open(tmp_dir / "texts.bin", 'wb') as f:
+        for b in encoded:
+            f.write(b)
+    np.save(tmp_dir / "doc_offsets.npy", offsets)
+
+    with open(tmp_dir / "docs.json", 'w', encoding='utf-8') as f:
+        json.dump({"ids": ids, "metadatas": metadatas}, f, ensure_ascii=False)
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "tokenizer": tok.signature,
+        "num_docs": len(documents),
+        "num_terms": len(index.vocab),
+        "corpus_hash": compute_corpus_hash(documents),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+    # manifest는 마지막에 기록 (존재 여부로 완성 판단)
+    with open(tmp_dir / "manifest.json", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # 기존 아티팩트 교체
+    old_dir = target.parent / f"{target.name}.old-{os.getpid()}"
+    if target.exists():
+        target.rename(old_dir)
+    tmp_dir.rename(target)
+    if old_dir.exists():
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+    return manifest
+
+
+def read_manifest(directory: str) -> Optional[Dict]:
+    """manifest 로드 (없거나 손상되면 None)"""
+    manifest_file = Path(directory) / "manifest.json"
+    if not manifest_file.exists():
+        return None
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def open_bm25_artifact(
+    directory: str,
+    tokenizer: Optional[str] = None
+) -> Optional[Tuple[BM25Index, DocumentStore, List[str], List[Dict], Dict]]:
+    """
+    BM25 인덱스 아티팩트를 메모리 맵으로 열기
+
+    Args:
+        directory: 아티팩트 디렉토리
+        tokenizer: 기대하는 토크나이저 이름 (다르면 None 반환)
+
+    Returns:
+        (BM25Index, DocumentStore, 문서 ID 리스트, 메타데이터 리스트, manifest)
+        아티팩트가 없거나 버전/토크나이저가 맞지 않으면 None
+    """
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None
+
+    if manifest.get("format_version") != FORMAT_VERSION:
+        logger.warning("BM25 아티팩트 버전 불일치: %s (기대: %s)", manifest.get('format_version'), FORMAT_VERSION)
+        return None
+
+    if tokenizer is not None and manifest.get("tokenizer") != get_tokenizer(tokenizer).signature:
+        logger.warning("BM25 아티팩트 토크나이저 불일치: %s", manifest.get('tokenizer'))
+        return None
+
+    path = Path(directory)
+    index = BM25Index.load(str(path), mmap=True)
+
+    texts_file = path / "texts.bin"
+    if texts_file.stat().st_size > 0:
+        blob = np.memmap(texts_file, dtype=np.uint8, mode='r')
+    else:
+        blob = np.empty(0, dtype=np.uint8)
+    documents = DocumentStore(blob, np.load(path / "doc_offsets.npy", mmap_mode='r'))
+
+    with open(path / "docs.json", 'r', encoding='utf-8') as f:
+        docs = json.load(f)
+
+    return index, documents, docs["ids"], docs["metadatas"], manifest
@@ -2,80 +2,230 @@
 """
 벡터 데이터베이스 구축 스크립트
 전처리된 청크 데이터를 임베딩하여 ChromaDB에 저장
+(--incremental: 내용 해시 ID로 기존 컬렉션과 비교하여 새로 추가/변경된 청크만 임베딩)
+(--index-root: 버전별 디렉토리에 새로 구축, 실행 중인 API는 관리자 API로 무중단 교체)
 """
 import json
+import sys
+import os
+import shutil
 from pathlib import Path
-from embedder import KoSBERTEmbedder
-from vector_store import VectorStore
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가 (스크립트로 직접 실행 시)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.rag.chunk_ids import assign_chunk_ids
+from src.rag.embedder import KoSBERTEmbedder
+from src.rag.vector_store import DISTANCE_SPACE, VectorStore
+from src.rag.numpy_vector_store import NumpyVectorStore
+from src.rag.bm25_store import write_bm25_artifact, read_manifest, compute_corpus_hash
+from src.rag.tokenizer import get_tokenizer
+from src.rag.corpus_version import write_corpus_version
+from src.rag.index_registry import DEFAULT_INDEX_ROOT, mark_ready, new_version_name, set_current, version_dir
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.build")
+
+
+def sync_vector_stores(
+    stores: List,
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict],
+    embedder,
+    batch_size: int = 256,
+    full: bool = False
+) -> List[Dict]:
+    """
+    벡터 스토어를 청크 목록과 일치시킴
+    스토어에 없는 ID만 임베딩하여 배치 단위로 upsert하고, 청크 목록에 없는 ID는 삭제
+    
+    Args:
+        stores: 벡터 스토어 리스트 (get_ids/upsert_documents/delete_documents 지원)
+        ids: 청크 ID 리스트
+        documents: 문서 텍스트 리스트
+        metadatas: 메타데이터 리스트
+        embedder: 임베딩 모델 (embed_documents 지원)
+        batch_size: 임베딩/upsert 배치 크기
+        full: True면 기존 문서도 모두 다시 임베딩
+        
+    Returns:
+        스토어별 변경 내역 (added, removed, unchanged / full이면 다시 임베딩한 기존 문서 수 updated 추가)
+        청크 ID가 내용 해시이므로 증분 구축에서 수정된 청크는 removed 1개 + added 1개로 집계됨
+    """
+    current = set(ids)
+    existing = [set(store.get_ids()) for store in stores]
+    
+    # 하나 이상의 스토어에 필요한 청크만 임베딩 (여러 스토어가 임베딩 공유)
+    pending = [
+        i for i, doc_id in enumerate(ids)
+        if full or any(doc_id not in store_ids for store_ids in existing)
+    ]
+    logger.info("임베딩 대상: %d개 / 전체 %d개", len(pending), len(ids))
+    
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        embeddings = embedder.embed_documents([documents[i] for i in batch], batch_size=32)
+        for store, store_ids in zip(stores, existing):
+            rows = [
+                row for row, i in enumerate(batch)
+                if full or ids[i] not in store_ids
+            ]
+            if not rows:
+                continue
+            store.upsert_documents(
+                documents=[documents[batch[row]] for row in rows],
+                embeddings=embeddings[rows],
+                metadatas=[metadatas[batch[row]] for row in rows],
+                ids=[ids[batch[row]] for row in rows]
+            )
+        logger.info("upsert 진행: %d/%d", min(start + batch_size, len(pending)), len(pending))
+    
+    reports = []
+    for store, store_ids in zip(stores, existing):
+        removed = sorted(store_ids - current)
+        for start in range(0, len(removed), batch_size):
+            store.delete_documents(removed[start:start + batch_size])
+        
+        kept = len(current & store_ids)
+        report = {
+            "added": len(current - store_ids),
+            "removed": len(removed),
+            "unchanged": 0 if full else kept
+        }
+        if full:
+            report["updated"] = kept
+        reports.append(report)
+    
+    return reports
 
 
 def build_vector_database(
     chunks_file: str = "./data/processed/all_chunks.json",
     persist_directory: str = "./data/vectordb",
-    collection_name: str = "gdpp_knowledge"
+    collection_name: str = "gdpp_knowledge",
+    tokenizer: str = "korean",
+    incremental: bool = False,
+    batch_size: int = 256,
+    embedding_cache_dir: Optional[str] = "./data/embedding_cache",
+    embedder: Optional[KoSBERTEmbedder] = None
 ):
     """
-    청크 데이터로부터 벡터 데이터베이스 구축
+    청크 데이터로부터 벡터 데이터베이스 및 BM25 인덱스 아티팩트 구축
     
     Args:
         chunks_file: 전처리된 청크 JSON 파일 경로
-        persist_directory: 벡터 DB 저장 디렉토리
+        persist_directory: 벡터 DB 저장 디렉토리 (BM25 아티팩트는 하위 bm25/에 저장)
         collection_name: 컬렉션 이름
+        tokenizer: BM25 토크나이저 이름
+        incremental: True면 새로 추가/변경된 청크만 임베딩하고 사라진 청크는 삭제
+                     (False면 전체 다시 임베딩)
+        batch_size: 임베딩/upsert 배치 크기
+        embedding_cache_dir: 문서 임베딩 디스크 캐시 디렉토리 (None이면 캐시 미사용, API 서버와 공유)
+        embedder: 이미 로드된 임베딩 모델 (None이면 새로 로드, API 서버에서 재구축 시 사용)
     """
-    print("=" * 60)
-    print("[START] 벡터 데이터베이스 구축 시작")
-    print("=" * 60)
+    logger.info("[START] 벡터 데이터베이스 구축 시작 (%s)", "증분" if incremental else "전체")
     
     # 1. 청크 데이터 로드
-    print(f"\n[STEP 1] 청크 데이터 로드: {chunks_file}")
+    logger.info("[STEP 1] 청크 데이터 로드: %s", chunks_file)
     with open(chunks_file, 'r', encoding='utf-8') as f:
         chunks = json.load(f)
     
-    print(f"[INFO] 총 {len(chunks)}개 청크 로드됨")
+    logger.info("총 %d개 청크 로드됨", len(chunks))
     
     # 2. 임베더 초기화
-    print(f"\n[STEP 2] 임베딩 모델 초기화")
-    embedder = KoSBERTEmbedder(model_name="jhgan/ko-sbert-nli")
+    logger.info("[STEP 2] 임베딩 모델 초기화")
+    if embedder is None:
+        embedder = KoSBERTEmbedder(
+            model_name="jhgan/ko-sbert-nli",
+            embedding_cache_dir=embedding_cache_dir
+        )
     
-    # 3. 문서 텍스트 및 메타데이터 추출
-    print(f"\n[STEP 3] 문서 및 메타데이터 추출")
-    documents = []
-    metadatas = []
-    ids = []
+    # 3. 문서 텍스트 및 메타데이터 추출 (내용 해시 ID: 청크 순서가 바뀌어도 ID 유지)
+    logger.info("[STEP 3] 문서 및 메타데이터 추출")
+    documents = [chunk['text'] for chunk in chunks]
+    metadatas = [chunk['metadata'] for chunk in chunks]
+    ids = assign_chunk_ids(chunks)
     
-    for i, chunk in enumerate(chunks):
-        documents.append(chunk['text'])
-        metadatas.append(chunk['metadata'])
-        ids.append(f"chunk_{i}")
+    logger.info("%d개 문서 준비 완료", len(documents))
     
-    print(f"[INFO] {len(documents)}개 문서 준비 완료")
-    
-    # 4. 임베딩 생성
-    print(f"\n[STEP 4] 임베딩 생성")
-    embeddings = embedder.embed_documents(documents, batch_size=32)
-    
-    # 5. 벡터 스토어 초기화
-    print(f"\n[STEP 5] 벡터 스토어 초기화")
+    # 4. 벡터 스토어 초기화 (ChromaDB + VECTOR_STORE_BACKEND=numpy 용 NumPy 스토어)
+    logger.info("[STEP 4] 벡터 스토어 초기화")
     vector_store = VectorStore(
         persist_directory=persist_directory,
         collection_name=collection_name
     )
+    numpy_store = NumpyVectorStore(
+        persist_directory=persist_directory,
+        collection_name=collection_name
+    )
+    if vector_store.distance_space != DISTANCE_SPACE:
+        # 이전 l2 컬렉션은 거리 함수를 바꿀 수 없으므로 비우고 다시 채움 (NumPy 스토어와 같은 거리)
+        logger.warning(
+            "ChromaDB 컬렉션 거리 함수가 %s입니다 - %s로 재생성합니다",
+            vector_store.distance_space, DISTANCE_SPACE
+        )
+        vector_store.recreate_collection()
     
-    # 6. 벡터 DB에 문서 추가
-    print(f"\n[STEP 6] 벡터 DB에 문서 추가")
-    vector_store.add_documents(
+    # 5. 변경된 청크 임베딩 및 반영
+    logger.info("[STEP 5] 임베딩 생성 및 벡터 스토어 반영")
+    reports = sync_vector_stores(
+        stores=[vector_store, numpy_store],
+        ids=ids,
         documents=documents,
-        embeddings=embeddings,
         metadatas=metadatas,
-        ids=ids
+        embedder=embedder,
+        batch_size=batch_size,
+        full=not incremental
     )
+    cache_stats = embedder.embedding_cache_stats()
+    if cache_stats["enabled"]:
+        logger.info("[CACHE] 임베딩 디스크 캐시 - 적중: %d, 미스: %d", cache_stats['hits'], cache_stats['misses'])
+    for name, report in zip(["chroma", "numpy"], reports):
+        if 'updated' in report:
+            logger.info(
+                "[CHANGES] %s - 추가: %d, 재임베딩: %d, 삭제: %d",
+                name, report['added'], report['updated'], report['removed']
+            )
+        else:
+            logger.info(
+                "[CHANGES] %s - 추가: %d, 삭제: %d, 유지: %d (수정된 청크는 삭제 + 추가로 집계)",
+                name, report['added'], report['removed'], report['unchanged']
+            )
     
-    # 7. 통계 출력
-    print(f"\n[STEP 7] 벡터 DB 통계")
+    # 6. 통계 출력
     stats = vector_store.get_collection_stats()
-    print(f"  - 컬렉션: {stats['collection_name']}")
-    print(f"  - 문서 수: {stats['document_count']}")
-    print(f"  - 저장 위치: {stats['persist_directory']}")
+    logger.info(
+        "[STEP 6] 벡터 DB 통계 - 컬렉션: %s, 문서 수: %d, 저장 위치: %s",
+        stats['collection_name'], stats['document_count'], stats['persist_directory']
+    )
+    
+    # 7. BM25 인덱스 아티팩트 생성 (API 워커가 메모리 맵으로 로드)
+    bm25_dir = str(Path(persist_directory) / "bm25")
+    changed = any(report['added'] or report.get('updated') or report['removed'] for report in reports)
+    manifest = read_manifest(bm25_dir)
+    if (
+        not changed
+        and manifest is not None
+        and manifest.get('corpus_hash') == compute_corpus_hash(documents)
+        and manifest.get('tokenizer') == get_tokenizer(tokenizer).signature
+    ):
+        logger.info("[STEP 7] 변경 없음 - BM25 인덱스 유지: %s", bm25_dir)
+    else:
+        logger.info("[STEP 7] BM25 인덱스 아티팩트 생성: %s", bm25_dir)
+        manifest = write_bm25_artifact(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            directory=bm25_dir,
+            tokenizer=tokenizer
+        )
+        logger.info(
+            "BM25 - 문서 수: %d, 단어 수: %d, 토크나이저: %s",
+            manifest['num_docs'], manifest['num_terms'], manifest['tokenizer']
+        )
+        changed = True
     
     # 8. 소스별 통계
     source_counts = {}
@@ -83,27 +233,113 @@ def build_vector_database(
         source = metadata['source']
         source_counts[source] = source_counts.get(source, 0) + 1
     
-    print(f"\n[STATS] 소스별 문서 분포:")
-    for source, count in source_counts.items():
-        print(f"  - {source}: {count}개")
+    logger.info(
+        "[STATS] 소스별 문서 분포: %s",
+        ", ".join(f"{source}: {count}개" for source, count in source_counts.items())
+    )
+    
+    # 9. 코퍼스 버전 스탬프 기록 (마지막에 기록하여 실행 중인 API의 캐시 무효화, 변경 없으면 유지)
+    if changed:
+        stamp = write_corpus_version(persist_directory, documents)
+        logger.info("[STEP 9] 코퍼스 버전: %s", stamp['version'])
+    else:
+        logger.info("[STEP 9] 변경 없음 - 코퍼스 버전 유지")
     
-    print("\n" + "=" * 60)
-    print("[SUCCESS] 벡터 데이터베이스 구축 완료!")
-    print("=" * 60)
+    logger.info("[SUCCESS] 벡터 데이터베이스 구축 완료!")
     
     return vector_store
 
 
+def build_index_version(
+    chunks_file: str = "./data/processed/all_chunks.json",
+    index_root: str = DEFAULT_INDEX_ROOT,
+    activate: bool = False,
+    **kwargs
+) -> str:
+    """
+    새 인덱스 버전 구축 ({index_root}/{version}/, 실행 중인 API는 관리자 API로 교체)
+    
+    Args:
+        chunks_file: 전처리된 청크 JSON 파일 경로
+        index_root: 버전별 인덱스 루트
+        activate: True면 구축 후 활성 버전(CURRENT)으로 지정
+        **kwargs: build_vector_database 추가 인자
+        
+    Returns:
+        새 버전 이름
+    """
+    version = new_version_name()
+    directory = version_dir(index_root, version)
+    Path(directory).mkdir(parents=True)
+    logger.info("[INDEX] 새 인덱스 버전 구축: %s", directory)
+    
+    # 구축에 사용한 청크 사본 (BM25 아티팩트가 없을 때 재구축용)
+    versioned_chunks = str(Path(directory) / "chunks.json")
+    try:
+        shutil.copyfile(chunks_file, versioned_chunks)
+        build_vector_database(
+            chunks_file=versioned_chunks,
+            persist_directory=directory,
+            **kwargs
+        )
+        mark_ready(directory)
+    except BaseException:
+        # 구축에 실패한 버전은 남기지 않음
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+    
+    if activate:
+        set_current(index_root, version)
+        logger.info("[INDEX] 활성 버전 변경: %s", version)
+    return version
+
+
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="벡터 데이터베이스 구축")
+    parser.add_argument("--chunks", default="./data/processed/all_chunks.json", help="청크 JSON 파일")
+    parser.add_argument("--persist-dir", default="./data/vectordb", help="벡터 DB 저장 디렉토리")
+    parser.add_argument("--incremental", action="store_true", help="변경된 청크만 임베딩")
+    parser.add_argument("--batch-size", type=int, default=256, help="임베딩/upsert 배치 크기")
+    parser.add_argument(
+        "--embedding-cache-dir",
+        default=os.getenv("EMBEDDING_CACHE_DIR", "./data/embedding_cache"),
+        help="문서 임베딩 디스크 캐시 디렉토리 (빈 문자열이면 캐시 미사용)"
+    )
+    parser.add_argument(
+        "--index-root",
+        help="버전별 인덱스 루트 (지정하면 {index-root}/{새 버전}/에 구축, 예: ./data/indexes)"
+    )
+    parser.add_argument("--activate", action="store_true", help="--index-root 구축 후 활성 버전으로 지정")
+    args = parser.parse_args()
+    
+    if args.index_root:
+        # 새 버전 구축 (실행 중인 API는 POST /api/admin/index/reload로 교체)
+        version = build_index_version(
+            chunks_file=args.chunks,
+            index_root=args.index_root,
+            activate=args.activate,
+            batch_size=args.batch_size,
+            embedding_cache_dir=args.embedding_cache_dir or None
+        )
+        print(f"\n[INDEX] 구축 완료: {version}")
+        sys.exit(0)
+    
     # 벡터 데이터베이스 구축
-    vector_store = build_vector_database()
+    vector_store = build_vector_database(
+        chunks_file=args.chunks,
+        persist_directory=args.persist_dir,
+        incremental=args.incremental,
+        batch_size=args.batch_size,
+        embedding_cache_dir=args.embedding_cache_dir or None
+    )
     
     # 간단한 검색 테스트
     print("\n\n" + "=" * 60)
     print("[TEST] 검색 기능 테스트")
     print("=" * 60)
     
-    from embedder import KoSBERTEmbedder
     embedder = KoSBERTEmbedder()
     
     test_queries = [
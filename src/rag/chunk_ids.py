@@ -0,0 +1,41 @@
+# File: src/rag/chunk_ids.py
+"""
+청크 ID 모듈 - 내용 해시 기반 고정 ID
+벡터 스토어, BM25 아티팩트, 아티팩트 없이 구축한 BM25 인덱스가 모두 같은 ID를 사용
+"""
+import hashlib
+import json
+from typing import Dict, List
+
+
+def chunk_id(text: str, metadata: Dict) -> str:
+    """
+    청크 내용 기반 고정 ID (텍스트와 메타데이터가 같으면 항상 같은 ID)
+    
+    Args:
+        text: 청크 텍스트
+        metadata: 청크 메타데이터
+        
+    Returns:
+        chunk_<sha256 앞 16자리>
+    """
+    digest = hashlib.sha256()
+    digest.update(text.encode('utf-8'))
+    digest.update(b"\x00")
+    digest.update(json.dumps(metadata, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return f"chunk_{digest.hexdigest()[:16]}"
+
+
+def assign_chunk_ids(chunks: List[Dict]) -> List[str]:
+    """
+    청크별 내용 해시 ID 부여
+    완전히 같은 청크가 여러 개면 두 번째부터 _1, _2 접미사 (순서가 바뀌어도 ID 집합은 동일)
+    """
+    seen: Dict[str, int] = {}
+    ids = []
+    for chunk in chunks:
+        base = chunk_id(chunk['text'], chunk['metadata'])
+        count = seen.get(base, 0)
+        seen[base] = count + 1
+        ids.append(base if count == 0 else f"{base}_{count}")
+    return ids
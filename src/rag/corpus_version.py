@@ -0,0 +1,84 @@
+# File: src/rag/corpus_version.py
+"""
+코퍼스 버전 스탬프 모듈
+build_vectordb.py가 구축을 마칠 때 버전 파일을 기록하고, 검색기/캐시는 이 파일로 재구축 여부를 판단
+"""
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .bm25_store import compute_corpus_hash
+
+
+VERSION_FILE = "corpus_version.json"
+
+
+def write_corpus_version(directory: str, documents: List[str]) -> Dict:
+    """
+    코퍼스 버전 스탬프 기록 (임시 파일에 쓴 뒤 교체)
+
+    Args:
+        directory: 벡터 DB 디렉토리
+        documents: 문서 텍스트 리스트
+
+    Returns:
+        버전 정보 딕셔너리
+    """
+    corpus_hash = compute_corpus_hash(documents)
+    stamp = {
+        # 같은 코퍼스로 다시 구축해도 인덱스 파일이 바뀌므로 빌드마다 고유 버전 부여
+        "version": f"{corpus_hash[:12]}-{uuid.uuid4().hex[:8]}",
+        "corpus_hash": corpus_hash,
+        "num_docs": len(documents),
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+    path = Path(directory) / VERSION_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(stamp, f, ensure_ascii=False, indent=2)
+    tmp_path.replace(path)
+
+    return stamp
+
+
+def read_corpus_version(directory: str) -> Optional[Dict]:
+    """코퍼스 버전 스탬프 로드 (없거나 손상되면 None)"""
+    path = Path(directory) / VERSION_FILE
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+class CorpusVersionWatcher:
+    """버전 파일의 변경 시각을 확인하여 바뀐 경우에만 다시 읽음"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 벡터 DB 디렉토리
+        """
+        self.directory = directory
+        self.path = Path(directory) / VERSION_FILE
+        self._mtime: Optional[int] = None
+        self._version: Optional[str] = None
+
+    def current(self) -> Optional[str]:
+        """현재 코퍼스 버전 (스탬프가 없으면 None)"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self._mtime, self._version = None, None
+            return None
+
+        if mtime != self._mtime:
+            stamp = read_corpus_version(self.directory)
+            self._mtime = mtime
+            self._version = stamp.get("version") if stamp else None
+        return self._version
@@ -3,23 +3,50 @@
 임베딩 모듈 - Ko-SBERT를 사용한 텍스트 임베딩
 """
 from sentence_transformers import SentenceTransformer
+import asyncio
+import time
 import numpy as np
-from typing import List, Union
+from typing import List, Union, Optional, Dict, Tuple
 from pathlib import Path
+from .cache import LRUCache
+from .embedding_cache import EmbeddingCache
+from .tokenizer import normalize_text
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.embedder")
 
 
 class KoSBERTEmbedder:
     """Ko-SBERT 모델을 사용한 한국어 텍스트 임베딩"""
     
-    def __init__(self, model_name: str = "jhgan/ko-sbert-nli"):
+    def __init__(
+        self,
+        model_name: str = "jhgan/ko-sbert-nli",
+        query_cache_size: int = 1024,
+        query_cache_ttl: Optional[float] = None,
+        embedding_cache_dir: Optional[str] = None
+    ):
         """
         Args:
             model_name: 사용할 임베딩 모델 이름
+            query_cache_size: 쿼리 임베딩 LRU 캐시 크기 (0이면 캐시 미사용)
+            query_cache_ttl: 쿼리 임베딩 캐시 유효 시간(초), None이면 만료 없음
+            embedding_cache_dir: 문서 임베딩 디스크 캐시 디렉토리 (None이면 캐시 미사용)
         """
-        print(f"[INFO] 임베딩 모델 로드 중: {model_name}")
+        logger.info("임베딩 모델 로드 중: %s", model_name)
         self.model = SentenceTransformer(model_name)
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
-        print(f"[SUCCESS] 모델 로드 완료 (임베딩 차원: {self.embedding_dim})")
+        logger.info("모델 로드 완료 (임베딩 차원: %d)", self.embedding_dim)
+        
+        # 반복 질문은 인코더를 거치지 않도록 정규화된 쿼리 기준으로 캐싱
+        self.query_cache = LRUCache(maxsize=query_cache_size, ttl=query_cache_ttl) if query_cache_size > 0 else None
+        
+        # 문서 임베딩은 텍스트 해시 기준으로 디스크에 저장 (재구축 시 바뀐 문서만 인코딩)
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_dir, model_name, self.embedding_dim)
+            if embedding_cache_dir else None
+        )
         
     def embed_documents(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """
@@ -32,14 +59,41 @@ class KoSBERTEmbedder:
         Returns:
             임베딩 벡터 배열 (shape: [len(texts), embedding_dim])
         """
-        print(f"[INFO] {len(texts)}개 문서 임베딩 중...")
-        embeddings = self.model.encode(
-            texts,
-            batch_size=batch_size,
-            show_progress_bar=True,
-            convert_to_numpy=True
+        if self.embedding_cache is None or not texts:
+            logger.info("%d개 문서 임베딩 중...", len(texts))
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=True,
+                convert_to_numpy=True
+            )
+            logger.info("임베딩 완료 (shape: %s)", embeddings.shape)
+            return embeddings
+        
+        cached = self.embedding_cache.get_many(texts)
+        
+        # 캐시 미스 문서만 인코딩 (중복 텍스트는 한 번)
+        missing = list(dict.fromkeys(text for text, embedding in zip(texts, cached) if embedding is None))
+        logger.info(
+            "%d개 문서 임베딩 중... (디스크 캐시 적중: %d개, 인코딩: %d개)",
+            len(texts), len(texts) - sum(embedding is None for embedding in cached), len(missing)
         )
-        print(f"[SUCCESS] 임베딩 완료 (shape: {embeddings.shape})")
+        fresh = {}
+        if missing:
+            encoded = self.model.encode(
+                missing,
+                batch_size=batch_size,
+                show_progress_bar=True,
+                convert_to_numpy=True
+            )
+            self.embedding_cache.put_many(missing, encoded)
+            fresh = dict(zip(missing, encoded))
+        
+        embeddings = np.stack([
+            fresh[text] if embedding is None else embedding
+            for text, embedding in zip(texts, cached)
+        ]).astype(np.float32, copy=False)
+        logger.info("임베딩 완료 (shape: %s)", embeddings.shape)
         return embeddings
     
     def embed_query(self, query: str) -> np.ndarray:
@@ -52,14 +106,200 @@ class KoSBERTEmbedder:
         Returns:
             임베딩 벡터 (shape: [embedding_dim])
         """
-        embedding = self.model.encode(query, convert_to_numpy=True)
+        if self.query_cache is None:
+            return self.model.encode(query, convert_to_numpy=True)
+        
+        key = normalize_text(query)
+        embedding = self.query_cache.get(key)
+        if embedding is None:
+            embedding = self.model.encode(query, convert_to_numpy=True)
+            # 캐시된 배열을 호출자가 수정하지 못하도록 읽기 전용으로 설정
+            embedding.flags.writeable = False
+            self.query_cache.set(key, embedding)
         return embedding
     
+    def warmup(self, queries: Optional[List[str]] = None, batch_size: int = 8):
+        """
+        첫 요청이 느리지 않도록 단일/배치 인코딩을 미리 실행 (캐시에 저장하지 않음)
+        
+        Args:
+            queries: 웜업용 쿼리 (None이면 기본 문장)
+            batch_size: 배치 인코딩 웜업 크기
+        """
+        queries = queries or ["궁디팡팡 캣페스타 부스 위치 알려줘"]
+        self.model.encode(queries[0], convert_to_numpy=True)
+        batch = [queries[i % len(queries)] for i in range(batch_size)]
+        self.model.encode(batch, batch_size=batch_size, convert_to_numpy=True)
+    
+    def embed_queries(self, queries: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        여러 검색 쿼리를 한 번의 encode 호출로 벡터로 변환 (캐시된 쿼리는 제외)
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            batch_size: 배치 크기
+            
+        Returns:
+            임베딩 벡터 배열 (shape: [len(queries), embedding_dim])
+        """
+        if not queries:
+            return np.empty((0, self.embedding_dim), dtype=np.float32)
+        
+        if self.query_cache is None:
+            return self.model.encode(queries, batch_size=batch_size, convert_to_numpy=True)
+        
+        keys = [normalize_text(query) for query in queries]
+        embeddings: List[Optional[np.ndarray]] = [self.query_cache.get(key) for key in keys]
+        
+        # 캐시 미스 쿼리만 인코딩 (배치 내 중복 제거)
+        missing: Dict[str, str] = {}
+        for key, query, embedding in zip(keys, queries, embeddings):
+            if embedding is None and key not in missing:
+                missing[key] = query
+        
+        if missing:
+            encoded = self.model.encode(list(missing.values()), batch_size=batch_size, convert_to_numpy=True)
+            fresh = {}
+            for key, embedding in zip(missing, encoded):
+                embedding.flags.writeable = False
+                self.query_cache.set(key, embedding)
+                fresh[key] = embedding
+            embeddings = [fresh[key] if embedding is None else embedding for key, embedding in zip(keys, embeddings)]
+        
+        return np.stack(embeddings)
+    
+    def cache_stats(self) -> Dict:
+        """쿼리 임베딩 캐시 통계 반환"""
+        if self.query_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.query_cache.stats()}
+    
+    def embedding_cache_stats(self) -> Dict:
+        """문서 임베딩 디스크 캐시 통계 반환"""
+        if self.embedding_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.embedding_cache.stats()}
+    
     def get_embedding_dimension(self) -> int:
         """임베딩 차원 반환"""
         return self.embedding_dim
 
 
+class QueryBatcher:
+    """
+    비동기 쿼리 임베딩 마이크로 배처
+    동시에 들어온 쿼리(인코딩 중에 쌓인 쿼리 포함)를 모아 한 번의 encode 호출로 처리하고 요청별 Future에 결과 전달
+    대기 중인 쿼리가 없으면 바로 인코딩하므로 동시 요청이 적을 때도 지연이 늘지 않음
+    """
+    
+    def __init__(
+        self,
+        embedder: KoSBERTEmbedder,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Args:
+            embedder: 임베딩 모델
+            max_batch_size: 한 번에 인코딩할 최대 쿼리 수
+            max_wait_ms: 쿼리가 계속 들어올 때 배치를 모으는 최대 시간(ms)
+        """
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.batches = 0
+        self.queries = 0
+    
+    def _ensure_worker(self):
+        """현재 이벤트 루프에서 배치 워커 시작 (최초 호출 시)"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+    
+    async def embed(self, query: str) -> np.ndarray:
+        """
+        쿼리 임베딩 (다른 동시 요청과 함께 배치 처리)
+        
+        Args:
+            query: 검색 쿼리 텍스트
+            
+        Returns:
+            임베딩 벡터 (shape: [embedding_dim])
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))
+        return await future
+    
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """
+        첫 쿼리를 기다린 뒤 이미 도착한 쿼리를 모아 배치 구성
+        이벤트 루프에 한 번 양보해도 새 쿼리가 없으면 바로 처리 (단독 쿼리는 대기 없이 인코딩),
+        계속 들어오는 동안에는 max_wait까지 최대 max_batch_size개 수집
+        """
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        
+        while len(batch) < self.max_batch_size and time.monotonic() < deadline:
+            # 같은 루프 반복에서 깨어난 호출자들이 쿼리를 넣을 수 있도록 양보
+            await asyncio.sleep(0)
+            if self._queue.empty():
+                break
+            while not self._queue.empty() and len(batch) < self.max_batch_size:
+                batch.append(self._queue.get_nowait())
+        
+        return batch
+    
+    async def _run(self):
+        """배치 워커 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # 대기 중 취소된 요청은 제외
+            batch = [(query, future) for query, future in batch if not future.done()]
+            if not batch:
+                continue
+            
+            try:
+                # 인코딩은 스레드에서 실행하여 이벤트 루프를 막지 않음
+                embeddings = await loop.run_in_executor(
+                    None, self.embedder.embed_queries, [query for query, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            self.batches += 1
+            self.queries += len(batch)
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+    
+    async def close(self):
+        """배치 워커 종료"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+    
+    def stats(self) -> Dict:
+        """배치 통계 반환"""
+        return {
+            "batches": self.batches,
+            "queries": self.queries,
+            "avg_batch_size": self.queries / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0
+        }
+
+
 if __name__ == "__main__":
     # 테스트
     embedder = KoSBERTEmbedder()
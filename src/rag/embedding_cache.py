@@ -0,0 +1,183 @@
+# File: src/rag/embedding_cache.py
+"""
+디스크 임베딩 캐시 모듈 - 텍스트 해시 → 임베딩 (모델별 디렉토리)
+벡터 DB 재구축과 API 서버가 같은 캐시를 공유하여 바뀌지 않은 문서는 다시 인코딩하지 않음
+
+디렉토리 구조 ({cache_dir}/{모델 이름}/):
+    vectors.f32    float32 임베딩 행렬 (행 단위로 뒤에 추가, 메모리 맵으로 읽음)
+    index.json     모델 이름, 임베딩 차원, 행 수, {텍스트 sha256: 행 번호}
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.embedding_cache")
+
+
+def text_key(text: str) -> str:
+    """캐시 키 (텍스트 sha256)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    텍스트 해시 기반 영구 임베딩 캐시
+    index.json은 벡터를 추가한 뒤 교체하므로 읽는 쪽은 항상 기록이 끝난 행만 봄
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, embedding_dim: int):
+        """
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            model_name: 임베딩 모델 이름 (모델마다 별도 디렉토리)
+            embedding_dim: 임베딩 차원
+        """
+        self.model_name = model_name
+        self.embedding_dim = embedding_dim
+        self.directory = Path(cache_dir) / re.sub(r"[^A-Za-z0-9._-]", "_", model_name)
+        self.vectors_file = self.directory / "vectors.f32"
+        self.index_file = self.directory / "index.json"
+        self.lock_file = self.directory / ".lock"
+
+        self._lock = threading.Lock()
+        self._index_mtime: Optional[int] = None
+        self._keys: Dict[str, int] = {}
+        self._vectors = np.empty((0, embedding_dim), dtype=np.float32)
+        self.hits = 0
+        self.misses = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._refresh()
+        logger.info("임베딩 캐시: %s (%d개)", self.directory, len(self._keys))
+
+    def _read_index(self) -> Optional[Dict]:
+        """index.json 로드 (없거나 다른 모델/차원이면 None)"""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return None
+        if index.get("model") != self.model_name or index.get("dim") != self.embedding_dim:
+            logger.warning("임베딩 캐시 모델/차원 불일치 - 무시: %s", self.directory)
+            return None
+        return index
+
+    def _refresh(self):
+        """다른 프로세스가 추가한 항목 반영 (index.json이 바뀐 경우에만 다시 읽음)"""
+        try:
+            mtime = os.stat(self.index_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime == self._index_mtime:
+            return
+
+        index = self._read_index()
+        rows = index["rows"] if index else 0
+        self._keys = index["keys"] if index else {}
+        if rows:
+            self._vectors = np.memmap(
+                self.vectors_file, dtype=np.float32, mode="r", shape=(rows, self.embedding_dim)
+            )
+        else:
+            self._vectors = np.empty((0, self.embedding_dim), dtype=np.float32)
+        self._index_mtime = mtime
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        텍스트별 캐시된 임베딩 조회
+
+        Args:
+            texts: 텍스트 리스트
+
+        Returns:
+            텍스트별 임베딩 (없으면 None)
+        """
+        with self._lock:
+            self._refresh()
+            results = []
+            for text in texts:
+                row = self._keys.get(text_key(text))
+                results.append(None if row is None else np.array(self._vectors[row]))
+            found = sum(result is not None for result in results)
+            self.hits += found
+            self.misses += len(texts) - found
+            return results
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray):
+        """
+        임베딩 추가 (이미 있는 텍스트는 건너뜀)
+
+        Args:
+            texts: 텍스트 리스트
+            embeddings: 임베딩 배열 (shape: [len(texts), embedding_dim])
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(texts), self.embedding_dim)
+
+        with self._lock, open(self.lock_file, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+
+            # 잠금을 잡은 뒤 다시 읽어 다른 프로세스가 추가한 행 뒤에 기록
+            self._index_mtime = None
+            self._refresh()
+            keys = dict(self._keys)
+            rows = len(self._vectors)
+
+            new_rows = []
+            for text, embedding in zip(texts, embeddings):
+                key = text_key(text)
+                if key not in keys:
+                    keys[key] = rows + len(new_rows)
+                    new_rows.append(embedding)
+            if not new_rows:
+                return
+
+            # 인덱스에 기록되지 않은 꼬리(중단된 기록)는 덮어씀
+            mode = 'r+b' if self.vectors_file.exists() else 'wb'
+            with open(self.vectors_file, mode) as f:
+                f.seek(rows * self.embedding_dim * 4)
+                f.write(np.ascontiguousarray(np.stack(new_rows)).tobytes())
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+
+            tmp_file = self.index_file.with_suffix(".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "model": self.model_name,
+                    "dim": self.embedding_dim,
+                    "rows": rows + len(new_rows),
+                    "keys": keys
+                }, f)
+            tmp_file.replace(self.index_file)
+            self._refresh()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+    def stats(self) -> Dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "directory": str(self.directory),
+                "size": len(self._keys),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0
+            }
@@ -0,0 +1,198 @@
+# File: src/rag/fusion.py
+"""
+검색 결과 결합(Fusion) 전략 모듈 - Vector/BM25 결과를 하나의 순위로 결합
+전략마다 점수 척도가 다르므로 후보 수(candidate depth)와 최소 점수 기준을 함께 정의
+"""
+from typing import Dict, List, Optional, Type
+import numpy as np
+
+
+class FusionStrategy:
+    """결합 전략 기본 클래스"""
+
+    name = "base"
+
+    # 전략별 기본 후보 수 (None이면 k*2)
+    default_candidate_depth: Optional[int] = None
+
+    # 결합 점수 최소 기준 (챗봇 문서 필터링용, None이면 필터링 안 함)
+    min_score: Optional[float] = None
+
+    def __init__(self, candidate_depth: Optional[int] = None):
+        """
+        Args:
+            candidate_depth: 검색 방법별로 가져올 후보 수 (None이면 전략 기본값)
+        """
+        self.candidate_depth = candidate_depth if candidate_depth is not None else self.default_candidate_depth
+
+    def depth(self, k: int) -> int:
+        """최종 k개를 위해 검색 방법별로 가져올 후보 수"""
+        if self.candidate_depth is None:
+            return k * 2
+        return max(k, self.candidate_depth)
+
+    def fuse(
+        self,
+        vector_results: List[Dict],
+        bm25_results: List[Dict],
+        vector_weight: float,
+        bm25_weight: float
+    ) -> Dict[str, float]:
+        """
+        문서 ID별 결합 점수 계산
+
+        Args:
+            vector_results: 벡터 검색 결과 (distance, score 포함, 순위순)
+            bm25_results: BM25 검색 결과 (score 포함, 순위순)
+            vector_weight: Vector Search 가중치
+            bm25_weight: BM25 Search 가중치
+
+        Returns:
+            {문서 ID: 결합 점수}
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _accumulate(doc_scores: Dict[str, float], results: List[Dict], scores, weight: float):
+        for result, score in zip(results, scores):
+            doc_id = result['id']
+            doc_scores[doc_id] = doc_scores.get(doc_id, 0.0) + float(score) * weight
+
+
+class WeightedFusion(FusionStrategy):
+    """
+    가중합 방식 (기본 전략)
+    벡터 점수는 코사인 거리를 변환한 코사인 유사도 max(0, 1-distance),
+    BM25 점수는 s/(s+1)로 0~1 범위에 압축한 뒤 가중합 (두 결과에 모두 있으면 합산)
+    벡터 점수 변환이 1/(1+distance)에서 바뀌었으므로 이전 버전과 점수/순위가 다름
+    """
+
+    name = "weighted"
+    # 기본 가중치(0.7/0.3)에서 벡터 단독 결과는 코사인 유사도 0.29 이상,
+    # BM25 단독 결과는 BM25 점수 2.33 이상이어야 통과
+    min_score = 0.2
+
+    def fuse(self, vector_results, bm25_results, vector_weight, bm25_weight):
+        doc_scores = {}
+        self._accumulate(doc_scores, vector_results, [r['score'] for r in vector_results], vector_weight)
+        self._accumulate(
+            doc_scores, bm25_results,
+            [r['score'] / (r['score'] + 1.0) for r in bm25_results],
+            bm25_weight
+        )
+        return doc_scores
+
+
+class RRFFusion(FusionStrategy):
+    """
+    Reciprocal Rank Fusion
+    점수 척도와 무관하게 순위만 사용: weight / (rrf_k + rank)
+    """
+
+    name = "rrf"
+    default_candidate_depth = 20
+
+    def __init__(self, candidate_depth: Optional[int] = None, rrf_k: int = 60):
+        """
+        Args:
+            candidate_depth: 검색 방법별로 가져올 후보 수
+            rrf_k: 순위 평활 상수 (클수록 하위 순위 영향이 커짐)
+        """
+        super().__init__(candidate_depth)
+        self.rrf_k = rrf_k
+
+    def fuse(self, vector_results, bm25_results, vector_weight, bm25_weight):
+        doc_scores = {}
+        for results, weight in ((vector_results, vector_weight), (bm25_results, bm25_weight)):
+            ranks = np.arange(1, len(results) + 1)
+            self._accumulate(doc_scores, results, 1.0 / (self.rrf_k + ranks), weight)
+        return doc_scores
+
+
+class MinMaxFusion(FusionStrategy):
+    """
+    Min-Max 정규화 가중합
+    검색 방법별 원 점수(벡터: -distance, BM25: score)를 후보 내에서 0~1로 정규화
+    """
+
+    name = "minmax"
+    default_candidate_depth = 20
+    # 후보 내 정규화 점수 기준이므로 거리 척도(l2 → 코사인)와 무관
+    min_score = 0.15
+
+    @staticmethod
+    def normalize(scores: np.ndarray) -> np.ndarray:
+        if len(scores) == 0:
+            return scores
+        low, high = scores.min(), scores.max()
+        if high - low <= 0:
+            return np.ones_like(scores)
+        return (scores - low) / (high - low)
+
+    def fuse(self, vector_results, bm25_results, vector_weight, bm25_weight):
+        doc_scores = {}
+        vector_scores = -np.array([r['distance'] for r in vector_results], dtype=np.float64)
+        bm25_scores = np.array([r['score'] for r in bm25_results], dtype=np.float64)
+        self._accumulate(doc_scores, vector_results, self.normalize(vector_scores), vector_weight)
+        self._accumulate(doc_scores, bm25_results, self.normalize(bm25_scores), bm25_weight)
+        return doc_scores
+
+
+class ZScoreFusion(FusionStrategy):
+    """
+    Z-score 정규화 가중합
+    검색 방법별 원 점수를 후보 내 평균/표준편차로 표준화 (이상치 하나에 덜 민감)
+    """
+
+    name = "zscore"
+    default_candidate_depth = 20
+
+    @staticmethod
+    def normalize(scores: np.ndarray) -> np.ndarray:
+        if len(scores) == 0:
+            return scores
+        std = scores.std()
+        if std <= 0:
+            return np.zeros_like(scores)
+        return (scores - scores.mean()) / std
+
+    def fuse(self, vector_results, bm25_results, vector_weight, bm25_weight):
+        vector_scores = -np.array([r['distance'] for r in vector_results], dtype=np.float64)
+        bm25_scores = np.array([r['score'] for r in bm25_results], dtype=np.float64)
+        vector_z = {r['id']: float(z) for r, z in zip(vector_results, self.normalize(vector_scores))}
+        bm25_z = {r['id']: float(z) for r, z in zip(bm25_results, self.normalize(bm25_scores))}
+
+        # 한쪽 후보에 없는 문서는 그쪽 최저 점수로 취급 (0은 평균이므로 과대평가됨)
+        vector_floor = min(vector_z.values(), default=0.0)
+        bm25_floor = min(bm25_z.values(), default=0.0)
+
+        doc_ids = list(vector_z) + [doc_id for doc_id in bm25_z if doc_id not in vector_z]
+        return {
+            doc_id: vector_z.get(doc_id, vector_floor) * vector_weight
+            + bm25_z.get(doc_id, bm25_floor) * bm25_weight
+            for doc_id in doc_ids
+        }
+
+
+FUSION_STRATEGIES: Dict[str, Type[FusionStrategy]] = {
+    WeightedFusion.name: WeightedFusion,
+    RRFFusion.name: RRFFusion,
+    MinMaxFusion.name: MinMaxFusion,
+    ZScoreFusion.name: ZScoreFusion,
+}
+
+
+def get_fusion(name: str = "weighted", **kwargs) -> FusionStrategy:
+    """
+    이름으로 결합 전략 생성
+
+    Args:
+        name: 전략 이름 (weighted, rrf, minmax, zscore)
+        **kwargs: 전략 생성 인자
+
+    Returns:
+        결합 전략 인스턴스
+    """
+    if name not in FUSION_STRATEGIES:
+        raise ValueError(f"지원하지 않는 결합 전략: {name} (사용 가능: {list(FUSION_STRATEGIES)})")
+    return FUSION_STRATEGIES[name](**kwargs)
@@ -2,12 +2,24 @@
 """
 하이브리드 검색 모듈 - Dense Vector + Sparse BM25
 """
-from rank_bm25 import BM25Okapi
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import json
+import threading
+import time
 from .embedder import KoSBERTEmbedder
 from .vector_store import VectorStore
+from .tokenizer import get_tokenizer, normalize_text, tokenize_corpus
+from .bm25 import BM25Index
+from .bm25_store import compute_corpus_hash, open_bm25_artifact
+from .cache import LRUCache
+from .chunk_ids import assign_chunk_ids
+from .corpus_version import CorpusVersionWatcher
+from .fusion import FusionStrategy, get_fusion
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.retriever")
 
 
 class HybridRetriever:
@@ -15,56 +27,119 @@ class HybridRetriever:
     
     def __init__(
         self,
-        vector_store: VectorStore,
-        embedder: KoSBERTEmbedder,
-        chunks_file: str = "./data/processed/all_chunks.json"
+        vector_store: Optional[VectorStore],
+        embedder: Optional[KoSBERTEmbedder],
+        chunks_file: str = "./data/processed/all_chunks.json",
+        tokenizer: str = "korean",
+        token_cache_dir: Optional[str] = "./data/cache",
+        index_dir: Optional[str] = "./data/vectordb/bm25",
+        result_cache_size: int = 1024,
+        result_cache_ttl: Optional[float] = None,
+        version_dir: Optional[str] = "./data/vectordb",
+        fusion: str = "weighted"
     ):
         """
         Args:
-            vector_store: ChromaDB 벡터 스토어
-            embedder: 임베딩 모델
-            chunks_file: 청크 데이터 파일 (BM25 인덱스 구축용)
+            vector_store: ChromaDB 벡터 스토어 (None이면 검색 전에 설정, 병렬 초기화용)
+            embedder: 임베딩 모델 (None이면 검색 전에 설정, 병렬 초기화용)
+            chunks_file: 청크 데이터 파일 (BM25 아티팩트가 없을 때 인덱스 구축용)
+            tokenizer: BM25 토크나이저 이름 (whitespace, ngram, korean)
+            token_cache_dir: 토큰화된 코퍼스 캐시 디렉토리 (None이면 캐시 미사용)
+            index_dir: build_vectordb.py가 생성한 BM25 아티팩트 디렉토리
+            result_cache_size: 하이브리드 검색 결과 캐시 크기 (0이면 캐시 미사용)
+            result_cache_ttl: 검색 결과 캐시 유효 시간(초), None이면 만료 없음
+            version_dir: 코퍼스 버전 스탬프 디렉토리 (스탬프가 바뀌면 검색 결과 캐시 무효화)
+            fusion: 기본 결합 전략 (weighted, rrf, minmax, zscore)
         """
         self.vector_store = vector_store
         self.embedder = embedder
+        self.tokenizer = get_tokenizer(tokenizer)
+        self.chunks_file = chunks_file
+        self.token_cache_dir = token_cache_dir
+        self.index_dir = index_dir
+        self.fusion = get_fusion(fusion)
+        self._fusions = {self.fusion.name: self.fusion}
+        self._reload_lock = threading.Lock()
+        
+        # 검색 결과 캐시 (코퍼스 버전, 정규화된 쿼리, k, 가중치 → 결합된 결과)
+        self.result_cache = LRUCache(result_cache_size, result_cache_ttl) if result_cache_size > 0 else None
+        self.version_watcher = CorpusVersionWatcher(version_dir) if version_dir else None
+        self.corpus_version = self.version_watcher.current() if self.version_watcher else None
+        
+        # (BM25 인덱스, 문서, 문서 ID, 메타데이터) - 재로드 시 한 번에 교체
+        self._corpus, self.corpus_hash = self._load_corpus()
+    
+    @property
+    def bm25(self) -> BM25Index:
+        return self._corpus[0]
+    
+    @property
+    def documents(self) -> List[str]:
+        return self._corpus[1]
+    
+    @property
+    def doc_ids(self) -> List[str]:
+        return self._corpus[2]
+    
+    @property
+    def metadatas(self) -> List[Dict]:
+        return self._corpus[3]
+    
+    def _load_corpus(self) -> Tuple[Tuple, Optional[str]]:
+        """
+        BM25 인덱스와 문서 목록 로드
         
-        # 청크 데이터 로드
-        print(f"[INFO] 청크 데이터 로드 중: {chunks_file}")
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            self.chunks = json.load(f)
+        Returns:
+            ((BM25 인덱스, 문서, 문서 ID, 메타데이터), 코퍼스 해시)
+        """
+        # 1. 사전 구축된 BM25 아티팩트 (메모리 맵)
+        artifact = open_bm25_artifact(self.index_dir, tokenizer=self.tokenizer.name) if self.index_dir else None
+        if artifact is not None:
+            bm25, documents, doc_ids, metadatas, manifest = artifact
+            logger.info("BM25 아티팩트 로드 완료: %s (%d개 문서)", self.index_dir, len(documents))
+            return (bm25, documents, doc_ids, metadatas), manifest.get("corpus_hash")
+        
+        # 2. 아티팩트가 없으면 청크 데이터로 인덱스 구축
+        logger.info("청크 데이터 로드 중: %s", self.chunks_file)
+        with open(self.chunks_file, 'r', encoding='utf-8') as f:
+            chunks = json.load(f)
         
-        # BM25 인덱스 구축
-        print(f"[INFO] BM25 인덱스 구축 중...")
-        self.documents = [chunk['text'] for chunk in self.chunks]
+        logger.info("BM25 인덱스 구축 중...")
+        documents = [chunk['text'] for chunk in chunks]
+        metadatas = [chunk['metadata'] for chunk in chunks]
+        # 벡터 스토어와 같은 내용 해시 ID (결합 시 같은 청크로 합산)
+        doc_ids = assign_chunk_ids(chunks)
         
-        # 토큰화 (간단한 공백 기반)
-        tokenized_docs = [doc.split() for doc in self.documents]
-        self.bm25 = BM25Okapi(tokenized_docs)
+        # 토큰화 (인덱스와 쿼리에 동일한 토크나이저 사용)
+        tokenized_docs = tokenize_corpus(documents, self.tokenizer, cache_dir=self.token_cache_dir)
+        bm25 = BM25Index.build(tokenized_docs)
         
-        print(f"[SUCCESS] BM25 인덱스 구축 완료 ({len(self.documents)}개 문서)")
+        logger.info("BM25 인덱스 구축 완료 (%d개 문서, 토크나이저: %s)", len(documents), self.tokenizer.name)
+        return (bm25, documents, doc_ids, metadatas), compute_corpus_hash(documents)
     
-    def vector_search(self, query: str, k: int = 10) -> List[Dict]:
+    def vector_search(
+        self,
+        query: str,
+        k: int = 10,
+        query_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict]:
         """
         Dense Vector Search (의미 기반 검색)
         
         Args:
             query: 검색 쿼리
             k: 반환할 문서 수
+            query_embedding: 미리 계산된 쿼리 임베딩 (없으면 임베더로 계산)
             
         Returns:
             검색 결과 리스트
         """
-        query_embedding = self.embedder.embed_query(query)
+        if query_embedding is None:
+            query_embedding = self.embedder.embed_query(query)
         results = self.vector_store.similarity_search(query_embedding, k=k)
         
-        # 점수 정규화 (거리를 유사도로 변환)
-        for result in results:
-            # 거리가 작을수록 유사도가 높음
-            # 거리를 0-1 범위의 유사도로 변환
-            result['score'] = 1.0 / (1.0 + result['distance'])
-            result['search_type'] = 'vector'
-        
-        return results
+        # 점수 정규화 (거리가 작을수록 유사도가 높음)
+        return self._format_vector_results(results)
     
     def bm25_search(self, query: str, k: int = 10) -> List[Dict]:
         """
@@ -78,34 +153,23 @@ class HybridRetriever:
             검색 결과 리스트
         """
         # 쿼리 토큰화
-        tokenized_query = query.split()
-        
-        # BM25 점수 계산
-        scores = self.bm25.get_scores(tokenized_query)
-        
-        # 상위 k개 문서 인덱스
-        top_k_indices = np.argsort(scores)[::-1][:k]
-        
-        # 결과 포맷팅
-        results = []
-        for idx in top_k_indices:
-            if scores[idx] > 0:  # 점수가 0보다 큰 경우만
-                results.append({
-                    "id": f"chunk_{idx}",
-                    "document": self.documents[idx],
-                    "metadata": self.chunks[idx]['metadata'],
-                    "score": float(scores[idx]),
-                    "search_type": "bm25"
-                })
+        tokenized_query = self.tokenizer.tokenize(query)
         
-        return results
+        # BM25 점수 계산 (쿼리 단어를 포함한 문서만) 및 상위 k개 선택
+        corpus = self._corpus
+        top_docs = corpus[0].top_k(tokenized_query, k=k)
+        
+        return self._format_bm25_results(top_docs, corpus)
     
     def hybrid_search(
         self,
         query: str,
         k: int = 5,
         vector_weight: float = 0.7,
-        bm25_weight: float = 0.3
+        bm25_weight: float = 0.3,
+        query_embedding: Optional[np.ndarray] = None,
+        fusion: Optional[str] = None,
+        timings: Optional[Dict] = None
     ) -> List[Dict]:
         """
         하이브리드 검색 (Vector + BM25)
@@ -115,35 +179,174 @@ class HybridRetriever:
             k: 최종 반환할 문서 수
             vector_weight: Vector Search 가중치
             bm25_weight: BM25 Search 가중치
+            query_embedding: 미리 계산된 쿼리 임베딩 (QueryBatcher 등에서 계산)
+            fusion: 결합 전략 이름 (None이면 기본 전략)
+            timings: 전달하면 단계별 소요 시간(초)과 캐시 히트 여부를 채움
+                (embed: 쿼리 임베딩을 직접 계산한 경우만, vector, bm25, fuse, total, cache_hit /
+                 캐시 히트 시 total과 cache_hit만)
             
         Returns:
             검색 결과 리스트 (점수 기준 정렬)
         """
-        # 각 검색 방법으로 더 많은 문서 검색 (k*2)
-        vector_results = self.vector_search(query, k=k*2)
-        bm25_results = self.bm25_search(query, k=k*2)
+        start = time.perf_counter()
+        strategy = self.get_fusion(fusion)
+        self.refresh_if_stale()
+        cache_key = self._cache_key(query, k, vector_weight, bm25_weight, strategy)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            if timings is not None:
+                timings.update({"total": time.perf_counter() - start, "cache_hit": True})
+            return cached
         
-        # 문서 ID별로 점수 집계
-        doc_scores = {}
-        doc_data = {}
+        # 쿼리 임베딩 (미리 계산되지 않은 경우만, 벡터 검색 시간과 분리하여 기록)
+        stages = {}
+        if query_embedding is None:
+            embed_start = time.perf_counter()
+            query_embedding = self.embedder.embed_query(query)
+            stages["embed"] = time.perf_counter() - embed_start
         
-        # Vector Search 결과 처리
-        for result in vector_results:
-            doc_id = result['id']
-            doc_scores[doc_id] = doc_scores.get(doc_id, 0) + result['score'] * vector_weight
-            doc_data[doc_id] = result
+        # 각 검색 방법으로 전략별 후보 수만큼 검색 (weighted는 k*2)
+        depth = strategy.depth(k)
+        vector_start = time.perf_counter()
+        vector_results = self.vector_search(query, k=depth, query_embedding=query_embedding)
+        vector_done = time.perf_counter()
+        bm25_results = self.bm25_search(query, k=depth)
+        bm25_done = time.perf_counter()
+        
+        results = self._fuse(vector_results, bm25_results, k, vector_weight, bm25_weight, strategy)
+        if timings is not None:
+            done = time.perf_counter()
+            timings.update(stages)
+            timings.update({
+                "vector": vector_done - vector_start,
+                "bm25": bm25_done - vector_done,
+                "fuse": done - bm25_done,
+                "total": done - start,
+                "cache_hit": False
+            })
+        self._cache_set(cache_key, results)
+        return results
+    
+    def current_version(self) -> Optional[str]:
+        """
+        현재 로드된 코퍼스 버전 (부수 효과 없음, 이벤트 루프에서 호출 가능)
+        스탬프가 없으면 로드한 코퍼스의 해시를 버전으로 사용
+        """
+        return self.corpus_version or self.corpus_hash
+    
+    def refresh_if_stale(self) -> bool:
+        """
+        버전 스탬프가 바뀌었으면 BM25 인덱스/문서 목록을 다시 로드하고 검색 결과 캐시 무효화
+        파일 I/O가 있으므로 스레드 풀에서 호출 (검색 메서드가 시작 시 호출)
+        
+        Returns:
+            재로드 여부
+        """
+        if self.version_watcher is None or self.version_watcher.current() == self.corpus_version:
+            return False
+        with self._reload_lock:
+            version = self.version_watcher.current()
+            if version == self.corpus_version:
+                return False
+            return self._reload(version)
+    
+    def _reload(self, version: Optional[str]) -> bool:
+        """재구축된 코퍼스로 교체 (실패하면 기존 코퍼스 유지, 다음 확인 시 다시 시도)"""
+        try:
+            corpus, corpus_hash = self._load_corpus()
+            # NumPy 스토어는 메모리 맵을 다시 열어야 새 임베딩이 보임 (ChromaDB는 디스크에서 바로 반영)
+            vector_store = self.vector_store.reopen() if hasattr(self.vector_store, "reopen") else self.vector_store
+        except Exception as e:
+            logger.exception("코퍼스 재로드 실패 - 기존 인덱스 유지: %s", e)
+            return False
         
-        # BM25 Search 결과 처리
+        self._corpus, self.corpus_hash, self.vector_store = corpus, corpus_hash, vector_store
+        logger.info("코퍼스 버전 변경: %s → %s, BM25 인덱스 재로드 및 검색 결과 캐시 초기화", self.corpus_version, version)
+        self.corpus_version = version
+        if self.result_cache is not None:
+            self.result_cache.clear()
+        return True
+    
+    def get_fusion(self, name: Optional[str] = None) -> FusionStrategy:
+        """이름으로 결합 전략 조회 (None이면 기본 전략)"""
+        if name is None:
+            return self.fusion
+        if name not in self._fusions:
+            self._fusions[name] = get_fusion(name)
+        return self._fusions[name]
+    
+    def _cache_key(
+        self,
+        query: str,
+        k: int,
+        vector_weight: float,
+        bm25_weight: float,
+        strategy: FusionStrategy
+    ) -> Tuple:
+        # 코퍼스 버전을 키에 포함 (재로드 전에 시작한 검색 결과가 새 버전 캐시에 섞이지 않음)
+        return self.corpus_version, normalize_text(query), k, vector_weight, bm25_weight, strategy.name, strategy.depth(k)
+    
+    def _cache_get(self, key: Tuple) -> Optional[List[Dict]]:
+        if self.result_cache is None:
+            return None
+        cached = self.result_cache.get(key)
+        # 호출 측에서 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환
+        return [result.copy() for result in cached] if cached is not None else None
+    
+    def _cache_set(self, key: Tuple, results: List[Dict]):
+        if self.result_cache is not None:
+            self.result_cache.set(key, [result.copy() for result in results])
+    
+    def cache_stats(self) -> Optional[Dict]:
+        """검색 결과 캐시 통계 (캐시 미사용 시 None)"""
+        if self.result_cache is None:
+            return None
+        stats = self.result_cache.stats()
+        stats["corpus_version"] = self.corpus_version
+        return stats
+    
+    def _format_vector_results(self, results: List[Dict]) -> List[Dict]:
+        """벡터 검색 결과에 점수 추가 (코사인 거리 [0, 2]를 코사인 유사도로 변환, 음수 유사도는 0)"""
+        for result in results:
+            result['score'] = max(0.0, 1.0 - result['distance'])
+            result['search_type'] = 'vector'
+        return results
+    
+    def _format_bm25_results(self, top_docs: List[Tuple[int, float]], corpus: Tuple) -> List[Dict]:
+        """BM25 (문서 인덱스, 점수) 리스트를 검색 결과로 변환 (점수를 계산한 코퍼스 기준)"""
+        _, documents, doc_ids, metadatas = corpus
+        return [
+            {
+                "id": doc_ids[idx],
+                "document": documents[idx],
+                "metadata": metadatas[idx],
+                "score": score,
+                "search_type": "bm25"
+            }
+            for idx, score in top_docs
+        ]
+    
+    def _fuse(
+        self,
+        vector_results: List[Dict],
+        bm25_results: List[Dict],
+        k: int,
+        vector_weight: float,
+        bm25_weight: float,
+        strategy: Optional[FusionStrategy] = None
+    ) -> List[Dict]:
+        """Vector/BM25 결과를 결합 전략으로 합산하여 상위 k개 반환"""
+        strategy = strategy or self.fusion
+        
+        # 문서 ID별로 점수 집계
+        doc_scores = strategy.fuse(vector_results, bm25_results, vector_weight, bm25_weight)
+        
+        # 문서 데이터 (두 결과에 모두 있으면 Vector Search 결과 사용)
+        doc_data = {}
         for result in bm25_results:
-            doc_id = result['id']
-            
-            # BM25 점수 정규화 (0-1 범위로)
-            normalized_score = result['score'] / (result['score'] + 1.0)
-            
-            doc_scores[doc_id] = doc_scores.get(doc_id, 0) + normalized_score * bm25_weight
-            
-            if doc_id not in doc_data:
-                doc_data[doc_id] = result
+            doc_data[result['id']] = result
+        for result in vector_results:
+            doc_data[result['id']] = result
         
         # 점수 기준 정렬
         sorted_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
@@ -157,7 +360,67 @@ class HybridRetriever:
             final_results.append(result)
         
         return final_results
-
+    
+    def hybrid_search_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        vector_weight: float = 0.7,
+        bm25_weight: float = 0.3,
+        fusion: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        여러 쿼리의 하이브리드 검색
+        임베딩 1회, 벡터 검색 1회(행렬 곱), BM25 점수 계산 1회로 처리한 뒤 쿼리별로 결합
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 최종 반환할 문서 수
+            vector_weight: Vector Search 가중치
+            bm25_weight: BM25 Search 가중치
+            fusion: 결합 전략 이름 (None이면 기본 전략)
+            
+        Returns:
+            쿼리별 검색 결과 리스트
+        """
+        if not queries:
+            return []
+        
+        strategy = self.get_fusion(fusion)
+        depth = strategy.depth(k)
+        self.refresh_if_stale()
+        
+        # 캐시에 없는 쿼리만 검색
+        cache_keys = [self._cache_key(query, k, vector_weight, bm25_weight, strategy) for query in queries]
+        batch_results = [self._cache_get(key) for key in cache_keys]
+        missing = [i for i, results in enumerate(batch_results) if results is None]
+        if not missing:
+            return batch_results
+        missing_queries = [queries[i] for i in missing]
+        
+        # 1. 모든 쿼리를 한 번에 임베딩
+        query_embeddings = self.embedder.embed_queries(missing_queries)
+        
+        # 2. 벡터 검색 (배치)
+        vector_batches = self.vector_store.similarity_search_batch(query_embeddings, k=depth)
+        
+        # 3. BM25 점수 계산 (배치)
+        corpus = self._corpus
+        bm25_batches = corpus[0].top_k_batch(self.tokenizer.tokenize_batch(missing_queries), k=depth)
+        
+        # 4. 쿼리별 결합
+        for i, vector_results, top_docs in zip(missing, vector_batches, bm25_batches):
+            batch_results[i] = self._fuse(
+                self._format_vector_results(vector_results),
+                self._format_bm25_results(top_docs, corpus),
+                k,
+                vector_weight,
+                bm25_weight,
+                strategy
+            )
+            self._cache_set(cache_keys[i], batch_results[i])
+        
+        return batch_results
 
 if __name__ == "__main__":
     # 테스트
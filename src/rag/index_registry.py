@@ -0,0 +1,136 @@
+# File: src/rag/index_registry.py
+"""
+버전별 검색 인덱스 디렉토리 관리 - 무중단 인덱스 교체용
+
+디렉토리 구조 ({index_root}/):
+    CURRENT                활성 버전 이름 (임시 파일에 쓴 뒤 교체)
+    {version}/             build_vectordb.py 출력 한 벌 (ChromaDB, numpy/, bm25/, corpus_version.json)
+    {version}/chunks.json  구축에 사용한 청크 데이터 사본
+    {version}/READY        구축 완료 표시 (없으면 구축 중이거나 실패한 버전)
+
+CURRENT가 없으면 기존 단일 디렉토리(./data/vectordb)를 사용
+"""
+import os
+import re
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.index")
+
+
+DEFAULT_INDEX_ROOT = "./data/indexes"
+LEGACY_INDEX_DIR = "./data/vectordb"
+CURRENT_FILE = "CURRENT"
+READY_FILE = "READY"
+
+_VALID_VERSION = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+def new_version_name() -> str:
+    """새 버전 이름 (생성 시각 순으로 정렬됨, 밀리초 포함)"""
+    now = time.time()
+    return f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}{int(now % 1 * 1000):03d}-{uuid.uuid4().hex[:6]}"
+
+
+def is_valid_version(version: str) -> bool:
+    """버전 이름 검증 (경로 이동 방지)"""
+    return bool(_VALID_VERSION.match(version)) and version not in (".", "..")
+
+
+def version_dir(index_root: str, version: str) -> str:
+    """버전 디렉토리 경로"""
+    if not is_valid_version(version):
+        raise ValueError(f"잘못된 인덱스 버전 이름: {version}")
+    return str(Path(index_root) / version)
+
+
+def is_ready(index_root: str, version: str) -> bool:
+    """구축이 끝난 버전인지 확인"""
+    return is_valid_version(version) and (Path(index_root) / version / READY_FILE).exists()
+
+
+def mark_ready(directory: str):
+    """구축 완료 표시 (모든 파일을 쓴 뒤 마지막에 호출)"""
+    with open(Path(directory) / READY_FILE, 'w', encoding='utf-8') as f:
+        f.write(time.strftime("%Y-%m-%d %H:%M:%S"))
+
+
+def list_versions(index_root: str) -> List[str]:
+    """구축이 끝난 버전 목록 (오래된 순)"""
+    root = Path(index_root)
+    if not root.is_dir():
+        return []
+    return sorted(
+        path.name for path in root.iterdir()
+        if path.is_dir() and is_ready(index_root, path.name)
+    )
+
+
+def read_current(index_root: str) -> Optional[str]:
+    """활성 버전 이름 (없거나 구축이 끝나지 않은 버전이면 None)"""
+    try:
+        version = (Path(index_root) / CURRENT_FILE).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return version if is_ready(index_root, version) else None
+
+
+def set_current(index_root: str, version: str):
+    """활성 버전 변경 (임시 파일에 쓴 뒤 교체)"""
+    if not is_ready(index_root, version):
+        raise ValueError(f"구축이 끝나지 않은 인덱스 버전: {version}")
+    path = Path(index_root) / CURRENT_FILE
+    tmp_path = path.with_suffix(f".tmp-{os.getpid()}")
+    tmp_path.write_text(version, encoding='utf-8')
+    tmp_path.replace(path)
+
+
+def resolve_index_dir(index_root: str = DEFAULT_INDEX_ROOT, legacy_dir: str = LEGACY_INDEX_DIR):
+    """
+    사용할 인덱스 디렉토리 결정
+
+    Args:
+        index_root: 버전별 인덱스 루트
+        legacy_dir: CURRENT가 없을 때 사용할 기존 디렉토리
+
+    Returns:
+        (버전 이름 또는 None, 디렉토리 경로)
+    """
+    version = read_current(index_root)
+    if version is None:
+        return None, legacy_dir
+    return version, version_dir(index_root, version)
+
+
+def prune_versions(index_root: str, keep: int = 3, protect: Optional[List[str]] = None) -> List[str]:
+    """
+    오래된 버전 삭제 (최신 keep개와 활성/보호 버전은 유지, 구축 중인 디렉토리는 건드리지 않음)
+
+    Args:
+        index_root: 버전별 인덱스 루트
+        keep: 유지할 최신 버전 수
+        protect: 삭제하지 않을 버전 (예: 요청 처리 중인 이전 버전)
+
+    Returns:
+        삭제한 버전 목록
+    """
+    protected = set(protect or [])
+    current = read_current(index_root)
+    if current:
+        protected.add(current)
+
+    versions = list_versions(index_root)
+    removed = []
+    for version in versions[:max(len(versions) - keep, 0)]:
+        if version in protected:
+            continue
+        shutil.rmtree(Path(index_root) / version, ignore_errors=True)
+        removed.append(version)
+    if removed:
+        logger.info("오래된 인덱스 버전 삭제: %s", ", ".join(removed))
+    return removed
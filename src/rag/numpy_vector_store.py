@@ -0,0 +1,320 @@
+# File: src/rag/numpy_vector_store.py
+"""
+인메모리 벡터 스토어 모듈 - NumPy 정확 검색 (ChromaDB 대체 백엔드)
+L2 정규화된 float32 임베딩 행렬에 대해 행렬-벡터 곱 한 번과 argpartition으로 검색
+거리는 ChromaDB 컬렉션(hnsw:space=cosine)과 같은 코사인 거리(1 - 코사인 유사도)
+"""
+import json
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.vector_store")
+
+
+def normalize_embeddings(embeddings: np.ndarray) -> np.ndarray:
+    """L2 정규화 (float32, 두 벡터 스토어 공통)"""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+class NumpyVectorStore:
+    """NumPy 행렬 기반 벡터 스토어 (VectorStore와 동일한 인터페이스)"""
+
+    def __init__(
+        self,
+        persist_directory: str = "./data/vectordb",
+        collection_name: str = "gdpp_knowledge",
+        mmap: bool = True
+    ):
+        """
+        Args:
+            persist_directory: 벡터 DB 저장 디렉토리 (하위 numpy/{collection_name}/에 저장)
+            collection_name: 컬렉션 이름
+            mmap: True면 임베딩 행렬을 메모리 맵으로 로드
+        """
+        self.persist_directory = persist_directory
+        self.collection_name = collection_name
+        self.collection_dir = Path(persist_directory) / "numpy" / collection_name
+        self.mmap = mmap
+
+        self.embeddings = np.empty((0, 0), dtype=np.float32)
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict] = []
+        self._mask_cache: Dict[tuple, np.ndarray] = {}
+
+        if (self.collection_dir / "embeddings.npy").exists():
+            self._load()
+            logger.info("기존 컬렉션 로드: %s (%d개 문서)", collection_name, len(self.ids))
+        else:
+            logger.info("새 컬렉션 생성: %s", collection_name)
+
+    def _load(self):
+        """디스크에서 임베딩 행렬과 문서 정보 로드"""
+        self.embeddings = np.load(
+            self.collection_dir / "embeddings.npy",
+            mmap_mode="r" if self.mmap else None
+        )
+        with open(self.collection_dir / "docs.json", 'r', encoding='utf-8') as f:
+            docs = json.load(f)
+        self.ids = docs["ids"]
+        self.documents = docs["documents"]
+        self.metadatas = docs["metadatas"]
+        self._mask_cache = {}
+
+    def _save(self):
+        """임베딩 행렬과 문서 정보를 디스크에 저장"""
+        self.collection_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.collection_dir / "embeddings.tmp.npy"
+        np.save(tmp_file, np.ascontiguousarray(self.embeddings, dtype=np.float32))
+        tmp_file.replace(self.collection_dir / "embeddings.npy")
+
+        with open(self.collection_dir / "docs.json", 'w', encoding='utf-8') as f:
+            json.dump({
+                "ids": self.ids,
+                "documents": self.documents,
+                "metadatas": self.metadatas
+            }, f, ensure_ascii=False)
+
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict],
+        ids: Optional[List[str]] = None
+    ):
+        """
+        문서와 임베딩을 벡터 스토어에 추가
+
+        Args:
+            documents: 문서 텍스트 리스트
+            embeddings: 임베딩 벡터 배열
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트 (없으면 자동 생성)
+        """
+        if ids is None:
+            ids = [f"doc_{i}" for i in range(len(self.ids), len(self.ids) + len(documents))]
+
+        logger.info("%d개 문서를 벡터 스토어에 추가 중...", len(documents))
+
+        new_embeddings = normalize_embeddings(embeddings)
+        if len(self.ids) == 0:
+            self.embeddings = new_embeddings
+        else:
+            self.embeddings = np.vstack([self.embeddings, new_embeddings])
+        self.ids.extend(ids)
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+
+        self._save()
+        # 저장된 파일을 다시 열어 메모리 맵 모드 유지
+        self._load()
+
+        logger.info("%d개 문서 추가 완료", len(documents))
+
+    def upsert_documents(
+        self,
+        documents: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict],
+        ids: List[str]
+    ):
+        """
+        문서 추가 (같은 ID가 있으면 교체, 저장은 한 번)
+
+        Args:
+            documents: 문서 텍스트 리스트
+            embeddings: 임베딩 벡터 배열
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트
+        """
+        new_embeddings = normalize_embeddings(embeddings)
+        if len(self.ids) == 0:
+            matrix = np.empty((0, new_embeddings.shape[1]), dtype=np.float32)
+        else:
+            # 메모리 맵(읽기 전용)을 복사한 뒤 수정
+            matrix = np.array(self.embeddings, dtype=np.float32)
+
+        positions = {doc_id: i for i, doc_id in enumerate(self.ids)}
+        appended = []
+        for row, doc_id in enumerate(ids):
+            i = positions.get(doc_id)
+            if i is None:
+                positions[doc_id] = len(self.ids)
+                self.ids.append(doc_id)
+                self.documents.append(documents[row])
+                self.metadatas.append(metadatas[row])
+                appended.append(row)
+            elif i < len(matrix):
+                matrix[i] = new_embeddings[row]
+                self.documents[i] = documents[row]
+                self.metadatas[i] = metadatas[row]
+            else:
+                # 같은 호출에서 먼저 추가된 ID
+                appended[i - len(matrix)] = row
+                self.documents[i] = documents[row]
+                self.metadatas[i] = metadatas[row]
+
+        if appended:
+            matrix = np.vstack([matrix, new_embeddings[appended]])
+        self.embeddings = matrix
+
+        self._save()
+        self._load()
+
+    def delete_documents(self, ids: List[str]):
+        """ID로 문서 삭제 (저장은 한 번)"""
+        remove = set(ids)
+        keep = [i for i, doc_id in enumerate(self.ids) if doc_id not in remove]
+        if len(keep) == len(self.ids):
+            return
+
+        self.embeddings = np.asarray(self.embeddings)[keep]
+        self.ids = [self.ids[i] for i in keep]
+        self.documents = [self.documents[i] for i in keep]
+        self.metadatas = [self.metadatas[i] for i in keep]
+
+        self._save()
+        self._load()
+
+    def reopen(self) -> "NumpyVectorStore":
+        """디스크의 최신 내용으로 새 인스턴스 생성 (검색 중인 기존 인스턴스는 그대로 유지)"""
+        return NumpyVectorStore(self.persist_directory, self.collection_name, mmap=self.mmap)
+
+    def get_ids(self) -> List[str]:
+        """저장된 문서 ID 전체 반환"""
+        return list(self.ids)
+
+    def _filter_mask(self, filter_dict: Dict) -> np.ndarray:
+        """
+        메타데이터 필터에 해당하는 문서 boolean mask
+        조건별 mask는 한 번 계산 후 캐싱 (ChromaDB where의 일치/$eq/$ne/$in/$and/$or 지원)
+        """
+        if "$and" in filter_dict:
+            return np.logical_and.reduce([self._filter_mask(cond) for cond in filter_dict["$and"]])
+        if "$or" in filter_dict:
+            return np.logical_or.reduce([self._filter_mask(cond) for cond in filter_dict["$or"]])
+
+        mask = np.ones(len(self.ids), dtype=bool)
+        for key, condition in filter_dict.items():
+            if isinstance(condition, dict):
+                for op, value in condition.items():
+                    if op == "$eq":
+                        mask &= self._value_mask(key, value)
+                    elif op == "$ne":
+                        mask &= ~self._value_mask(key, value)
+                    elif op == "$in":
+                        mask &= np.logical_or.reduce([self._value_mask(key, v) for v in value]) if value else False
+                    elif op == "$nin":
+                        for v in value:
+                            mask &= ~self._value_mask(key, v)
+                    else:
+                        raise ValueError(f"지원하지 않는 필터 연산자: {op}")
+            else:
+                mask &= self._value_mask(key, condition)
+        return mask
+
+    def _value_mask(self, key: str, value: Any) -> np.ndarray:
+        """metadata[key] == value 인 문서 mask (캐싱)"""
+        cache_key = (key, value)
+        mask = self._mask_cache.get(cache_key)
+        if mask is None:
+            mask = np.fromiter(
+                (metadata.get(key) == value for metadata in self.metadatas),
+                dtype=bool,
+                count=len(self.metadatas)
+            )
+            self._mask_cache[cache_key] = mask
+        return mask
+
+    def similarity_search(
+        self,
+        query_embedding: np.ndarray,
+        k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        유사도 기반 검색
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            k: 반환할 문서 수
+            filter_dict: 메타데이터 필터 (예: {"source": "gdpp_brand"})
+
+        Returns:
+            검색 결과 리스트 (문서, 메타데이터, 거리)
+            거리는 코사인 거리 (= 1 - 코사인 유사도, ChromaDB 백엔드와 동일)
+        """
+        return self.similarity_search_batch(np.asarray(query_embedding)[None, :], k=k, filter_dict=filter_dict)[0]
+
+    def similarity_search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        여러 쿼리의 유사도 검색 (행렬 곱 한 번)
+
+        Args:
+            query_embeddings: 쿼리 임베딩 배열 (shape: [n_queries, embedding_dim])
+            k: 쿼리별 반환할 문서 수
+            filter_dict: 메타데이터 필터
+
+        Returns:
+            쿼리별 검색 결과 리스트
+        """
+        n_queries = len(query_embeddings)
+        if len(self.ids) == 0 or k <= 0:
+            return [[] for _ in range(n_queries)]
+
+        queries = normalize_embeddings(query_embeddings)
+        similarities = queries @ self.embeddings.T
+
+        if filter_dict:
+            similarities = np.where(self._filter_mask(filter_dict)[None, :], similarities, -np.inf)
+
+        k = min(k, similarities.shape[1])
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        top_sims = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-top_sims, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_sims = np.take_along_axis(top_sims, order, axis=1)
+
+        all_results = []
+        for row_ids, row_sims in zip(top, top_sims):
+            results = []
+            for idx, similarity in zip(row_ids, row_sims):
+                if similarity == -np.inf:
+                    break
+                results.append({
+                    "id": self.ids[idx],
+                    "document": self.documents[idx],
+                    "metadata": self.metadatas[idx],
+                    "distance": float(1.0 - similarity)
+                })
+            all_results.append(results)
+
+        return all_results
+
+    def get_collection_stats(self) -> Dict:
+        """컬렉션 통계 반환"""
+        return {
+            "collection_name": self.collection_name,
+            "document_count": len(self.ids),
+            "persist_directory": self.persist_directory
+        }
+
+    def delete_collection(self):
+        """컬렉션 삭제"""
+        if self.collection_dir.exists():
+            shutil.rmtree(self.collection_dir)
+        self.embeddings = np.empty((0, 0), dtype=np.float32)
+        self.ids, self.documents, self.metadatas = [], [], []
+        self._mask_cache = {}
+        logger.info("컬렉션 삭제됨: %s", self.collection_name)
@@ -0,0 +1,255 @@
+# File: src/rag/tokenizer.py
+"""
+토크나이저 모듈 - BM25 인덱스용 한국어 토큰화
+인덱스 구축과 쿼리 검색에 동일한 토크나이저를 사용
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.tokenizer")
+
+
+# 부스 번호(1-G12), 영문/숫자 단어, 한글 단어, 기타 문자 단어
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+(?:-[0-9a-z]+)*|[가-힣]+|\w+")
+
+
+def normalize_text(text: str) -> str:
+    """소문자 변환 및 공백 정리"""
+    return " ".join(text.lower().split())
+
+
+def split_words(text: str) -> List[str]:
+    """정규화된 텍스트를 단어 단위로 분리 (문장부호 제거)"""
+    return TOKEN_PATTERN.findall(normalize_text(text))
+
+
+class BaseTokenizer:
+    """토크나이저 기본 클래스"""
+
+    name = "base"
+    version = 1
+
+    def tokenize(self, text: str) -> List[str]:
+        raise NotImplementedError
+
+    def tokenize_batch(self, texts: List[str]) -> List[List[str]]:
+        """텍스트 리스트 토큰화"""
+        return [self.tokenize(text) for text in texts]
+
+    @property
+    def signature(self) -> str:
+        """토큰화 결과 캐시 키에 사용되는 식별자"""
+        return f"{self.name}:v{self.version}"
+
+
+class WhitespaceTokenizer(BaseTokenizer):
+    """공백 기반 토크나이저 (기존 방식)"""
+
+    name = "whitespace"
+
+    def tokenize(self, text: str) -> List[str]:
+        return text.split()
+
+
+class CharNgramTokenizer(BaseTokenizer):
+    """
+    문자 n-gram 토크나이저
+    조사가 붙은 단어도 어간 n-gram이 겹치므로 형태소 분석 없이 재현율 확보
+    """
+
+    name = "ngram"
+
+    def __init__(self, n: int = 2):
+        """
+        Args:
+            n: n-gram 길이
+        """
+        if n < 1:
+            raise ValueError("n은 1 이상이어야 합니다")
+        self.n = n
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}:v{self.version}:n={self.n}"
+
+    def tokenize(self, text: str) -> List[str]:
+        tokens = []
+        for word in split_words(text):
+            # 영문/숫자 단어와 짧은 단어는 그대로 사용
+            if len(word) <= self.n or not _is_hangul(word):
+                tokens.append(word)
+                continue
+            tokens.extend(word[i:i + self.n] for i in range(len(word) - self.n + 1))
+        return tokens
+
+
+class KoreanTokenizer(BaseTokenizer):
+    """
+    조사/어미 제거 토크나이저 (순수 Python)
+    한글 단어 끝의 조사·어미를 최장 일치로 한 번 제거하여 어간만 남김
+    예: "건강백서캣은" → "건강백서캣", "사료를" → "사료", "추천해줘" → "추천"
+    끝음절이 한 글자 조사와 같은 명사("전문가", "고양이과")는 NOUNS로 보호
+    """
+
+    name = "korean"
+    version = 2
+
+    # 조사 ('이'는 "고양이" 등 명사 끝음절과 겹쳐 제외)
+    JOSA = [
+        "에서부터", "으로부터", "에게서", "한테서", "이라는", "이라고", "이랑은",
+        "에서는", "에서도", "으로는", "으로도", "에게는", "까지는", "부터는",
+        "에서", "에게", "한테", "께서", "으로", "로서", "로써", "까지", "부터",
+        "처럼", "보다", "마다", "밖에", "이나", "이랑", "하고", "라는", "라고",
+        "이란", "에는", "에도", "와는", "과는", "은", "는", "가", "을", "를",
+        "의", "에", "로", "와", "과", "도", "만", "랑", "란", "께", "나",
+    ]
+
+    # 어미 및 서술형 표현 (질문형 쿼리에서 주로 등장)
+    EOMI = [
+        "해주실래요", "해주세요", "해주시나요", "알려주세요", "알려줄래",
+        "인가요", "일까요", "할까요", "하나요", "되나요", "있나요", "없나요",
+        "했어요", "해줘요", "해줄래", "입니다", "합니다", "됩니다", "습니다",
+        "이에요", "예요", "이야", "해줘", "해요", "하는", "했다", "한다",
+        "하다", "되는", "된다", "나요", "까요", "알려줘",
+    ]
+
+    # 끝음절이 한 글자 조사와 같은 명사/브랜드 (이 단어로 끝나면 조사를 제거하지 않음)
+    NOUNS = [
+        "전문가", "애호가", "작가", "호사가", "평론가", "오메가", "특가", "정가", "할인가",
+        "판매가", "평가", "추가", "고양이과", "백합과", "아보카도", "만족도",
+        "선호도", "온도", "습도", "바나나", "하나하나", "아카나", "포모나", "파라랑",
+        "꼬랑꼬랑", "가르랑", "동그란",
+    ]
+
+    def __init__(self, min_stem_length: int = 2):
+        """
+        Args:
+            min_stem_length: 한 글자 조사 제거 시 남아야 하는 최소 어간 길이
+        """
+        self.min_stem_length = min_stem_length
+        # 최장 일치를 위해 길이 역순 정렬
+        self.suffixes = sorted(set(self.JOSA + self.EOMI), key=len, reverse=True)
+        self.nouns = tuple(self.NOUNS)
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}:v{self.version}:min_stem={self.min_stem_length}"
+
+    def strip_suffix(self, word: str) -> str:
+        """단어 끝의 조사/어미 제거"""
+        if not _is_hangul(word) or word.endswith(self.nouns):
+            return word
+        for suffix in self.suffixes:
+            if not word.endswith(suffix):
+                continue
+            stem = word[:-len(suffix)]
+            min_length = self.min_stem_length if len(suffix) == 1 else 1
+            if len(stem) >= min_length:
+                return stem
+        return word
+
+    def tokenize(self, text: str) -> List[str]:
+        return [self.strip_suffix(word) for word in split_words(text)]
+
+
+def _is_hangul(word: str) -> bool:
+    return all("가" <= ch <= "힣" for ch in word)
+
+
+TOKENIZERS: Dict[str, Type[BaseTokenizer]] = {
+    WhitespaceTokenizer.name: WhitespaceTokenizer,
+    CharNgramTokenizer.name: CharNgramTokenizer,
+    KoreanTokenizer.name: KoreanTokenizer,
+}
+
+
+def get_tokenizer(name: str = "korean", **kwargs) -> BaseTokenizer:
+    """
+    이름으로 토크나이저 생성
+
+    Args:
+        name: 토크나이저 이름 (whitespace, ngram, korean)
+        **kwargs: 토크나이저 생성 인자
+
+    Returns:
+        토크나이저 인스턴스
+    """
+    if name not in TOKENIZERS:
+        raise ValueError(f"지원하지 않는 토크나이저: {name} (사용 가능: {list(TOKENIZERS)})")
+    return TOKENIZERS[name](**kwargs)
+
+
+def corpus_cache_key(documents: List[str], tokenizer: BaseTokenizer) -> str:
+    """문서 내용과 토크나이저 설정으로 캐시 키 생성"""
+    digest = hashlib.sha256(tokenizer.signature.encode("utf-8"))
+    for doc in documents:
+        digest.update(b"\x00")
+        digest.update(doc.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def tokenize_corpus(
+    documents: List[str],
+    tokenizer: BaseTokenizer,
+    cache_dir: Optional[str] = None
+) -> List[List[str]]:
+    """
+    문서 리스트 토큰화 (캐시 사용)
+    문서 내용과 토크나이저 설정이 같으면 캐시된 토큰을 재사용
+
+    Args:
+        documents: 문서 텍스트 리스트
+        tokenizer: 토크나이저
+        cache_dir: 토큰 캐시 디렉토리 (None이면 캐시 미사용)
+
+    Returns:
+        토큰 리스트의 리스트
+    """
+    if cache_dir is None:
+        return tokenizer.tokenize_batch(documents)
+
+    cache_key = corpus_cache_key(documents, tokenizer)
+    cache_file = Path(cache_dir) / f"bm25_tokens_{tokenizer.name}.json"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key:
+                logger.info("토큰 캐시 사용: %s", cache_file)
+                return cached["tokens"]
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            logger.warning("토큰 캐시 로드 실패, 재토큰화: %s", e)
+
+    tokens = tokenizer.tokenize_batch(documents)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"key": cache_key, "tokenizer": tokenizer.signature, "tokens": tokens}, f, ensure_ascii=False)
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning("토큰 캐시 저장 실패: %s", e)
+
+    return tokens
+
+
+if __name__ == "__main__":
+    # 테스트
+    samples = [
+        "건강백서캣은 고양이 건강 관리 전문 브랜드입니다.",
+        "고양이 사료를 추천해줘",
+        "1-G12 부스 번호는 뭐가 있어?",
+    ]
+
+    for name in TOKENIZERS:
+        tokenizer = get_tokenizer(name)
+        print(f"\n[{tokenizer.signature}]")
+        for text in samples:
+            print(f"  {text} → {tokenizer.tokenize(text)}")
@@ -1,6 +1,7 @@
 # File: src/rag/vector_store.py
 """
 벡터 데이터베이스 모듈 - ChromaDB 사용
+정규화된 임베딩을 코사인 거리(hnsw:space=cosine) 컬렉션에 저장하여 NumpyVectorStore와 같은 거리 반환
 """
 import chromadb
 from chromadb.config import Settings
@@ -9,6 +10,15 @@ from typing import List, Dict, Optional
 from pathlib import Path
 import numpy as np
 
+from src.rag.numpy_vector_store import normalize_embeddings
+from src.utils.logger import get_logger
+
+logger = get_logger("rag.vector_store")
+
+
+# 컬렉션 거리 함수 (생성 후에는 바꿀 수 없음)
+DISTANCE_SPACE = "cosine"
+
 
 class VectorStore:
     """ChromaDB를 사용한 벡터 데이터베이스 관리"""
@@ -30,13 +40,33 @@ class VectorStore:
         # 컬렉션 생성 또는 가져오기
         try:
             self.collection = self.client.get_collection(name=collection_name)
-            print(f"[INFO] 기존 컬렉션 로드: {collection_name}")
+            logger.info("기존 컬렉션 로드: %s", collection_name)
+            if self.distance_space != DISTANCE_SPACE:
+                logger.warning(
+                    "컬렉션 거리 함수가 %s입니다 (NumPy 백엔드와 점수가 다름) - build_vectordb.py로 다시 구축하세요: %s",
+                    self.distance_space, collection_name
+                )
         except:
-            self.collection = self.client.create_collection(
-                name=collection_name,
-                metadata={"description": "GDPP AI Docent Knowledge Base"}
-            )
-            print(f"[INFO] 새 컬렉션 생성: {collection_name}")
+            self.collection = self._create_collection()
+            logger.info("새 컬렉션 생성: %s", collection_name)
+    
+    def _create_collection(self):
+        """코사인 거리 컬렉션 생성"""
+        return self.client.create_collection(
+            name=self.collection_name,
+            metadata={"description": "GDPP AI Docent Knowledge Base", "hnsw:space": DISTANCE_SPACE}
+        )
+    
+    @property
+    def distance_space(self) -> str:
+        """컬렉션 거리 함수 (지정하지 않고 만든 기존 컬렉션은 l2)"""
+        return (self.collection.metadata or {}).get("hnsw:space", "l2")
+    
+    def recreate_collection(self):
+        """컬렉션을 비우고 코사인 거리로 다시 생성 (이전 l2 컬렉션 이전용)"""
+        self.client.delete_collection(name=self.collection_name)
+        self.collection = self._create_collection()
+        logger.info("컬렉션 재생성 (%s): %s", DISTANCE_SPACE, self.collection_name)
     
     def add_documents(
         self,
@@ -57,10 +87,10 @@ class VectorStore:
         if ids is None:
             ids = [f"doc_{i}" for i in range(len(documents))]
         
-        print(f"[INFO] {len(documents)}개 문서를 벡터 DB에 추가 중...")
+        logger.info("%d개 문서를 벡터 DB에 추가 중...", len(documents))
         
         # ChromaDB는 리스트 형태의 임베딩을 요구
-        embeddings_list = embeddings.tolist()
+        embeddings_list = normalize_embeddings(embeddings).tolist()
         
         self.collection.add(
             documents=documents,
@@ -69,7 +99,39 @@ class VectorStore:
             ids=ids
         )
         
-        print(f"[SUCCESS] {len(documents)}개 문서 추가 완료")
+        logger.info("%d개 문서 추가 완료", len(documents))
+    
+    def upsert_documents(
+        self,
+        documents: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict],
+        ids: List[str]
+    ):
+        """
+        문서 추가 (같은 ID가 있으면 교체)
+        
+        Args:
+            documents: 문서 텍스트 리스트
+            embeddings: 임베딩 벡터 배열
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트
+        """
+        self.collection.upsert(
+            documents=documents,
+            embeddings=normalize_embeddings(embeddings).tolist(),
+            metadatas=metadatas,
+            ids=ids
+        )
+    
+    def delete_documents(self, ids: List[str]):
+        """ID로 문서 삭제"""
+        if ids:
+            self.collection.delete(ids=ids)
+    
+    def get_ids(self) -> List[str]:
+        """저장된 문서 ID 전체 반환"""
+        return self.collection.get(include=[])["ids"]
     
     def similarity_search(
         self,
@@ -87,9 +149,10 @@ class VectorStore:
             
         Returns:
             검색 결과 리스트 (문서, 메타데이터, 거리)
+            거리는 코사인 거리 (= 1 - 코사인 유사도, NumpyVectorStore와 동일)
         """
         # 쿼리 임베딩을 리스트로 변환
-        query_embedding_list = query_embedding.tolist()
+        query_embedding_list = normalize_embeddings(query_embedding).tolist()
         
         # 검색 수행
         results = self.collection.query(
@@ -110,6 +173,46 @@ class VectorStore:
         
         return formatted_results
     
+    def similarity_search_batch(
+        self,
+        query_embeddings: np.ndarray,
+        k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        여러 쿼리의 유사도 검색 (ChromaDB 쿼리 한 번)
+        
+        Args:
+            query_embeddings: 쿼리 임베딩 배열 (shape: [n_queries, embedding_dim])
+            k: 쿼리별 반환할 문서 수
+            filter_dict: 메타데이터 필터
+            
+        Returns:
+            쿼리별 검색 결과 리스트
+        """
+        if len(query_embeddings) == 0:
+            return []
+        
+        results = self.collection.query(
+            query_embeddings=normalize_embeddings(query_embeddings).tolist(),
+            n_results=k,
+            where=filter_dict
+        )
+        
+        all_results = []
+        for q in range(len(results['ids'])):
+            all_results.append([
+                {
+                    "id": results['ids'][q][i],
+                    "document": results['documents'][q][i],
+                    "metadata": results['metadatas'][q][i],
+                    "distance": results['distances'][q][i]
+                }
+                for i in range(len(results['ids'][q]))
+            ])
+        
+        return all_results
+    
     def get_collection_stats(self) -> Dict:
         """컬렉션 통계 반환"""
         count = self.collection.count()
@@ -122,12 +225,12 @@ class VectorStore:
     def delete_collection(self):
         """컬렉션 삭제"""
         self.client.delete_collection(name=self.collection_name)
-        print(f"[INFO] 컬렉션 삭제됨: {self.collection_name}")
+        logger.info("컬렉션 삭제됨: %s", self.collection_name)
 
 
 if __name__ == "__main__":
     # 테스트
-    from embedder import KoSBERTEmbedder
+    from src.rag.embedder import KoSBERTEmbedder
     
     # 임베더 초기화
     embedder = KoSBERTEmbedder()
@@ -0,0 +1,7 @@
+# File: src/utils/__init__.py
+"""
+공통 유틸리티 모듈 초기화
+"""
+from .logger import get_logger, setup_logging, set_request_id, request_id_var
+
+__all__ = ['get_logger', 'setup_logging', 'set_request_id', 'request_id_var']
@@ -0,0 +1,189 @@
+# File: src/utils/logger.py
+"""
+구조화 로깅 모듈
+- 서브시스템별 로거(gdpp.api, gdpp.auth, gdpp.rag 등)와 레벨 설정 (LOG_LEVEL, LOG_LEVELS)
+- 요청 ID(contextvar)를 모든 로그에 포함
+- QueueHandler + QueueListener로 실제 출력은 별도 스레드에서 처리 (요청 처리 중 stdout 쓰기 대기 없음)
+- 텍스트 또는 JSON 한 줄 형식 (LOG_FORMAT=text|json)
+"""
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+
+ROOT_LOGGER = "gdpp"
+
+# 현재 요청 ID (요청 미들웨어에서 설정, 요청 밖에서는 "-")
+request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="-")
+
+# LogRecord 기본 속성 (JSON 출력 시 extra 필드 구분용)
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def new_request_id() -> str:
+    """새 요청 ID 생성"""
+    return uuid.uuid4().hex[:12]
+
+
+def set_request_id(request_id: Optional[str] = None) -> contextvars.Token:
+    """
+    현재 컨텍스트의 요청 ID 설정
+
+    Args:
+        request_id: 요청 ID (None이면 새로 생성)
+
+    Returns:
+        request_id_var.reset()에 전달할 토큰
+    """
+    return request_id_var.set(request_id or new_request_id())
+
+
+class RequestIdFilter(logging.Filter):
+    """로그 레코드에 현재 요청 ID 추가 (로그를 남긴 스레드/태스크에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON 한 줄 형식 (extra로 전달한 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s [%(name)s] [%(request_id)s] %(message)s"
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    메시지와 예외만 호출 스레드에서 문자열로 만들고 나머지 포맷(text/json)은 출력 스레드에서 처리
+    (기본 QueueHandler는 포맷을 끝낸 문자열만 넘기므로 JSON 필드가 사라짐)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def parse_levels(spec: Optional[str]) -> Dict[str, str]:
+    """
+    서브시스템별 레벨 파싱
+
+    Args:
+        spec: "auth=WARNING,rag=DEBUG" 형식 문자열
+
+    Returns:
+        {서브시스템: 레벨}
+    """
+    levels = {}
+    for part in (spec or "").split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    levels: Optional[Dict[str, str]] = None,
+    fmt: Optional[str] = None,
+    stream=None
+):
+    """
+    gdpp 로거 설정 (여러 번 호출하면 이전 설정을 교체)
+
+    Args:
+        level: 기본 레벨 (None이면 LOG_LEVEL, 기본 INFO)
+        levels: 서브시스템별 레벨 (None이면 LOG_LEVELS)
+        fmt: text 또는 json (None이면 LOG_FORMAT, 기본 text)
+        stream: 출력 스트림 (기본 stdout)
+    """
+    global _listener
+
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+        level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+        levels = levels if levels is not None else parse_levels(os.getenv("LOG_LEVELS"))
+        fmt = (fmt or os.getenv("LOG_FORMAT", "text")).lower()
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JsonFormatter() if fmt == "json" else logging.Formatter(TEXT_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        queue_handler = _QueueHandler(log_queue)
+        queue_handler.addFilter(RequestIdFilter())
+
+        root = logging.getLogger(ROOT_LOGGER)
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        root.propagate = False
+
+        for name, sub_level in levels.items():
+            logging.getLogger(f"{ROOT_LOGGER}.{name}").setLevel(sub_level)
+
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    서브시스템 로거 반환 (설정 전이면 환경 변수 기준으로 기본 설정)
+
+    Args:
+        name: 서브시스템 이름 (예: "api", "auth", "rag.embedder")
+
+    Returns:
+        gdpp.<name> 로거
+    """
+    if _listener is None:
+        setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
@@ -0,0 +1,106 @@
+"""
+Benchmark: brand_list extraction from the GDPP brand page
+기존 방식(BeautifulSoup 파싱 + 문자 단위 괄호 카운팅)과 원문 raw_decode 추출을 tests/page_source.html로 비교
+"""
+import json
+import sys
+import time
+sys.path.append('.')
+
+from bs4 import BeautifulSoup
+
+from src.crawler.gdpp_crawler import extract_brand_list
+
+ROUNDS = 5
+
+
+def legacy_extract(content: bytes):
+    """기존 extract_brands의 추출 방식 (DOM 생성 + 문자 단위 괄호 카운팅)"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for script in soup.find_all('script'):
+        if script.string and 'brand_list:' in script.string:
+            text = script.string
+            array_start = text.find('[', text.find('brand_list:'))
+            bracket_count = 0
+            in_string = False
+            escape_next = False
+            for j, char in enumerate(text[array_start:], start=array_start):
+                if escape_next:
+                    escape_next = False
+                    continue
+                if char == '\\\\':
+                    escape_next = True
+                    continue
+                if char == '"' and not escape_next:
+                    in_string = not in_string
+                if not in_string:
+                    if char == '[':
+                        bracket_count += 1
+                    elif char == ']':
+                        bracket_count -= 1
+                        if bracket_count == 0:
+                            return json.loads(text[array_start:j + 1])
+    return None
+
+
+def soup_raw_decode(content: bytes):
+    """DOM은 만들고 script 본문에서 raw_decode"""
+    soup = BeautifulSoup(content, 'html.parser')
+    for script in soup.find_all('script'):
+        if script.string and 'brand_list' in script.string:
+            brand_data = extract_brand_list(script.string)
+            if brand_data is not None:
+                return brand_data
+    return None
+
+
+def measure(func, content):
+    times = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = func(content)
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def main():
+    with open('tests/page_source.html', 'rb') as f:
+        content = f.read()
+    with open('tests/brand_list_raw.json', 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+
+    print("=" * 60)
+    print(f"brand_list 추출 벤치마크 (페이지 {len(content):,} bytes, {ROUNDS}회 중 최소)")
+    print("=" * 60)
+
+    results = {}
+    for name, func in [
+        ("BeautifulSoup + 괄호 카운팅 (기존)", legacy_extract),
+        ("BeautifulSoup + raw_decode", soup_raw_decode),
+        ("원문 bytes + raw_decode", extract_brand_list),
+    ]:
+        brand_data, seconds = measure(func, content)
+        assert brand_data == expected, f"{name}: brand_list_raw.json과 결과가 다릅니다"
+        results[name] = seconds
+        print(f"{name:<36} {seconds * 1000:9.2f} ms  ({len(brand_data)}개)")
+
+    baseline = results["BeautifulSoup + 괄호 카운팅 (기존)"]
+    fastest = results["원문 bytes + raw_decode"]
+    print(f"\n속도 향상: {baseline / fastest:.1f}x")
+
+    # 이스케이프된 따옴표/괄호가 들어 있는 문자열 (기존 루프는 '\\\\'와 비교해 이스케이프를 처리하지 못함)
+    tricky = 'data: { brand_list: [{"PR_NAME_KR": "캣\\"타워\\" [특가]"}], visible_brand_list: [] }'
+    assert extract_brand_list(tricky) == [{"PR_NAME_KR": '캣"타워" [특가]'}]
+    assert extract_brand_list(tricky.encode('utf-8')) == [{"PR_NAME_KR": '캣"타워" [특가]'}]
+    assert extract_brand_list('visible_brand_list: []') is None
+    print("[PASS] 이스케이프 문자열 / visible_brand_list 구분")
+
+    # bytes: 중첩 배열, 문자열 속 괄호, 역슬래시로 끝나는 문자열, 배열 뒤의 잘못된 UTF-8
+    nested = '{ brand_list: [{"TAG": ["간식", "]"], "PATH": "C:\\\\"}, []], other: 1 }'.encode('utf-8') + b'\xff\xfe'
+    assert extract_brand_list(nested) == [{"TAG": ["간식", "]"], "PATH": "C:\\"}, []]
+    assert extract_brand_list(b'brand_list: [{"PR_NAME_KR": "unterminated"') is None
+    print("[PASS] bytes 입력 (중첩 배열, 문자열 속 괄호, 닫히지 않은 배열)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: query embedding throughput with and without QueryBatcher
+동시 호출자 1/8/32명 기준으로 개별 embed_query 호출과 마이크로 배칭을 비교
+"""
+import asyncio
+import sys
+import time
+sys.path.append('.')
+
+from src.rag.embedder import KoSBERTEmbedder, QueryBatcher
+
+CONCURRENCY_LEVELS = [1, 8, 32]
+QUERIES_PER_CALLER = 16
+
+BASE_QUERIES = [
+    "부스 위치 알려줘",
+    "재입장 되나요",
+    "건강백서캣 부스 번호 알려줘",
+    "고양이 사료 추천해줘",
+    "반려동물 동반 입장 가능한가요?",
+    "사전예매 취소는 어떻게 하나요?",
+    "페티코는 어떤거 판매하는 곳이야?",
+    "고양이 품종은 어떤 것들이 있나요?",
+]
+
+
+def make_queries(caller: int):
+    # 캐시 효과를 배제하기 위해 호출자/순번마다 다른 쿼리 생성
+    return [
+        f"{BASE_QUERIES[(caller + i) % len(BASE_QUERIES)]} {caller}-{i}"
+        for i in range(QUERIES_PER_CALLER)
+    ]
+
+
+async def run_direct(embedder, concurrency):
+    """요청마다 embed_query를 스레드에서 개별 호출 (기존 방식)"""
+    loop = asyncio.get_running_loop()
+
+    async def caller(idx):
+        for query in make_queries(idx):
+            await loop.run_in_executor(None, embedder.embed_query, query)
+
+    await asyncio.gather(*(caller(i) for i in range(concurrency)))
+
+
+async def run_batched(batcher, concurrency):
+    """QueryBatcher로 동시 요청을 모아서 인코딩"""
+    async def caller(idx):
+        for query in make_queries(idx):
+            await batcher.embed(query)
+
+    await asyncio.gather(*(caller(i) for i in range(concurrency)))
+
+
+async def main():
+    embedder = KoSBERTEmbedder(query_cache_size=0)
+    embedder.embed_query("워밍업")
+
+    print("=" * 60)
+    print("쿼리 임베딩 처리량 벤치마크")
+    print("=" * 60)
+    print(f"{'callers':>8} {'direct q/s':>12} {'batched q/s':>12} {'speedup':>8} {'avg batch':>10}")
+
+    for concurrency in CONCURRENCY_LEVELS:
+        total = concurrency * QUERIES_PER_CALLER
+
+        start = time.perf_counter()
+        await run_direct(embedder, concurrency)
+        direct_qps = total / (time.perf_counter() - start)
+
+        batcher = QueryBatcher(embedder, max_batch_size=32, max_wait_ms=5.0)
+        start = time.perf_counter()
+        await run_batched(batcher, concurrency)
+        batched_qps = total / (time.perf_counter() - start)
+        stats = batcher.stats()
+        await batcher.close()
+
+        print(
+            f"{concurrency:>8} {direct_qps:>12.1f} {batched_qps:>12.1f} "
+            f"{batched_qps / direct_qps:>7.2f}x {stats['avg_batch_size']:>10.1f}"
+        )
+
+
+asyncio.run(main())
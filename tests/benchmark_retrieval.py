@@ -0,0 +1,223 @@
+"""
+Benchmark: retrieval quality and per-stage latency on the golden query set
+tests/golden_queries.json의 라벨된 쿼리(부스, 브랜드, 상품, FAQ, 위키백과)로 HybridRetriever를 평가하여
+recall@k, MRR과 단계별(embed, vector, bm25, fuse) p50/p95/p99 지연시간을 JSON으로 저장
+결합 전략의 min_score(챗봇 문서 필터링 임계값)를 적용했을 때 남는 관련/비관련 문서 비율도 함께 보고 (임계값 보정용)
+
+Usage:
+    python tests/benchmark_retrieval.py --fusion weighted --k 5
+    python tests/benchmark_retrieval.py --fusion rrf --output data/benchmarks/rrf.json --compare data/benchmarks/weighted.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+sys.path.append('.')
+
+from src.rag.embedder import KoSBERTEmbedder
+from src.rag.vector_store import VectorStore
+from src.rag.numpy_vector_store import NumpyVectorStore
+from src.rag.hybrid_retriever import HybridRetriever
+
+STAGES = ["embed", "vector", "bm25", "fuse", "total"]
+
+
+def is_relevant(result, criteria):
+    """결과 문서가 라벨 조건 중 하나라도 만족하는지 확인 (메타데이터 일치 + text_contains)"""
+    for criterion in criteria:
+        matched = True
+        for key, value in criterion.items():
+            if key == "text_contains":
+                matched = value in result['document']
+            else:
+                matched = result['metadata'].get(key) == value
+            if not matched:
+                break
+        if matched:
+            return True
+    return False
+
+
+def count_relevant(retriever, criteria):
+    """코퍼스 전체에서 관련 문서 수 (recall 분모)"""
+    return sum(
+        is_relevant({"document": document, "metadata": metadata}, criteria)
+        for document, metadata in zip(retriever.documents, retriever.metadatas)
+    )
+
+
+def percentiles(values):
+    values = sorted(values)
+
+    def pick(p):
+        return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+    return {
+        "mean": round(statistics.mean(values), 3),
+        "p50": round(pick(50), 3),
+        "p95": round(pick(95), 3),
+        "p99": round(pick(99), 3)
+    }
+
+
+def run_query(retriever, query, k, strategy):
+    """hybrid_search가 기록한 단계별 시간으로 검색 (결과 캐시 미사용이므로 항상 캐시 미스)"""
+    timings = {}
+    results = retriever.hybrid_search(query, k=k, fusion=strategy.name, timings=timings)
+    assert not timings.pop("cache_hit"), "벤치마크는 결과 캐시 없이 실행해야 합니다"
+    return results, {stage: seconds * 1000 for stage, seconds in timings.items()}
+
+
+def filter_report(per_query, min_score):
+    """상위 k개 결과에 min_score를 적용했을 때 관련 문서 유지율 / 비관련 문서 제거율"""
+    relevant = [score for row in per_query for score, is_rel in row['scores'] if is_rel]
+    irrelevant = [score for row in per_query for score, is_rel in row['scores'] if not is_rel]
+    report = {
+        "min_score": min_score,
+        "relevant_scores": percentiles(relevant) if relevant else None,
+        "irrelevant_scores": percentiles(irrelevant) if irrelevant else None
+    }
+    if min_score is not None:
+        report["relevant_kept"] = round(statistics.mean(s >= min_score for s in relevant), 4) if relevant else None
+        report["irrelevant_dropped"] = round(statistics.mean(s < min_score for s in irrelevant), 4) if irrelevant else None
+    return report
+
+
+def evaluate(retriever, golden, k, fusion, repeat):
+    strategy = retriever.get_fusion(fusion)
+    latencies = defaultdict(list)
+    per_query = []
+
+    for item in golden:
+        for _ in range(repeat):
+            results, timings = run_query(retriever, item['query'], k, strategy)
+            for stage, ms in timings.items():
+                latencies[stage].append(ms)
+
+        ranks = [rank for rank, result in enumerate(results, 1) if is_relevant(result, item['relevant'])]
+        n_relevant = count_relevant(retriever, item['relevant'])
+        per_query.append({
+            "query": item['query'],
+            "category": item['category'],
+            "first_relevant_rank": ranks[0] if ranks else None,
+            "recall": len(ranks) / min(n_relevant, k) if n_relevant else 0.0,
+            "reciprocal_rank": 1.0 / ranks[0] if ranks else 0.0,
+            "top_ids": [result['id'] for result in results],
+            "scores": [
+                [round(result['hybrid_score'], 4), is_relevant(result, item['relevant'])]
+                for result in results
+            ]
+        })
+
+    def summarize(rows):
+        return {
+            f"recall@{k}": round(statistics.mean(row['recall'] for row in rows), 4),
+            f"hit@{k}": round(statistics.mean(row['first_relevant_rank'] is not None for row in rows), 4),
+            "mrr": round(statistics.mean(row['reciprocal_rank'] for row in rows), 4),
+            "queries": len(rows)
+        }
+
+    by_category = defaultdict(list)
+    for row in per_query:
+        by_category[row['category']].append(row)
+
+    return {
+        "summary": summarize(per_query),
+        "by_category": {category: summarize(rows) for category, rows in sorted(by_category.items())},
+        "latency_ms": {stage: percentiles(latencies[stage]) for stage in STAGES},
+        "filter": filter_report(per_query, strategy.min_score),
+        "queries": per_query
+    }
+
+
+def compare(current, previous_path):
+    """이전 결과 대비 지표 변화 출력"""
+    with open(previous_path, 'r', encoding='utf-8') as f:
+        previous = json.load(f)
+
+    print(f"\n[COMPARE] {previous_path} 대비")
+    for metric, value in current['summary'].items():
+        before = previous['summary'].get(metric)
+        if isinstance(value, float) and before is not None:
+            print(f"  {metric:>10}: {before:.4f} → {value:.4f} ({value - before:+.4f})")
+    for stage in STAGES:
+        before = previous['latency_ms'].get(stage, {}).get('p95')
+        after = current['latency_ms'][stage]['p95']
+        if before is not None:
+            print(f"  {stage:>10} p95: {before:.3f}ms → {after:.3f}ms ({after - before:+.3f}ms)")
+    changed = [
+        row['query'] for row, old in zip(current['queries'], previous['queries'])
+        if row['query'] == old['query'] and row['first_relevant_rank'] != old['first_relevant_rank']
+    ]
+    if changed:
+        print(f"  순위가 바뀐 쿼리 {len(changed)}개: {changed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retrieval quality/latency benchmark")
+    parser.add_argument("--golden", default="tests/golden_queries.json")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--fusion", default="weighted")
+    parser.add_argument("--backend", default=os.getenv("VECTOR_STORE_BACKEND", "chroma"), choices=["chroma", "numpy"])
+    parser.add_argument("--repeat", type=int, default=3, help="지연시간 측정을 위한 쿼리당 반복 횟수")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로 (기본: data/benchmarks/retrieval_<fusion>_k<k>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    with open(args.golden, 'r', encoding='utf-8') as f:
+        golden = json.load(f)
+
+    embedder = KoSBERTEmbedder(query_cache_size=0)
+    store_class = NumpyVectorStore if args.backend == "numpy" else VectorStore
+    vector_store = store_class(persist_directory="./data/vectordb", collection_name="gdpp_knowledge")
+    retriever = HybridRetriever(vector_store=vector_store, embedder=embedder, result_cache_size=0)
+
+    # 워밍업 (모델/메모리 맵 초기 로드 시간 제외)
+    for item in golden[:3]:
+        run_query(retriever, item['query'], args.k, retriever.get_fusion(args.fusion))
+
+    report = evaluate(retriever, golden, args.k, args.fusion, args.repeat)
+    report = {
+        "config": {
+            "golden": args.golden,
+            "k": args.k,
+            "fusion": args.fusion,
+            "backend": args.backend,
+            "repeat": args.repeat,
+            "tokenizer": retriever.tokenizer.signature,
+            "corpus_version": retriever.current_version(),
+            "num_docs": len(retriever.documents)
+        },
+        **report
+    }
+
+    print("=" * 60)
+    print(f"검색 벤치마크 (fusion={args.fusion}, k={args.k}, backend={args.backend})")
+    print("=" * 60)
+    print(f"[ALL] {report['summary']}")
+    for category, summary in report['by_category'].items():
+        print(f"  {category:>10}: {summary}")
+    print("\n[LATENCY] (ms)")
+    for stage, values in report['latency_ms'].items():
+        print(f"  {stage:>6}: p50={values['p50']:8.3f} p95={values['p95']:8.3f} p99={values['p99']:8.3f}")
+    print(f"\n[FILTER] {report['filter']}")
+    misses = [row['query'] for row in report['queries'] if row['first_relevant_rank'] is None]
+    if misses:
+        print(f"\n[MISS] 상위 {args.k}개에 관련 문서가 없는 쿼리: {misses}")
+
+    output = Path(args.output or f"data/benchmarks/retrieval_{args.fusion}_k{args.k}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n[SAVED] {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
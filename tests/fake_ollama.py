@@ -0,0 +1,213 @@
+"""
+Fake Ollama server for offline tests and load tests
+실제 모델 없이 /api/tags, /api/generate, /api/chat 을 흉내냄 (TTFT, 초당 토큰 수 설정 가능)
+
+Usage:
+    python tests/fake_ollama.py --port 11435 --tokens-per-sec 20 --ttft 0.5 --response-tokens 150
+    OLLAMA_BASE_URL=http://localhost:11435 uvicorn src.api.main:app
+"""
+import argparse
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+DEFAULT_RESPONSE = (
+    "건강백서캣은 고양이 건강 관리 전문 브랜드로 1-G12 부스에 있습니다. "
+    "영양제와 기능성 간식을 판매하고 있으니 방문해 보세요."
+)
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.fake.record("connections")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        fake = self.server.fake
+        if self.path == "/api/tags":
+            self._send_json(200, {"models": [{"name": fake.model}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        fake = self.server.fake
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path not in ("/api/generate", "/api/chat"):
+            self._send_json(404, {"error": "not found"})
+            return
+
+        fake.record("requests")
+        max_tokens = payload.get("options", {}).get("num_predict", 2048)
+        tokens = fake.tokens(max_tokens)
+        is_chat = self.path == "/api/chat"
+
+        with fake.active():
+            if payload.get("stream", True):
+                self._stream(fake, tokens, is_chat)
+            else:
+                self._complete(fake, tokens, is_chat)
+
+    def _final_fields(self, fake, tokens, started):
+        return {
+            "model": fake.model,
+            "done": True,
+            "eval_count": len(tokens),
+            "eval_duration": int(fake.generation_time(len(tokens)) * 1e9),
+            "prompt_eval_count": 64,
+            "total_duration": int((time.perf_counter() - started) * 1e9),
+        }
+
+    def _complete(self, fake, tokens, is_chat):
+        started = time.perf_counter()
+        time.sleep(fake.ttft + fake.generation_time(len(tokens)))
+        text = "".join(tokens)
+        body = self._final_fields(fake, tokens, started)
+        if is_chat:
+            body["message"] = {"role": "assistant", "content": text}
+        else:
+            body["response"] = text
+        self._send_json(200, body)
+
+    def _stream(self, fake, tokens, is_chat):
+        started = time.perf_counter()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        time.sleep(fake.ttft)
+        sent = 0
+        try:
+            for token in tokens:
+                if is_chat:
+                    body = {"model": fake.model, "message": {"role": "assistant", "content": token}, "done": False}
+                else:
+                    body = {"model": fake.model, "response": token, "done": False}
+                self._write_chunk(json.dumps(body, ensure_ascii=False).encode("utf-8") + b"\n")
+                sent += 1
+                time.sleep(1.0 / fake.tokens_per_sec)
+
+            final = self._final_fields(fake, tokens, started)
+            if is_chat:
+                final["message"] = {"role": "assistant", "content": ""}
+            else:
+                final["response"] = ""
+            self._write_chunk(json.dumps(final).encode("utf-8") + b"\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 연결을 끊으면 생성 중단
+            fake.record("cancelled")
+            fake.record("tokens_saved", len(tokens) - sent)
+            self.close_connection = True
+
+
+class FakeOllamaServer:
+    """스레드에서 실행되는 가짜 Ollama 서버"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        model: str = "fake-model",
+        tokens_per_sec: float = 50.0,
+        ttft: float = 0.2,
+        response_text: str = DEFAULT_RESPONSE,
+        response_tokens: Optional[int] = None
+    ):
+        self.model = model
+        self.tokens_per_sec = tokens_per_sec
+        self.ttft = ttft
+        self.response_text = response_text
+        self.response_tokens = response_tokens
+        self.counters = {"connections": 0, "requests": 0, "cancelled": 0, "tokens_saved": 0, "max_active": 0}
+        self._active = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), FakeOllamaHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def tokens(self, max_tokens: int):
+        # 공백 단위로 나눈 뒤 공백을 붙여 토큰처럼 사용
+        words = self.response_text.split(" ")
+        tokens = [word if i == 0 else " " + word for i, word in enumerate(words)]
+        if self.response_tokens:
+            # 응답 길이 지정 시 문장을 반복해서 채움
+            tokens = [tokens[i % len(tokens)] for i in range(self.response_tokens)]
+        return tokens[:max_tokens]
+
+    def generation_time(self, n_tokens: int) -> float:
+        return n_tokens / self.tokens_per_sec
+
+    def record(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] += value
+
+    @contextmanager
+    def active(self):
+        with self._lock:
+            self._active += 1
+            self.counters["max_active"] = max(self.counters["max_active"], self._active)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def start(self) -> "FakeOllamaServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake Ollama server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--tokens-per-sec", type=float, default=20.0)
+    parser.add_argument("--ttft", type=float, default=0.5)
+    parser.add_argument("--response-tokens", type=int, default=None, help="응답 토큰 수 (기본: 예시 문장 길이)")
+    args = parser.parse_args()
+
+    server = FakeOllamaServer(
+        args.host, args.port,
+        tokens_per_sec=args.tokens_per_sec,
+        ttft=args.ttft,
+        response_tokens=args.response_tokens
+    )
+    print(f"Fake Ollama listening on {server.url} (ttft={args.ttft}s, {args.tokens_per_sec} tok/s)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
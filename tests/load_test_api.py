@@ -0,0 +1,313 @@
+"""
+Load test: end-to-end throughput of the API with a fake Ollama
+가짜 Ollama(TTFT, 초당 토큰 수 설정)와 API 서버를 띄우고 가상 사용자들이 /api/chat, /api/chat/stream,
+대화 API를 섞어서 동시에 호출하여 시나리오별 처리량, 지연시간 백분위, 오류율을 측정
+
+Usage:
+    python tests/load_test_api.py --users 20 --duration 60 --tokens-per-sec 20 --ttft 0.5
+    python tests/load_test_api.py --mix chat=1,stream=3,conversations=1 --output data/benchmarks/load.json
+    python tests/load_test_api.py --base-url http://localhost:8000   # 이미 실행 중인 서버 대상
+
+주의: 가상 사용자마다 loadtest-*@example.com 계정을 data/gdpp.db에 생성 (대화는 종료 시 삭제)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from pathlib import Path
+sys.path.append('.')
+
+import httpx
+
+from tests.fake_ollama import FakeOllamaServer
+
+PASSWORD = "LoadTest1234"
+QUESTIONS = [
+    "건강백서캣 부스 위치 알려줘",
+    "고양이 정수기 파는 부스 있어?",
+    "재입장 되나요?",
+    "주차 가능한가요?",
+    "러시안 블루는 어떤 고양이야?",
+    "2-D01 부스는 어떤 브랜드야?",
+    "카사바 모래 파는 곳",
+    "사전예매 취소하고 환불받고 싶어요",
+]
+
+
+def pick_question(args):
+    question = random.choice(QUESTIONS)
+    if args.unique:
+        # 답변/검색 캐시를 우회하여 매번 생성까지 수행
+        question += f" ({uuid.uuid4().hex[:6]})"
+    return question
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def parse_mix(mix: str) -> dict:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    unknown = set(weights) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 시나리오: {sorted(unknown)} (사용 가능: {sorted(SCENARIOS)})")
+    return weights
+
+
+class Recorder:
+    """시나리오별 결과 수집"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.ttfts = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = Counter()
+
+    def record(self, scenario: str, status, latency: float, ttft: float = None):
+        self.statuses[scenario][str(status)] += 1
+        if isinstance(status, int) and status < 400:
+            self.latencies[scenario].append(latency * 1000)
+            if ttft is not None:
+                self.ttfts[scenario].append(ttft * 1000)
+        else:
+            self.errors[scenario] += 1
+
+    def report(self, elapsed: float) -> dict:
+        scenarios = {}
+        for scenario, statuses in sorted(self.statuses.items()):
+            total = sum(statuses.values())
+            latencies = self.latencies[scenario]
+            row = {
+                "requests": total,
+                "ok": len(latencies),
+                "error_rate": round(self.errors[scenario] / total, 4),
+                "throughput_rps": round(total / elapsed, 3),
+                "statuses": dict(sorted(statuses.items())),
+            }
+            if latencies:
+                row["latency_ms"] = {p: round(percentile(latencies, int(p[1:])), 1) for p in ("p50", "p95", "p99")}
+                row["latency_ms"]["max"] = round(max(latencies), 1)
+            if self.ttfts[scenario]:
+                row["ttft_ms"] = {p: round(percentile(self.ttfts[scenario], int(p[1:])), 1) for p in ("p50", "p95", "p99")}
+            scenarios[scenario] = row
+
+        total = sum(row["requests"] for row in scenarios.values())
+        errors = sum(self.errors.values())
+        return {
+            "elapsed_sec": round(elapsed, 2),
+            "requests": total,
+            "throughput_rps": round(total / elapsed, 3) if elapsed else 0.0,
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "scenarios": scenarios
+        }
+
+
+async def timed(recorder, scenario, request):
+    """요청 하나를 실행하고 상태 코드와 지연시간 기록"""
+    start = time.perf_counter()
+    try:
+        response = await request
+        status = response.status_code
+    except httpx.HTTPError as e:
+        response, status = None, type(e).__name__
+    recorder.record(scenario, status, time.perf_counter() - start)
+    return response
+
+
+async def scenario_chat(client, user, recorder, args):
+    """일반 채팅 (로그인 사용자의 대화에 저장)"""
+    await timed(recorder, "chat", client.post("/api/chat", headers=user["headers"], json={
+        "message": pick_question(args),
+        "conversation_id": user["conversation_id"],
+        "max_tokens": args.max_tokens
+    }))
+
+
+async def scenario_stream(client, user, recorder, args):
+    """스트리밍 채팅 - 첫 토큰 이벤트까지 시간(TTFT)과 전체 시간 기록"""
+    start = time.perf_counter()
+    ttft = None
+    try:
+        async with client.stream("POST", "/api/chat/stream", headers=user["headers"], json={
+            "message": pick_question(args),
+            "max_tokens": args.max_tokens
+        }) as response:
+            status = response.status_code
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[len("data: "):])
+                if event["type"] == "token" and ttft is None:
+                    ttft = time.perf_counter() - start
+                elif event["type"] == "error":
+                    # 스트림 도중 거절/오류는 200 응답이어도 실패로 집계
+                    status = "stream_error"
+    except httpx.HTTPError as e:
+        status = type(e).__name__
+    recorder.record("stream", status, time.perf_counter() - start, ttft)
+
+
+async def scenario_conversations(client, user, recorder, args):
+    """대화 생성 → 메시지 추가 → 목록/상세 조회 → 삭제"""
+    headers = user["headers"]
+    response = await timed(recorder, "conv_create", client.post(
+        "/api/conversations/", headers=headers, json={"title": "load test"}
+    ))
+    if response is None or response.status_code >= 400:
+        return
+    conversation_id = response.json()["id"]
+    await timed(recorder, "conv_message", client.post(
+        f"/api/conversations/{conversation_id}/messages", headers=headers,
+        params={"role": "user", "content": random.choice(QUESTIONS)}
+    ))
+    await timed(recorder, "conv_list", client.get("/api/conversations/", headers=headers))
+    await timed(recorder, "conv_detail", client.get(f"/api/conversations/{conversation_id}", headers=headers))
+    await timed(recorder, "conv_delete", client.delete(f"/api/conversations/{conversation_id}", headers=headers))
+
+
+SCENARIOS = {
+    "chat": scenario_chat,
+    "stream": scenario_stream,
+    "conversations": scenario_conversations,
+}
+
+
+async def create_user(client, index):
+    """가상 사용자 계정과 채팅 저장용 대화 생성"""
+    email = f"loadtest-{uuid.uuid4().hex[:8]}-{index}@example.com"
+    response = await client.post("/api/auth/register", json={"email": email, "password": PASSWORD})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.post("/api/conversations/", headers=headers, json={"title": "load test chat"})
+    response.raise_for_status()
+    return {"headers": headers, "conversation_id": response.json()["id"]}
+
+
+async def virtual_user(client, user, recorder, weights, deadline, args):
+    names, values = list(weights), list(weights.values())
+    while time.perf_counter() < deadline:
+        scenario = random.choices(names, weights=values)[0]
+        await SCENARIOS[scenario](client, user, recorder, args)
+        if args.think_time:
+            await asyncio.sleep(random.uniform(0, args.think_time))
+
+
+async def run(base_url, args):
+    weights = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.users * 2, max_keepalive_connections=args.users * 2)
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        # 컴포넌트 워밍업 (모델 로드)
+        await client.get("/api/status")
+        users = await asyncio.gather(*(create_user(client, i) for i in range(args.users)))
+
+        recorder = Recorder()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            virtual_user(client, user, recorder, weights, deadline, args) for user in users
+        ))
+        elapsed = time.perf_counter() - start
+
+        status = (await client.get("/api/status")).json()
+        for user in users:
+            await client.delete(f"/api/conversations/{user['conversation_id']}", headers=user["headers"])
+
+    return recorder.report(elapsed), status
+
+
+def start_local_server(args):
+    """가짜 Ollama와 API 서버를 현재 프로세스에서 실행"""
+    import uvicorn
+
+    fake_ollama = FakeOllamaServer(
+        tokens_per_sec=args.tokens_per_sec,
+        ttft=args.ttft,
+        response_tokens=args.response_tokens
+    ).start()
+    os.environ["OLLAMA_BASE_URL"] = fake_ollama.url
+
+    from src.api.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.1)
+    return fake_ollama, server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API end-to-end load test")
+    parser.add_argument("--users", type=int, default=10, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--mix", default="chat=2,stream=2,conversations=1", help="시나리오 가중치")
+    parser.add_argument("--think-time", type=float, default=0.0, help="요청 사이 최대 대기 시간 (초)")
+    parser.add_argument("--max-tokens", type=int, default=256)
+    parser.add_argument("--unique", action="store_true", help="질문마다 임의 문자열을 붙여 캐시 적중 방지")
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tokens-per-sec", type=float, default=20.0, help="가짜 Ollama 생성 속도")
+    parser.add_argument("--ttft", type=float, default=0.5, help="가짜 Ollama 첫 토큰 지연 (초)")
+    parser.add_argument("--response-tokens", type=int, default=None, help="가짜 Ollama 응답 토큰 수")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--base-url", default=None, help="지정하면 서버를 띄우지 않고 해당 서버에 부하")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    fake_ollama = server = None
+    base_url = args.base_url
+    if base_url is None:
+        fake_ollama, server = start_local_server(args)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    report, status = asyncio.run(run(base_url, args))
+    report["config"] = {key: value for key, value in vars(args).items() if key != "output"}
+    report["server"] = {key: status.get(key) for key in ("llm_scheduler", "generation", "cache")}
+    if fake_ollama is not None:
+        report["fake_ollama"] = dict(fake_ollama.counters)
+
+    print("=" * 60)
+    print(f"API 부하 테스트 (사용자 {args.users}명, {args.duration:.0f}초, mix={args.mix})")
+    print("=" * 60)
+    print(f"전체: {report['requests']}건, {report['throughput_rps']:.2f} req/s, 오류율 {report['error_rate']:.2%}")
+    for scenario, row in report["scenarios"].items():
+        latency = row.get("latency_ms", {})
+        line = (
+            f"{scenario:>13}: n={row['requests']:>5} {row['throughput_rps']:7.2f} req/s "
+            f"err={row['error_rate']:6.2%} p50={latency.get('p50', 0):8.1f}ms "
+            f"p95={latency.get('p95', 0):8.1f}ms p99={latency.get('p99', 0):8.1f}ms"
+        )
+        if "ttft_ms" in row:
+            line += f" ttft_p50={row['ttft_ms']['p50']:.1f}ms"
+        print(line)
+        errors = {code: n for code, n in row["statuses"].items() if not (code.isdigit() and int(code) < 400)}
+        if errors:
+            print(f"{'':>15}오류: {errors}")
+    if report.get("fake_ollama"):
+        print(f"Ollama 요청 {report['fake_ollama']['requests']}건, 최대 동시 {report['fake_ollama']['max_active']}")
+
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[SAVED] {output}")
+
+    if server is not None:
+        server.should_exit = True
+        fake_ollama.stop()
+
+
+if __name__ == "__main__":
+    main()
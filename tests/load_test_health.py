@@ -0,0 +1,88 @@
+"""
+Load test: /health latency while LLM generations are in flight
+가짜 Ollama(느린 생성)와 API 서버를 띄우고 /api/chat 20개를 동시에 보내는 동안 /health 지연시간 측정
+"""
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+sys.path.append('.')
+
+import httpx
+import uvicorn
+
+from tests.fake_ollama import FakeOllamaServer
+
+IN_FLIGHT = 20
+API_PORT = 8765
+
+# 생성 1건당 약 5초 (TTFT 1초 + 20토큰 / 5 tok/s)
+fake_ollama = FakeOllamaServer(tokens_per_sec=5.0, ttft=1.0).start()
+os.environ["OLLAMA_BASE_URL"] = fake_ollama.url
+
+from src.api.main import app
+
+server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=API_PORT, log_level="warning"))
+threading.Thread(target=server.run, daemon=True).start()
+while not server.started:
+    time.sleep(0.1)
+
+BASE_URL = f"http://127.0.0.1:{API_PORT}"
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+async def probe_health(client, stop_event, latencies):
+    while not stop_event.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.05)
+
+
+async def main():
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=120) as client:
+        # 컴포넌트 워밍업 (모델 로드)
+        await client.get("/api/status")
+
+        # 1. 부하 없는 상태의 /health
+        baseline = []
+        stop_event = asyncio.Event()
+        probe = asyncio.create_task(probe_health(client, stop_event, baseline))
+        await asyncio.sleep(2)
+        stop_event.set()
+        await probe
+
+        # 2. 생성 20건 진행 중의 /health
+        under_load = []
+        stop_event = asyncio.Event()
+        probe = asyncio.create_task(probe_health(client, stop_event, under_load))
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(
+            client.post("/api/chat", json={"message": f"건강백서캣 부스 위치 알려줘 {i}", "max_tokens": 20})
+            for i in range(IN_FLIGHT)
+        ))
+        elapsed = time.perf_counter() - start
+        stop_event.set()
+        await probe
+
+    print("=" * 60)
+    print(f"/health 지연시간 (생성 {IN_FLIGHT}건 동시 진행)")
+    print("=" * 60)
+    print(f"chat 응답: {sum(r.status_code == 200 for r in responses)}/{IN_FLIGHT} 성공, {elapsed:.1f}s 소요")
+    print(f"Ollama 최대 동시 요청: {fake_ollama.counters['max_active']}")
+    for name, values in [("baseline", baseline), ("under load", under_load)]:
+        print(
+            f"{name:>10}: n={len(values):>4} p50={statistics.median(values):7.2f}ms "
+            f"p95={percentile(values, 95):7.2f}ms max={max(values):7.2f}ms"
+        )
+
+
+asyncio.run(main())
+server.should_exit = True
+fake_ollama.stop()
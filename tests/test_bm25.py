@@ -0,0 +1,135 @@
+"""
+Test BM25Index scores (Lucene IDF vs rank_bm25 BM25Okapi), top-k tie-breaking and batch scoring
+"""
+import math
+import shutil
+import sys
+import tempfile
+from collections import Counter
+sys.path.append('.')
+
+import numpy as np
+
+from src.rag.bm25 import BM25Index, select_top_k
+
+print("=" * 60)
+print("BM25 인덱스 테스트")
+print("=" * 60)
+
+corpus = [
+    "고양이 사료 추천 고양이 간식".split(),
+    "고양이 모래 화장실".split(),
+    "강아지 사료 간식 간식 간식".split(),
+    "캣타워 스크래쳐 고양이 장난감 캣닢".split(),
+    "1-g12 부스 건강백서캣 고양이 영양제".split(),
+    "사료".split(),
+]
+queries = [
+    ["고양이"],
+    ["사료", "간식"],
+    ["고양이", "고양이", "모래"],
+    ["없는단어"],
+    [],
+    ["1-g12", "부스", "없는단어"],
+]
+K1, B = 1.5, 0.75
+index = BM25Index.build(corpus, k1=K1, b=B)
+
+
+def lucene_idf(n_docs, df):
+    return math.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+
+def reference_scores(query):
+    """BM25 정의대로 계산한 점수 (IDF는 Lucene 방식 log(1 + (N - df + 0.5) / (df + 0.5)))"""
+    n_docs = len(corpus)
+    avgdl = sum(len(doc) for doc in corpus) / n_docs
+    df = Counter(term for doc in corpus for term in set(doc))
+    scores = []
+    for doc in corpus:
+        tf = Counter(doc)
+        score = 0.0
+        for term in query:
+            if tf[term]:
+                norm = K1 * (1 - B + B * len(doc) / avgdl)
+                score += lucene_idf(n_docs, df[term]) * tf[term] * (K1 + 1) / (tf[term] + norm)
+        scores.append(score)
+    return np.array(scores)
+
+
+# 1. BM25 정의와 일치 (쿼리 내 반복 단어는 반복 횟수만큼 가산)
+for query in queries:
+    assert np.allclose(index.get_scores(query), reference_scores(query), atol=1e-5), query
+print("[PASS] 점수가 BM25 정의(Lucene IDF)와 일치")
+
+# 2. rank_bm25 BM25Okapi와 비교
+#    TF 정규화는 동일하고 IDF만 다름:
+#    - BM25Okapi: log((N - df + 0.5) / (df + 0.5)), 음수(df > N/2)는 epsilon * 평균 IDF로 대체
+#    - BM25Index: log1p((N - df + 0.5) / (df + 0.5)), 항상 양수 (흔한 단어도 점수에 기여)
+#    → 단일 단어 쿼리의 순위는 같고, 여러 단어 쿼리는 단어 간 IDF 비율이 달라 순위가 바뀔 수 있음
+try:
+    from rank_bm25 import BM25Okapi
+except ImportError:
+    BM25Okapi = None
+
+if BM25Okapi is None:
+    print("[SKIP] rank_bm25 미설치 - BM25Okapi 비교 생략")
+else:
+    okapi = BM25Okapi(corpus, k1=K1, b=B)
+    df = Counter(term for doc in corpus for term in set(doc))
+
+    # IDF를 Lucene 방식으로 바꾸면 점수가 같음
+    okapi.idf = {term: lucene_idf(len(corpus), count) for term, count in df.items()}
+    for query in queries:
+        assert np.allclose(index.get_scores(query), okapi.get_scores(query), atol=1e-5), query
+
+    # 원래 IDF: 단일 단어 쿼리는 점수 비율만 다르고 순위는 같음
+    okapi = BM25Okapi(corpus, k1=K1, b=B)
+    for term in ["간식", "모래", "캣닢"]:
+        ours, theirs = index.get_scores([term]), okapi.get_scores([term])
+        matched = ours > 0
+        ratio = lucene_idf(len(corpus), df[term]) / okapi.idf[term]
+        assert np.allclose(ours[matched], theirs[matched] * ratio, rtol=1e-5), term
+        assert np.argmax(ours) == np.argmax(theirs)
+
+    # 문서 절반 이상에 나오는 단어 ("고양이", df=4/6): BM25Okapi는 IDF 하한(epsilon) 적용, BM25Index는 양수 IDF
+    assert math.log((6 - 4 + 0.5) / (4 + 0.5)) < 0
+    assert index.idf[index.vocab["고양이"]] > 0
+    print("[PASS] rank_bm25 BM25Okapi와 IDF 외 동일, 단일 단어 순위 일치")
+
+# 3. select_top_k: 동점은 문서 번호 순, k번째 경계의 동점 포함, 0점 제외
+candidates = np.array([7, 3, 5, 1, 9, 4])
+scores = np.array([2.0, 5.0, 2.0, 2.0, 0.0, 5.0], dtype=np.float32)
+assert select_top_k(candidates, scores, 1) == [(3, 5.0)]
+assert select_top_k(candidates, scores, 2) == [(3, 5.0), (4, 5.0)]
+assert select_top_k(candidates, scores, 3) == [(3, 5.0), (4, 5.0), (1, 2.0)]
+assert select_top_k(candidates, scores, 4) == [(3, 5.0), (4, 5.0), (1, 2.0), (5, 2.0)]
+assert select_top_k(candidates, scores, 10) == [(3, 5.0), (4, 5.0), (1, 2.0), (5, 2.0), (7, 2.0)]
+assert select_top_k(candidates, scores, 0) == []
+assert select_top_k(np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32), 3) == []
+print("[PASS] select_top_k 동점 처리 (문서 번호 순) 및 0점 제외")
+
+# 4. 배치 점수 = 단일 쿼리 점수, top_k_batch = top_k (batch_size로 나뉘어도 동일)
+batch_scores = index.get_scores_batch(queries)
+assert batch_scores.shape == (len(queries), len(corpus))
+for query, row in zip(queries, batch_scores):
+    assert np.allclose(row, index.get_scores(query), atol=1e-6), query
+for batch_size in (1, 4, 256):
+    assert index.top_k_batch(queries, k=3, batch_size=batch_size) == [index.top_k(query, k=3) for query in queries]
+assert index.get_scores_batch([["없는단어"], []]).sum() == 0
+print("[PASS] get_scores_batch / top_k_batch가 단일 쿼리 결과와 일치")
+
+# 5. 저장/로드 (메모리 맵) 후 같은 점수
+tmp_dir = tempfile.mkdtemp()
+try:
+    index.save(tmp_dir)
+    loaded = BM25Index.load(tmp_dir, mmap=True)
+    assert (loaded.k1, loaded.b) == (K1, B) and loaded.vocab == index.vocab
+    for query in queries:
+        assert np.array_equal(loaded.get_scores(query), index.get_scores(query))
+        assert loaded.top_k(query, k=3) == index.top_k(query, k=3)
+    print("[PASS] 저장/로드 후 점수 일치")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")
@@ -0,0 +1,151 @@
+"""
+Test async crawl pipeline against recorded fixtures (conditional requests, JSONL streaming)
+"""
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('.')
+
+import httpx
+
+from src.crawler.pipeline import BrandSource, FAQSource, WikipediaSource, format_wikipedia_extract, run_pipeline
+from src.crawler.preprocessor import DataPreprocessor, load_records
+
+print("=" * 60)
+print("비동기 크롤링 파이프라인 테스트")
+print("=" * 60)
+
+BRAND_HTML = Path("tests/page_source.html").read_bytes()
+FAQ_HTML = """
+<html><body>
+<h4 class="panel-title"><a data-target="#faq1">재입장이 가능한가요?</a></h4>
+<div id="faq1">당일에 한해 재입장이 가능합니다.</div>
+<h4 class="panel-title"><a data-target="#faq2">주차가 가능한가요?</a></h4>
+<div id="faq2">전시장 지하 주차장을 이용하실 수 있습니다.</div>
+</body></html>
+""".encode('utf-8')
+WIKI_EXTRACT = "고양이는 식육목 고양이과의 포유류이다.\n\n\n== 역사 ==\n고대 이집트에서 길들여졌다.\n\n\n=== 품종 ===\n다양한 품종이 있다."
+
+
+def wiki_response(title: str) -> bytes:
+    if title == "없는문서":
+        page = {"title": title, "missing": True}
+    else:
+        page = {
+            "title": title,
+            "extract": WIKI_EXTRACT,
+            "fullurl": f"https://ko.wikipedia.org/wiki/{title}",
+            "categories": [{"title": "분류:고양이"}]
+        }
+    return json.dumps({"query": {"pages": [page]}}, ensure_ascii=False).encode('utf-8')
+
+
+class RecordedSite:
+    """기록된 응답을 돌려주는 전송 계층 (ETag 지원, 동시 요청 수 기록)"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.status = {}
+        self.fail_faq = False
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if request.url.host == "catfesta.com" and self.fail_faq:
+                return httpx.Response(404)
+            if request.url.host == "gdppcat.com":
+                body, etag = BRAND_HTML, '"brand-v1"'
+            elif request.url.host == "catfesta.com":
+                body, etag = FAQ_HTML, '"faq-v1"'
+            else:
+                title = request.url.params["titles"]
+                body, etag = wiki_response(title), f'"wiki-{len(title)}"'
+            if request.headers.get("If-None-Match") == etag:
+                response = httpx.Response(304, headers={"ETag": etag})
+            else:
+                response = httpx.Response(200, content=body, headers={"ETag": etag})
+            self.status[response.status_code] = self.status.get(response.status_code, 0) + 1
+            return response
+        finally:
+            self.in_flight -= 1
+
+
+titles = ["고양이", "페르시안", "샴 고양이", "없는문서"]
+
+
+def make_sources():
+    return [BrandSource(), FAQSource(), WikipediaSource(titles=titles)]
+
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    output_dir = f"{tmp_dir}/raw"
+    cache_dir = f"{tmp_dir}/cache"
+
+    # 1. 위키피디아 본문 형식 (wikipediaapi의 page.text와 동일)
+    summary, text = format_wikipedia_extract(WIKI_EXTRACT)
+    assert summary == "고양이는 식육목 고양이과의 포유류이다."
+    assert text == "고양이는 식육목 고양이과의 포유류이다.\n\n역사\n고대 이집트에서 길들여졌다.\n\n품종\n다양한 품종이 있다."
+    print("[PASS] 위키피디아 본문 형식 변환")
+
+    # 2. 첫 실행: 모두 다운로드, 동시 요청 수 제한, JSONL 저장
+    site = RecordedSite()
+    report = asyncio.run(run_pipeline(
+        make_sources(), output_dir=output_dir, cache_dir=cache_dir,
+        max_concurrency=2, transport=httpx.MockTransport(site.handler)
+    ))
+    assert site.max_in_flight <= 2, site.max_in_flight
+    assert site.status == {200: 6}
+    assert report["fetcher"]["downloaded"] == 6 and report["fetcher"]["not_modified"] == 0
+
+    brands = load_records(f"{output_dir}/gdpp_brands.jsonl")
+    assert len(brands) == 243 and brands[0]["brand_name"] == "건강백서캣"
+    faqs = load_records(f"{output_dir}/gdpp_faq.jsonl")
+    assert [faq["question"] for faq in faqs] == ["재입장이 가능한가요?", "주차가 가능한가요?"]
+    pages = load_records(f"{output_dir}/wikipedia_cat_knowledge.jsonl")
+    assert sorted(page["title"] for page in pages) == sorted(titles[:3])
+    assert all(page["categories"] == ["분류:고양이"] for page in pages)
+    assert not list(Path(output_dir).glob("*.tmp-*"))
+    print(f"[PASS] 첫 실행: {report['sources']}, 최대 동시 요청 {site.max_in_flight}")
+
+    # 3. 두 번째 실행: 조건부 요청으로 304, 캐시 본문으로 같은 결과
+    site = RecordedSite()
+    report = asyncio.run(run_pipeline(
+        make_sources(), output_dir=output_dir, cache_dir=cache_dir,
+        max_concurrency=2, transport=httpx.MockTransport(site.handler)
+    ))
+    assert site.status == {304: 6}
+    assert report["fetcher"]["downloaded"] == 0 and report["fetcher"]["not_modified"] == 6
+    assert all(stats["from_cache"] == stats["requests"] for stats in report["sources"].values())
+    assert load_records(f"{output_dir}/gdpp_brands.jsonl") == brands
+    print(f"[PASS] 재실행 시 304 + 로컬 캐시 사용: {report['fetcher']}")
+
+    # 4. 실패한 소스는 이전 출력 유지, 나머지 소스는 정상 저장
+    site = RecordedSite()
+    site.fail_faq = True
+    report = asyncio.run(run_pipeline(
+        make_sources(), output_dir=output_dir, cache_dir=cache_dir,
+        max_concurrency=2, transport=httpx.MockTransport(site.handler)
+    ))
+    assert not report["sources"]["faq"]["saved"] and report["sources"]["faq"]["errors"] == 1
+    assert report["sources"]["brands"]["saved"] and report["sources"]["wikipedia"]["saved"]
+    assert load_records(f"{output_dir}/gdpp_faq.jsonl") == faqs
+    assert not list(Path(output_dir).glob("*.tmp-*"))
+    print("[PASS] 실패한 소스는 이전 출력 유지")
+
+    # 5. 전처리기가 JSONL 출력을 그대로 사용
+    preprocessor = DataPreprocessor()
+    assert len(preprocessor.process_brand_data(f"{output_dir}/gdpp_brands.jsonl")) == 243
+    assert len(preprocessor.process_faq_data(f"{output_dir}/gdpp_faq.jsonl")) == 2
+    assert preprocessor.process_wikipedia_data(f"{output_dir}/wikipedia_cat_knowledge.jsonl")
+    print("[PASS] 전처리기 JSONL 입력")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")
@@ -0,0 +1,66 @@
+"""
+Test on-disk embedding cache (text hash → memory-mapped float32 rows)
+"""
+import shutil
+import sys
+import tempfile
+sys.path.append('.')
+
+import numpy as np
+
+from src.rag.embedding_cache import EmbeddingCache
+
+print("=" * 60)
+print("임베딩 디스크 캐시 테스트")
+print("=" * 60)
+
+MODEL = "jhgan/ko-sbert-nli"
+rng = np.random.default_rng(0)
+texts = ["고양이는 귀여운 동물입니다.", "재입장은 당일에 한해 가능합니다.", "주차는 지하 주차장을 이용하세요."]
+vectors = rng.standard_normal((3, 8)).astype(np.float32)
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    # 1. 빈 캐시: 모두 미스
+    builder = EmbeddingCache(tmp_dir, MODEL, 8)
+    assert builder.get_many(texts) == [None, None, None]
+    print("[PASS] 빈 캐시 조회")
+
+    # 2. 추가 후 조회 (중복 텍스트는 한 번만 저장)
+    builder.put_many(texts[:2] + texts[:1], np.vstack([vectors[:2], vectors[:1]]))
+    cached = builder.get_many(texts)
+    assert np.array_equal(cached[0], vectors[0]) and np.array_equal(cached[1], vectors[1]) and cached[2] is None
+    assert len(builder) == 2
+    print(f"[PASS] 추가 후 조회: {builder.stats()}")
+
+    # 3. 다른 인스턴스(API 서버)에서 같은 캐시 공유, 이후 추가분도 반영
+    server = EmbeddingCache(tmp_dir, MODEL, 8)
+    assert np.array_equal(server.get_many([texts[1]])[0], vectors[1])
+    builder.put_many([texts[2]], vectors[2:])
+    assert np.array_equal(server.get_many([texts[2]])[0], vectors[2])
+    print("[PASS] 인스턴스 간 공유")
+
+    # 4. 모델 이름/차원이 다르면 별도 캐시
+    other = EmbeddingCache(tmp_dir, "other/model", 8)
+    assert other.get_many(texts) == [None, None, None]
+    print("[PASS] 모델별 분리")
+
+    # 5. 인덱스에 기록되지 않은 꼬리(중단된 기록)는 다음 추가 시 덮어씀
+    with open(builder.vectors_file, 'ab') as f:
+        f.write(b"\xff" * 8 * 4 * 2)
+    extra = rng.standard_normal((1, 8)).astype(np.float32)
+    builder.put_many(["캣타워는 A홀에서 판매합니다."], extra)
+    assert builder.vectors_file.stat().st_size == 4 * 8 * 4
+    reopened = EmbeddingCache(tmp_dir, MODEL, 8)
+    result = reopened.get_many(texts + ["캣타워는 A홀에서 판매합니다."])
+    assert all(np.array_equal(r, v) for r, v in zip(result, list(vectors) + [extra[0]]))
+    print("[PASS] 중단된 기록 복구")
+
+    # 6. 반환된 배열은 캐시와 분리된 복사본
+    result[0][:] = 0
+    assert np.array_equal(reopened.get_many(texts[:1])[0], vectors[0])
+    print("[PASS] 복사본 반환")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")
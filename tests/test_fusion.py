@@ -0,0 +1,76 @@
+"""
+Test fusion strategy scores and min_score filtering on fixed vector/BM25 inputs
+"""
+import sys
+sys.path.append('.')
+
+from src.rag.fusion import MinMaxFusion, RRFFusion, WeightedFusion, get_fusion
+from src.rag.hybrid_retriever import HybridRetriever
+
+print("=" * 60)
+print("결합 전략 점수/필터링 테스트")
+print("=" * 60)
+
+
+def vector_hits(distances):
+    """(문서 ID, 코사인 거리) → 검색기가 만드는 벡터 검색 결과"""
+    results = [{"id": doc_id, "distance": distance} for doc_id, distance in distances]
+    return HybridRetriever._format_vector_results(None, results)
+
+
+def bm25_hits(scores):
+    return [{"id": doc_id, "score": score, "search_type": "bm25"} for doc_id, score in scores]
+
+
+vector_results = vector_hits([("a", 0.2), ("b", 0.6), ("c", 0.9), ("d", 1.3)])
+bm25_results = bm25_hits([("b", 4.0), ("e", 3.0), ("a", 1.0), ("f", 0.5)])
+
+# 1. 벡터 점수 = 코사인 유사도 (음수 유사도는 0)
+assert [round(r["score"], 4) for r in vector_results] == [0.8, 0.4, 0.1, 0.0]
+print("[PASS] 벡터 점수 max(0, 1 - distance)")
+
+# 2. weighted 점수 고정 (0.7 * 코사인 유사도 + 0.3 * s/(s+1))
+weighted = WeightedFusion()
+scores = weighted.fuse(vector_results, bm25_results, 0.7, 0.3)
+expected = {
+    "a": 0.7 * 0.8 + 0.3 * 0.5,
+    "b": 0.7 * 0.4 + 0.3 * 0.8,
+    "c": 0.7 * 0.1,
+    "d": 0.0,
+    "e": 0.3 * 0.75,
+    "f": 0.3 * (0.5 / 1.5),
+}
+assert scores.keys() == expected.keys()
+for doc_id, score in expected.items():
+    assert abs(scores[doc_id] - score) < 1e-9, (doc_id, scores[doc_id], score)
+ranking = sorted(scores, key=scores.get, reverse=True)
+assert ranking == ["a", "b", "e", "f", "c", "d"], ranking
+print(f"[PASS] weighted 점수/순위: {ranking}")
+
+# 3. min_score 필터링 (챗봇과 같은 기준)
+assert weighted.min_score == 0.2
+kept = [doc_id for doc_id in ranking if scores[doc_id] >= weighted.min_score]
+assert kept == ["a", "b", "e"], kept
+print(f"[PASS] weighted min_score {weighted.min_score} 필터링: {kept}")
+
+# 4. 먼 벡터 결과만 있으면 모두 제거 (이전 1/(1+d) 변환에서는 항상 0.233 이상)
+far = WeightedFusion().fuse(vector_hits([("x", 0.8), ("y", 1.0)]), [], 0.7, 0.3)
+assert all(score < weighted.min_score for score in far.values()), far
+print("[PASS] 관련 없는 벡터 결과 제거")
+
+# 5. minmax는 거리 척도에 무관 (후보 내 정규화)
+minmax = MinMaxFusion().fuse(vector_results, bm25_results, 0.7, 0.3)
+scaled = MinMaxFusion().fuse(
+    vector_hits([(r["id"], r["distance"] * 0.5) for r in vector_results]), bm25_results, 0.7, 0.3
+)
+assert all(abs(minmax[doc_id] - scaled[doc_id]) < 1e-9 for doc_id in minmax)
+assert abs(minmax["a"] - (0.7 * 1.0 + 0.3 * (1.0 - 0.5) / 3.5)) < 1e-9
+print("[PASS] minmax 점수는 거리 척도와 무관")
+
+# 6. rrf는 순위만 사용
+rrf = RRFFusion().fuse(vector_results, bm25_results, 0.7, 0.3)
+assert abs(rrf["a"] - (0.7 / 61 + 0.3 / 63)) < 1e-12
+assert get_fusion("rrf").min_score is None and get_fusion("zscore").min_score is None
+print("[PASS] rrf 순위 기반 점수")
+
+print("\n모든 테스트 통과")
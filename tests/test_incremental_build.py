@@ -0,0 +1,191 @@
+"""
+Test incremental vector DB sync with content-hash chunk IDs
+"""
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('.')
+
+import numpy as np
+
+from src.rag.bm25_store import write_bm25_artifact
+from src.rag.build_vectordb import assign_chunk_ids, sync_vector_stores
+from src.rag.corpus_version import write_corpus_version
+from src.rag.hybrid_retriever import HybridRetriever
+from src.rag.numpy_vector_store import NumpyVectorStore
+
+print("=" * 60)
+print("증분 벡터 DB 구축 테스트")
+print("=" * 60)
+
+
+class CountingEmbedder:
+    """텍스트 해시로 임베딩을 만들고 임베딩한 문서 수를 기록"""
+
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts, batch_size=32):
+        self.embedded.extend(texts)
+        return np.stack([
+            np.random.default_rng(abs(hash(text)) % (2 ** 32)).standard_normal(8).astype(np.float32)
+            for text in texts
+        ])
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+
+def sync(store, chunks, full=False, batch_size=2):
+    embedder = CountingEmbedder()
+    ids = assign_chunk_ids(chunks)
+    report = sync_vector_stores(
+        stores=[store],
+        ids=ids,
+        documents=[chunk['text'] for chunk in chunks],
+        metadatas=[chunk['metadata'] for chunk in chunks],
+        embedder=embedder,
+        batch_size=batch_size,
+        full=full
+    )[0]
+    return ids, report, embedder.embedded
+
+
+chunks = [
+    {"text": "건강백서캣은 고양이 건강 관리 브랜드입니다.", "metadata": {"source": "gdpp_brand", "booth_number": "1-G12"}},
+    {"text": "재입장은 당일에 한해 가능합니다.", "metadata": {"source": "gdpp_faq"}},
+    {"text": "주차는 전시장 지하 주차장을 이용하세요.", "metadata": {"source": "gdpp_faq"}},
+    {"text": "재입장은 당일에 한해 가능합니다.", "metadata": {"source": "gdpp_faq"}},
+    {"text": "고양이는 식육목 고양이과의 포유류입니다.", "metadata": {"source": "wikipedia"}},
+]
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    # 1. ID는 내용 기반 (순서와 무관), 완전히 같은 청크는 접미사로 구분
+    ids = assign_chunk_ids(chunks)
+    assert len(set(ids)) == len(ids)
+    assert ids[3] == ids[1] + "_1"
+    assert set(assign_chunk_ids(list(reversed(chunks)))) == set(ids)
+    print(f"[PASS] 내용 해시 ID: {ids[0]}")
+
+    # 2. 첫 구축: 전체 임베딩 (배치 크기 2 → 여러 번 upsert)
+    store = NumpyVectorStore(persist_directory=tmp_dir, collection_name="test")
+    ids, report, embedded = sync(store, chunks)
+    assert report == {"added": 5, "removed": 0, "unchanged": 0}, report
+    assert len(embedded) == 5 and store.get_ids() == ids
+    print(f"[PASS] 첫 구축: {report}")
+
+    # 3. 변경 없음: 임베딩 없음
+    ids, report, embedded = sync(store, chunks)
+    assert report == {"added": 0, "removed": 0, "unchanged": 5}, report
+    assert embedded == []
+    print(f"[PASS] 변경 없음: {report}")
+
+    # 4. 한 청크 수정 + 순서 변경 + 한 청크 삭제 + 새 청크 추가 → 변경분만 임베딩
+    #    (ID가 내용 해시이므로 수정된 청크는 삭제 + 추가, 증분 구축 보고에는 updated 없음)
+    edited = [dict(chunk) for chunk in chunks]
+    edited[0] = {"text": "건강백서캣은 고양이 영양제 브랜드입니다.", "metadata": {"source": "gdpp_brand", "booth_number": "1-G12"}}
+    del edited[2]
+    edited.append({"text": "캣타워는 A홀에서 판매합니다.", "metadata": {"source": "gdpp_brand"}})
+    edited = edited[::-1]
+    ids, report, embedded = sync(store, edited)
+    assert report == {"added": 2, "removed": 2, "unchanged": 3}, report
+    assert sorted(embedded) == sorted(["건강백서캣은 고양이 영양제 브랜드입니다.", "캣타워는 A홀에서 판매합니다."])
+    assert set(store.get_ids()) == set(ids)
+    print(f"[PASS] 증분 반영: {report}")
+
+    # 5. 디스크에서 다시 열어도 같은 내용, 검색 결과 문서/메타데이터 일치
+    reopened = NumpyVectorStore(persist_directory=tmp_dir, collection_name="test")
+    assert set(reopened.get_ids()) == set(ids)
+    by_id = dict(zip(reopened.ids, reopened.documents))
+    for doc_id, chunk in zip(ids, edited):
+        assert by_id[doc_id] == chunk['text']
+    query = CountingEmbedder().embed_documents(["캣타워는 A홀에서 판매합니다."])[0]
+    top = reopened.similarity_search(query, k=1)[0]
+    assert top["document"] == "캣타워는 A홀에서 판매합니다." and top["distance"] < 1e-4
+    print(f"[PASS] 재로드 후 검색: {top['id']}")
+
+    # 6. 전체 재구축: 모두 다시 임베딩
+    ids, report, embedded = sync(store, edited, full=True)
+    assert report == {"added": 0, "updated": 5, "removed": 0, "unchanged": 0}, report
+    assert len(embedded) == 5 and len(store.get_ids()) == 5
+    print(f"[PASS] 전체 재구축: {report}")
+
+    # 7. BM25 아티팩트가 없을 때 청크 데이터로 구축한 인덱스도 벡터 스토어와 같은 ID 사용
+    chunks_file = Path(tmp_dir) / "chunks.json"
+    chunks_file.write_text(json.dumps(edited, ensure_ascii=False), encoding='utf-8')
+    bm25_dir = Path(tmp_dir) / "bm25"
+    write_bm25_artifact(
+        documents=[chunk['text'] for chunk in edited],
+        metadatas=[chunk['metadata'] for chunk in edited],
+        ids=ids,
+        directory=str(bm25_dir),
+        tokenizer="whitespace"
+    )
+    shutil.rmtree(bm25_dir)
+    retriever = HybridRetriever(
+        vector_store=store,
+        embedder=CountingEmbedder(),
+        chunks_file=str(chunks_file),
+        tokenizer="whitespace",
+        token_cache_dir=None,
+        index_dir=str(bm25_dir),
+        result_cache_size=0,
+        version_dir=None
+    )
+    assert retriever.doc_ids == ids
+    query = "캣타워는 A홀에서 판매합니다."
+    vector_ids = [r["id"] for r in retriever.vector_search(query, k=5)]
+    bm25_ids = [r["id"] for r in retriever.bm25_search(query, k=5)]
+    assert bm25_ids and set(bm25_ids) <= set(vector_ids) == set(ids)
+    results = retriever.hybrid_search(query, k=5)
+    assert len({r["id"] for r in results}) == len(results) == 5
+    assert results[0]["document"] == query
+    print(f"[PASS] 아티팩트 없이 구축한 BM25와 벡터 스토어 ID 일치: {bm25_ids[0]}")
+
+    # 8. 실행 중 증분 재구축 → 버전 스탬프가 바뀌면 BM25 인덱스/문서 목록/NumPy 스토어 재로드
+    def write_build(build_chunks, build_ids):
+        write_bm25_artifact(
+            documents=[chunk['text'] for chunk in build_chunks],
+            metadatas=[chunk['metadata'] for chunk in build_chunks],
+            ids=build_ids,
+            directory=str(bm25_dir),
+            tokenizer="whitespace"
+        )
+        write_corpus_version(tmp_dir, [chunk['text'] for chunk in build_chunks])
+
+    write_build(edited, ids)
+    retriever = HybridRetriever(
+        vector_store=NumpyVectorStore(persist_directory=tmp_dir, collection_name="test"),
+        embedder=CountingEmbedder(),
+        chunks_file=str(chunks_file),
+        tokenizer="whitespace",
+        token_cache_dir=None,
+        index_dir=str(bm25_dir),
+        version_dir=tmp_dir
+    )
+    new_text = "스크래쳐는 B홀 2-C05 부스에서 판매합니다."
+    assert retriever.bm25_search(new_text, k=5)[0]["document"] != new_text
+    before = retriever.hybrid_search(new_text, k=3)
+    old_version = retriever.current_version()
+
+    rebuilt = edited + [{"text": new_text, "metadata": {"source": "gdpp_brand"}}]
+    rebuilt_ids, report, embedded = sync(store, rebuilt)
+    assert embedded == [new_text]
+    write_build(rebuilt, rebuilt_ids)
+    # 버전 조회는 재로드하지 않음 (재로드는 검색 시작 시 refresh_if_stale에서)
+    assert retriever.current_version() == old_version
+
+    after = retriever.hybrid_search(new_text, k=3)
+    assert retriever.current_version() != old_version
+    assert retriever.doc_ids == rebuilt_ids and len(retriever.vector_store.get_ids()) == len(rebuilt_ids)
+    assert after[0]["document"] == new_text and before[0]["document"] != new_text
+    assert retriever.bm25_search(new_text, k=1)[0]["id"] == after[0]["id"]
+    assert retriever.cache_stats()["size"] == 1
+    print(f"[PASS] 재구축 후 BM25/벡터 스토어 재로드: {old_version} → {retriever.current_version()}")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")
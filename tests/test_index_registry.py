@@ -0,0 +1,71 @@
+"""
+Test versioned index directory layout (CURRENT pointer, READY marker, pruning)
+"""
+import shutil
+import sys
+import tempfile
+import time
+sys.path.append('.')
+
+from pathlib import Path
+
+from src.rag.index_registry import (
+    is_valid_version, list_versions, mark_ready, new_version_name, prune_versions,
+    read_current, resolve_index_dir, set_current, version_dir
+)
+
+print("=" * 60)
+print("인덱스 버전 관리 테스트")
+print("=" * 60)
+
+root = tempfile.mkdtemp()
+try:
+    # 1. CURRENT가 없으면 기존 디렉토리 사용
+    assert resolve_index_dir(root, legacy_dir="./data/vectordb") == (None, "./data/vectordb")
+    print("[PASS] 기존 디렉토리 fallback")
+
+    # 2. 버전 이름은 생성 순서대로 정렬, 경로 이동 이름은 거부
+    versions = []
+    for _ in range(4):
+        versions.append(new_version_name())
+        time.sleep(0.002)
+    assert versions == sorted(versions)
+    assert not is_valid_version("../etc") and not is_valid_version("..") and not is_valid_version("a/b")
+    try:
+        version_dir(root, "../etc")
+        raise AssertionError("잘못된 버전 이름 허용")
+    except ValueError:
+        pass
+    print(f"[PASS] 버전 이름: {versions[0]}")
+
+    # 3. READY가 없는 버전(구축 중)은 목록에서 제외, CURRENT로 지정 불가
+    for version in versions:
+        Path(version_dir(root, version)).mkdir()
+    for version in versions[:3]:
+        mark_ready(version_dir(root, version))
+    assert list_versions(root) == versions[:3]
+    try:
+        set_current(root, versions[3])
+        raise AssertionError("구축 중인 버전을 CURRENT로 지정")
+    except ValueError:
+        pass
+    print("[PASS] 구축 중인 버전 제외")
+
+    # 4. CURRENT 지정 후 해당 버전 디렉토리 사용
+    set_current(root, versions[0])
+    assert read_current(root) == versions[0]
+    assert resolve_index_dir(root) == (versions[0], version_dir(root, versions[0]))
+    print("[PASS] CURRENT 지정")
+
+    # 5. 정리: 최신 1개 유지 + 활성(versions[0]) 및 보호(versions[1]) 버전 유지, 구축 중인 디렉토리는 유지
+    removed = prune_versions(root, keep=1, protect=[versions[1]])
+    assert removed == []
+    removed = prune_versions(root, keep=1)
+    assert removed == [versions[1]], removed
+    assert list_versions(root) == [versions[0], versions[2]]
+    assert Path(version_dir(root, versions[3])).exists()
+    print(f"[PASS] 오래된 버전 정리: {removed}")
+finally:
+    shutil.rmtree(root, ignore_errors=True)
+
+print("\n모든 테스트 통과")
@@ -0,0 +1,84 @@
+"""
+Test LLM scheduler slot limit, priority queue and admission control
+"""
+import asyncio
+import sys
+sys.path.append('.')
+
+from src.model.scheduler import LLMScheduler, SchedulerRejected
+
+print("=" * 60)
+print("LLM 스케줄러 테스트")
+print("=" * 60)
+
+
+async def main():
+    scheduler = LLMScheduler(slots=2, max_queue=3, queue_timeout=1.0)
+    order = []
+    running = 0
+    max_running = 0
+
+    async def job(name, priority=False, duration=0.1):
+        nonlocal running, max_running
+        async with await scheduler.acquire(priority=priority):
+            running += 1
+            max_running = max(max_running, running)
+            order.append(name)
+            await asyncio.sleep(duration)
+            running -= 1
+
+    # 1. 슬롯 2개가 찬 뒤 일반 요청 2개, 우선 요청 1개 대기 → 우선 요청이 먼저 처리
+    tasks = [asyncio.create_task(job(f"busy{i}", duration=0.2)) for i in range(2)]
+    await asyncio.sleep(0.01)
+    tasks += [asyncio.create_task(job(f"normal{i}")) for i in range(2)]
+    await asyncio.sleep(0.01)
+    tasks.append(asyncio.create_task(job("priority", priority=True)))
+    await asyncio.sleep(0.01)
+
+    # 2. 대기열(3개)이 가득 차면 즉시 거절
+    try:
+        await scheduler.acquire()
+        rejected = False
+    except SchedulerRejected as e:
+        rejected = True
+        print(f"\n[REJECT] {e} (Retry-After: {e.retry_after}s)")
+
+    await asyncio.gather(*tasks)
+    print(f"[ORDER] {order}")
+    print(f"[MAX RUNNING] {max_running}")
+    assert rejected
+    assert max_running == 2
+    assert order.index("priority") < order.index("normal0") < order.index("normal1")
+
+    # 3. 대기 시간 초과
+    hold = await scheduler.acquire()
+    hold2 = await scheduler.acquire()
+    try:
+        await scheduler.acquire()
+        timed_out = False
+    except SchedulerRejected as e:
+        timed_out = True
+        print(f"[TIMEOUT] {e}")
+    hold.release()
+    hold2.release()
+    hold2.release()  # 중복 반환은 무시
+    assert timed_out
+
+    # 4. 대기 중 취소된 요청은 대기열에서 제거
+    holds = [await scheduler.acquire() for _ in range(2)]
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert scheduler.queued == 0
+    for slot in holds:
+        slot.release()
+    assert scheduler.active == 0
+
+    stats = scheduler.stats()
+    print(f"[STATS] {stats}")
+    assert stats["rejected"] == 1 and stats["timed_out"] == 1
+
+
+asyncio.run(main())
+print("\n[OK] 모든 테스트 통과")
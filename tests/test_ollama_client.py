@@ -0,0 +1,65 @@
+"""
+Test Ollama client connection pooling against the fake Ollama server
+연결 재사용, 동시 요청 제한, 스트리밍, 타임아웃 동작 확인 (실제 모델 불필요)
+"""
+import asyncio
+import sys
+import time
+sys.path.append('.')
+
+from src.model.ollama_client import OllamaClient, AsyncOllamaClient
+from tests.fake_ollama import FakeOllamaServer
+
+fake = FakeOllamaServer(tokens_per_sec=200.0, ttft=0.05).start()
+
+print("=" * 60)
+print("Ollama 클라이언트 연결 풀 테스트")
+print("=" * 60)
+
+# 1. 동기 클라이언트: 순차 요청 시 연결 1개 재사용
+client = OllamaClient(base_url=fake.url, model=fake.model)
+for _ in range(5):
+    client.generate("안녕", max_tokens=5)
+stream_text = "".join(client.generate_stream("안녕", max_tokens=5))
+client.close()
+print(f"\n[SYNC] 요청 {fake.counters['requests']}건, 연결 {fake.counters['connections']}개")
+print(f"[SYNC] 스트리밍 응답: {stream_text}")
+assert fake.counters["connections"] == 1
+assert stream_text == "".join(fake.tokens(5))
+
+
+async def async_checks():
+    # 2. 비동기 클라이언트: 동시 요청 수 제한
+    before = dict(fake.counters)
+    fake.counters["max_active"] = 0
+    async_client = AsyncOllamaClient(base_url=fake.url, model=fake.model, max_concurrency=2)
+    results = await asyncio.gather(*(
+        async_client.generate("안녕", max_tokens=5) for _ in range(8)
+    ))
+    chunks = [chunk async for chunk in async_client.generate_stream("안녕", max_tokens=5)]
+    await async_client.aclose()
+
+    print(f"\n[ASYNC] 요청 {fake.counters['requests'] - before['requests']}건, "
+          f"연결 {fake.counters['connections'] - before['connections']}개, "
+          f"최대 동시 처리 {fake.counters['max_active']}")
+    print(f"[ASYNC] 스트리밍 청크: {chunks}")
+    assert all(not r.startswith("[ERROR]") for r in results)
+    assert fake.counters["max_active"] <= 2
+    assert fake.counters["connections"] - before["connections"] <= 2
+    assert "".join(chunks) == "".join(fake.tokens(5))
+
+    # 3. 읽기 타임아웃은 예외 대신 [ERROR] 응답
+    fake.ttft = 1.0
+    slow_client = AsyncOllamaClient(base_url=fake.url, model=fake.model, read_timeout=0.2)
+    start = time.perf_counter()
+    result = await slow_client.generate("안녕", max_tokens=5)
+    await slow_client.aclose()
+    fake.ttft = 0.05
+    print(f"\n[TIMEOUT] {time.perf_counter() - start:.2f}s: {result}")
+    assert result.startswith("[ERROR]")
+
+
+asyncio.run(async_checks())
+fake.stop()
+
+print("\n[OK] 모든 테스트 통과")
@@ -0,0 +1,108 @@
+"""
+Test BM25 tokenizers (whitespace, ngram, korean) and the tokenized corpus cache
+"""
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('.')
+
+from src.rag.tokenizer import (
+    CharNgramTokenizer, KoreanTokenizer, WhitespaceTokenizer, corpus_cache_key, get_tokenizer, tokenize_corpus
+)
+
+print("=" * 60)
+print("토크나이저 테스트")
+print("=" * 60)
+
+# 1. 공백 토크나이저 (기존 방식: 원문 그대로 공백 분리)
+assert WhitespaceTokenizer().tokenize("고양이 사료를  추천해줘!") == ["고양이", "사료를", "추천해줘!"]
+print("[PASS] whitespace")
+
+# 2. 문자 n-gram (한글 단어만 분해, 부스 번호/영문은 그대로, 문장부호 제거)
+ngram = CharNgramTokenizer(n=2)
+assert ngram.tokenize("고양이 사료를 1-G12 Cat!") == ["고양", "양이", "사료", "료를", "1-g12", "cat"]
+assert CharNgramTokenizer(n=3).tokenize("캣타워") == ["캣타워"]
+assert ngram.signature == "ngram:v1:n=2"
+try:
+    CharNgramTokenizer(n=0)
+    raise AssertionError("n=0이 허용됨")
+except ValueError:
+    pass
+print("[PASS] ngram")
+
+# 3. 한국어 조사/어미 제거
+korean = KoreanTokenizer()
+assert korean.tokenize("건강백서캣은 고양이 사료를 추천해줘") == ["건강백서캣", "고양이", "사료", "추천"]
+assert korean.tokenize("1-G12 부스는 어디에서 하나요?") == ["1-g12", "부스", "어디", "하"]
+assert korean.tokenize("반려동물과 집사가 함께하는 캣페스타에서는") == ["반려동물", "집사", "함께", "캣페스타"]
+# 어간이 한 글자만 남으면 한 글자 조사를 제거하지 않음
+assert korean.tokenize("차가 이가 모래") == ["차가", "이가", "모래"]
+print("[PASS] korean 조사/어미 제거")
+
+# 4. 끝음절이 한 글자 조사와 같은 명사는 보호 (조사가 붙으면 조사만 제거)
+assert korean.tokenize("전문가") == ["전문가"]
+assert korean.tokenize("고양이 건강 전문가가 추천하는") == ["고양이", "건강", "전문가", "추천"]
+assert korean.tokenize("고양이과 동물, 고양이과에 속한다") == ["고양이과", "동물", "고양이과", "속"]
+assert korean.tokenize("아카나 사료, 아카나는 캐나다 브랜드") == ["아카나", "사료", "아카나", "캐나다", "브랜드"]
+assert korean.tokenize("적정온도 애호가") == ["적정온도", "애호가"]
+assert korean.signature == "korean:v2:min_stem=2"
+print("[PASS] korean 명사 보호 (전문가, 고양이과, 아카나)")
+
+assert isinstance(get_tokenizer("ngram", n=3), CharNgramTokenizer)
+try:
+    get_tokenizer("mecab")
+    raise AssertionError("없는 토크나이저가 허용됨")
+except ValueError:
+    pass
+print("[PASS] get_tokenizer")
+
+# 5. 토큰 캐시: 저장 후 재사용, 문서/토크나이저 설정이 바뀌면 다시 토큰화
+documents = ["건강백서캣은 고양이 건강 전문가 브랜드입니다.", "고양이 사료를 추천해줘"]
+
+
+class CountingTokenizer(KoreanTokenizer):
+    """tokenize 호출 수를 세는 토크나이저"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def tokenize(self, text):
+        self.calls += 1
+        return super().tokenize(text)
+
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    cache_file = Path(tmp_dir) / "bm25_tokens_korean.json"
+    tokenizer = CountingTokenizer()
+    tokens = tokenize_corpus(documents, tokenizer, cache_dir=tmp_dir)
+    assert tokens == korean.tokenize_batch(documents) and tokenizer.calls == 2
+    cached = json.loads(cache_file.read_text(encoding='utf-8'))
+    assert cached["key"] == corpus_cache_key(documents, tokenizer) and cached["tokenizer"] == "korean:v2:min_stem=2"
+
+    # 같은 문서 → 캐시 사용 (토큰화하지 않음)
+    tokenizer = CountingTokenizer()
+    assert tokenize_corpus(documents, tokenizer, cache_dir=tmp_dir) == tokens and tokenizer.calls == 0
+
+    # 문서가 바뀌면 다시 토큰화
+    changed = documents + ["캣타워는 B홀에서 판매합니다."]
+    assert tokenize_corpus(changed, tokenizer, cache_dir=tmp_dir) == korean.tokenize_batch(changed)
+    assert tokenizer.calls == 3
+
+    # 토크나이저 설정이 바뀌면 캐시 키가 달라짐
+    assert corpus_cache_key(documents, KoreanTokenizer()) != corpus_cache_key(documents, KoreanTokenizer(min_stem_length=1))
+
+    # 손상된 캐시 파일은 무시하고 다시 저장
+    cache_file.write_text("{broken", encoding='utf-8')
+    tokenizer = CountingTokenizer()
+    assert tokenize_corpus(documents, tokenizer, cache_dir=tmp_dir) == tokens and tokenizer.calls == 2
+    assert json.loads(cache_file.read_text(encoding='utf-8'))["tokens"] == tokens
+    assert not list(Path(tmp_dir).glob("*.tmp"))
+    print("[PASS] 토큰 캐시 저장/재사용/무효화")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")
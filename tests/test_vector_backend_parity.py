@@ -0,0 +1,60 @@
+"""
+Test that ChromaDB and NumPy vector stores return the same ranking and cosine distances
+"""
+import shutil
+import sys
+import tempfile
+sys.path.append('.')
+
+import numpy as np
+
+from src.rag.numpy_vector_store import NumpyVectorStore
+from src.rag.vector_store import DISTANCE_SPACE, VectorStore
+
+print("=" * 60)
+print("벡터 스토어 백엔드 일치 테스트 (ChromaDB / NumPy)")
+print("=" * 60)
+
+rng = np.random.default_rng(0)
+# Ko-SBERT 임베딩처럼 정규화되지 않은(노름이 제각각인) 벡터
+embeddings = rng.standard_normal((20, 16)).astype(np.float32) * rng.uniform(0.5, 20.0, (20, 1)).astype(np.float32)
+documents = [f"문서 {i}" for i in range(20)]
+metadatas = [{"source": "gdpp_faq" if i % 2 else "gdpp_brand"} for i in range(20)]
+ids = [f"chunk_{i:02d}" for i in range(20)]
+queries = rng.standard_normal((3, 16)).astype(np.float32) * 7.0
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    chroma = VectorStore(persist_directory=tmp_dir, collection_name="parity")
+    numpy_store = NumpyVectorStore(persist_directory=tmp_dir, collection_name="parity")
+    assert chroma.distance_space == DISTANCE_SPACE
+    chroma.upsert_documents(documents, embeddings, metadatas, ids)
+    numpy_store.upsert_documents(documents, embeddings, metadatas, ids)
+    print(f"[PASS] 컬렉션 거리 함수: {chroma.distance_space}")
+
+    # 1. 같은 순위와 거리 (거리 = 1 - 코사인 유사도)
+    for query in queries:
+        chroma_results = chroma.similarity_search(query, k=5)
+        numpy_results = numpy_store.similarity_search(query, k=5)
+        assert [r["id"] for r in chroma_results] == [r["id"] for r in numpy_results]
+        for a, b in zip(chroma_results, numpy_results):
+            assert abs(a["distance"] - b["distance"]) < 1e-4, (a["distance"], b["distance"])
+    print("[PASS] 단일 쿼리 순위/거리 일치")
+
+    # 2. 배치 + 필터
+    chroma_batch = chroma.similarity_search_batch(queries, k=3, filter_dict={"source": "gdpp_faq"})
+    numpy_batch = numpy_store.similarity_search_batch(queries, k=3, filter_dict={"source": "gdpp_faq"})
+    for a, b in zip(chroma_batch, numpy_batch):
+        assert [r["id"] for r in a] == [r["id"] for r in b]
+        assert np.allclose([r["distance"] for r in a], [r["distance"] for r in b], atol=1e-4)
+    print("[PASS] 배치/필터 검색 일치")
+
+    # 3. 코사인 거리 범위 (자기 자신은 0)
+    top = numpy_store.similarity_search(embeddings[4], k=1)[0]
+    assert top["id"] == "chunk_04" and abs(top["distance"]) < 1e-4
+    assert chroma.similarity_search(embeddings[4], k=1)[0]["id"] == "chunk_04"
+    print("[PASS] 자기 자신 거리 0")
+finally:
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+print("\n모든 테스트 통과")